@@ -0,0 +1,283 @@
+"""Benchmarks for the simulator's hot paths.
+
+Runs each benchmark headlessly at several catalog sizes with fixed seeds,
+writes the timings as JSON and optionally compares them to a stored
+baseline, exiting non-zero when a benchmark slows down past the threshold.
+
+    python benchmark.py --sizes 1000 100000 --output bench.json
+    python benchmark.py --baseline bench.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+
+from dealership import (Customer, DealershipGame, EconomyCar, Inventory, LuxuryCar, SaveJournal, SportsCar,
+                        console, headless, negotiate_prices)
+from dealership import auction
+
+SEED = 1234
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+CAR_CLASSES = (LuxuryCar, SportsCar, EconomyCar)
+
+
+class PassingPrompt:
+    """Stands in for Rich's Prompt so interactive code paths take their default answer."""
+    @staticmethod
+    def ask(*args, default=None, **kwargs):
+        return default
+
+
+@contextmanager
+def scripted_prompts():
+    previous = auction.Prompt
+    auction.Prompt = PassingPrompt
+    try:
+        yield
+    finally:
+        auction.Prompt = previous
+
+
+def make_car(rng, index):
+    cls = rng.choice(CAR_CLASSES)
+    return cls(f"Car {index}", rng.randint(10_000, 500_000), rng.randint(0, 150_000),
+               rng.choice(["New", "Used"]), rng.randint(0, 15))
+
+
+def make_game(size, fleet=False, owned=0, history_years=0):
+    """A game with size extra cars in the catalog, owned cars in the garage
+    and history_years of income/expense entries, all from fixed seeds."""
+    random.seed(SEED)
+    rng = random.Random(SEED)
+    game = DealershipGame()
+    categories = dict(zip(CAR_CLASSES, (game.luxury_cars, game.sports_cars, game.economy_cars)))
+    for index in range(size):
+        car = make_car(rng, index)
+        categories[type(car)][car.name] = car
+    game.catalog.invalidate()
+    for index in range(owned):
+        car = make_car(rng, f"owned {index}")
+        car.sold = True
+        for year in range(min(history_years, 5)):
+            car.maintain(game.current_year - year)
+        game.owned[car.name] = car
+    entries_per_year = max(1, min(size, 100_000) // max(1, history_years))
+    for year in range(game.current_year - history_years, game.current_year + 1):
+        for index in range(entries_per_year):
+            game.income_history.append({"type": "sale", "amount": rng.randint(10_000, 500_000), "car": f"Car {index}", "year": year})
+            game.expense_history.append({"type": "purchase", "amount": rng.randint(10_000, 500_000), "car": f"Car {index}", "year": year})
+    if fleet:
+        game.use_fleet()
+    return game
+
+
+# Each benchmark takes a size and returns (setup, run, ops): setup builds fresh
+# state for one repetition (untimed), run(state) is the timed call.
+
+def bench_yearly_update(size):
+    return (lambda: make_game(size)), (lambda game: game.advance_year()), size
+
+
+def bench_yearly_update_fleet(size):
+    return (lambda: make_game(size, fleet=True)), (lambda game: game.advance_year()), size
+
+
+def bench_random_event(size):
+    return (lambda: make_game(size)), (lambda game: game.random_event()), size
+
+
+def bench_calculate_profit(size):
+    return (lambda: make_game(size, history_years=50)), (lambda game: game.calculate_profit(0)), size
+
+
+def bench_save_load(size):
+    owned = max(10, size // 100)
+    # One directory for every repeat, removed once run_benchmark drops setup and run
+    directory = tempfile.TemporaryDirectory(prefix="dealership-bench-")
+
+    def setup():
+        game = make_game(0, owned=owned, history_years=10)
+        path = os.path.join(directory.name, "save.db")
+        if os.path.exists(path):
+            os.remove(path)
+        game.save_journals["bench"] = SaveJournal(path)
+        return game
+
+    def run(game):
+        game.save_to_slot("bench")
+        game.load_from_slot("bench")
+        game.save_journals.pop("bench").close()
+
+    return setup, run, owned
+
+
+def bench_fork(size):
+    return (lambda: make_game(size, fleet=True, owned=max(10, size // 100), history_years=10)), \
+        (lambda game: game.fork()), size
+
+
+def bench_conduct_auction(size):
+    lots = max(10, size // 100)
+
+    def setup():
+        game = make_game(0)
+        rng = random.Random(SEED)
+        for competitor in game.ai_competitors:
+            competitor.money = 10 ** 12
+        game.auction_house.auctions = [
+            {"car": car, "highest_bid": car.price * 0.6, "highest_bidder": None}
+            for car in (make_car(rng, index) for index in range(lots))]
+        return game
+
+    def run(game):
+        with scripted_prompts():
+            game.auction_house.conduct_auction()
+
+    return setup, run, lots
+
+
+def bench_move_car(size):
+    moves = min(size, 100_000)
+
+    def setup():
+        rng = random.Random(SEED)
+        inventory = Inventory()
+        for index in range(size):
+            inventory.add_car("Showroom", make_car(rng, index))
+        return inventory
+
+    def run(inventory):
+        for index in range(moves):
+            inventory.move_car("Showroom", "Warehouse", f"Car {index}")
+
+    return setup, run, moves
+
+
+def bench_negotiate_price(size):
+    calls = min(size, 100_000)
+
+    def setup():
+        rng = random.Random(SEED)
+        trade_in = make_car(rng, "trade-in")
+        return [Customer(f"Customer {index}", 1_000_000, "Luxury", rng.randint(1, 20),
+                         trade_in_car=trade_in if index % 4 == 0 else None) for index in range(100)], \
+            [rng.randint(10_000, 500_000) for _ in range(calls)]
+
+    def run(state):
+        customers, prices = state
+        for index, price in enumerate(prices):
+            customers[index % 100].negotiate_price(price)
+
+    return setup, run, calls
+
+
+def bench_negotiate_prices(size):
+    def setup():
+        rng = np.random.default_rng(SEED)
+        return (rng.integers(10_000, 500_000, size).astype(np.float64), rng.integers(1, 21, size),
+                np.where(rng.random(size) < 0.25, 20_000.0, 0.0), rng)
+
+    return setup, (lambda state: negotiate_prices(*state)), size
+
+
+BENCHMARKS = {
+    "yearly_update": bench_yearly_update,
+    "yearly_update_fleet": bench_yearly_update_fleet,
+    "random_event": bench_random_event,
+    "calculate_profit": bench_calculate_profit,
+    "save_load": bench_save_load,
+    "fork": bench_fork,
+    "conduct_auction": bench_conduct_auction,
+    "move_car": bench_move_car,
+    "negotiate_price": bench_negotiate_price,
+    "negotiate_prices": bench_negotiate_prices,
+}
+
+
+def run_benchmark(name, size, repeat):
+    setup, run, ops = BENCHMARKS[name](size)
+    timings = []
+    for _ in range(repeat):
+        with headless():
+            state = setup()
+            start = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - start)
+        del state
+    best = min(timings)
+    return {"benchmark": name, "size": size, "ops": ops, "repeat": repeat, "best": best,
+            "mean": sum(timings) / len(timings), "per_op": best / max(1, ops)}
+
+
+def run_suite(names, sizes, repeat, on_result=None):
+    results = {}
+    for size in sizes:
+        for name in names:
+            result = run_benchmark(name, size, repeat)
+            results[f"{name}@{size}"] = result
+            if on_result:
+                on_result(result)
+    return {"meta": {"created": datetime.now().isoformat(timespec="seconds"), "seed": SEED,
+                     "python": platform.python_version(), "numpy": np.__version__,
+                     "machine": platform.machine(), "sizes": list(sizes), "repeat": repeat},
+            "results": results}
+
+
+def compare(current, baseline, threshold, noise_floor=0.001):
+    """Returns (key, baseline best, current best, ratio, regressed) for every
+    benchmark present in both runs. Slowdowns smaller than noise_floor seconds
+    never count as regressions."""
+    rows = []
+    for key, result in current["results"].items():
+        previous = baseline["results"].get(key)
+        if previous:
+            ratio = result["best"] / previous["best"] if previous["best"] else float("inf")
+            regressed = ratio > 1 + threshold and result["best"] - previous["best"] > noise_floor
+            rows.append((key, previous["best"], result["best"], ratio, regressed))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dealership simulator's hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="catalog sizes to run at")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per benchmark; the best time is kept")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before a benchmark counts as a regression")
+    parser.add_argument("--noise-floor", type=float, default=0.001, help="slowdowns below this many seconds are ignored")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.only, args.sizes, args.repeat, on_result=lambda result: console.print(
+        f"[cyan]{result['benchmark']:>20} @ {result['size']:>9,}: [yellow]{result['best'] * 1000:10.2f} ms "
+        f"[white]({result['per_op'] * 1e6:.3f} µs/op)"))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        console.print(f"[green]Results written to {args.output}.")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.threshold, args.noise_floor)
+        for key, previous, best, ratio, regressed in rows:
+            style = "red" if regressed else "green"
+            console.print(f"[{style}]{key:>32}: {previous * 1000:10.2f} ms -> {best * 1000:10.2f} ms ({ratio:.2f}x)")
+        regressions = [row for row in rows if row[4]]
+        if regressions:
+            console.print(f"[red]{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.")
+            return 1
+        console.print("[green]No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
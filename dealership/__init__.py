@@ -0,0 +1,28 @@
+"""Car dealership simulator.
+
+The package imports only the domain model (cars, inventory, customers,
+finance, market, auctions and the yearly simulation); numpy is loaded on
+first use and Rich/colorama only by the interactive menus in
+dealership.ui."""
+from .actionlog import ActionRecorder, read_action_log
+from .auction import AuctionHouse, ask_bid, max_price_bidding
+from .business import Employee, LeaseContract, MarketingCampaign, ServiceDepartment, TrainingProgram
+from .cars import CONDITIONS, SEGMENTS, Car, EconomyCar, LuxuryCar, SportsCar
+from .catalog import CarCatalog
+from .chain import DEALERSHIP_LOCATIONS, STOCK_MODELS, Dealership, DealershipChain, Shard
+from .competitors import AICompetitor, CompetitorScheduler
+from .customers import Customer, CustomerStream, negotiate_prices, process_demand
+from .display import (ConsoleProxy, NullConsole, console, format_price, headless, instant_mode, loading_animation,
+                      set_instant_mode, today, typing_effect)
+from .events import RANDOM_EVENTS, SEGMENT_EVENTS, EventEngine
+from .finance import FinancialManager, Ledger, LoanBook, TransactionLedger
+from .fleet import Fleet, FleetCarView, event_effects, randint_block, random_block, round_cents
+from .game import MARKETING_CAMPAIGNS, TRAINING_PROGRAMS, DealershipGame
+from .history import PriceHistory
+from .inventory import Inventory
+from .market import Market, SegmentTrends
+from .montecarlo import MONTE_CARLO_METRICS, run_monte_carlo, run_trajectories
+from .optimizer import POLICY_SPACE, Policy, evaluate_policies, net_worth, optimize_policies, sample_policies
+from .profiling import Profiler, profiler
+from .replay import Replay, replay
+from .saves import SaveJournal
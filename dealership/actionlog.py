@@ -0,0 +1,106 @@
+import struct
+
+# Binary Action Log
+# A log is a header (magic, version, RNG seed) followed by one record per
+# player action: a one-byte opcode and the action's arguments. Numbers keep
+# their int/float type, strings are length-prefixed UTF-8.
+MAGIC = b"DLOG"
+VERSION = 1
+HEADER = struct.Struct("<4sBQ")
+OPCODE = struct.Struct("<B")
+LENGTH = struct.Struct("<H")
+INT = struct.Struct("<q")
+FLOAT = struct.Struct("<d")
+
+# Action name -> (opcode, argument types): n = number, s = string, S = list
+# of strings. Names are the DealershipGame methods replay.Replay calls.
+ACTIONS = {
+    "purchase": (1, "ns"),  # Segment code, car name
+    "sell": (2, "s"),
+    "add_own_car": (3, "snnsn"),
+    "upgrade": (4, "ss"),
+    "auction": (5, "sS"),  # Car name, the player's answer for every lot
+    "take_loan": (6, "nnn"),
+    "invest": (7, "ssn"),
+    "pay_taxes": (8, ""),
+    "train_employee": (9, "nn"),
+    "launch_campaign": (10, "n"),
+    "service_car": (11, "ns"),
+    "advance_year": (12, ""),
+}
+ACTION_NAMES = {opcode: name for name, (opcode, _) in ACTIONS.items()}
+
+def _pack_string(value):
+    data = value.encode("utf-8")
+    return LENGTH.pack(len(data)) + data
+
+def encode_action(action, args):
+    opcode, fields = ACTIONS[action]
+    parts = [OPCODE.pack(opcode)]
+    for field, value in zip(fields, args):
+        if field == "n":
+            parts.append(b"i" + INT.pack(value) if isinstance(value, int) else b"f" + FLOAT.pack(value))
+        elif field == "s":
+            parts.append(_pack_string(value))
+        else:
+            parts.append(LENGTH.pack(len(value)))
+            parts.extend(_pack_string(item) for item in value)
+    return b"".join(parts)
+
+def _unpack_string(data, offset):
+    length, = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    return data[offset:offset + length].decode("utf-8"), offset + length
+
+def decode_actions(data, offset=HEADER.size):
+    """Yields (action, args) for every record in data after the header."""
+    while offset < len(data):
+        opcode, = OPCODE.unpack_from(data, offset)
+        offset += OPCODE.size
+        action = ACTION_NAMES[opcode]
+        args = []
+        for field in ACTIONS[action][1]:
+            if field == "n":
+                number = INT if data[offset:offset + 1] == b"i" else FLOAT
+                args.append(number.unpack_from(data, offset + 1)[0])
+                offset += 1 + number.size
+            elif field == "s":
+                value, offset = _unpack_string(data, offset)
+                args.append(value)
+            else:
+                count, = LENGTH.unpack_from(data, offset)
+                offset += LENGTH.size
+                values = []
+                for _ in range(count):
+                    value, offset = _unpack_string(data, offset)
+                    values.append(value)
+                args.append(values)
+        yield action, tuple(args)
+
+def read_action_log(path):
+    """Returns (seed, [(action, args), ...]) from a log written by ActionRecorder."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} action log.")
+    return seed, list(decode_actions(data))
+
+class ActionRecorder:
+    """Appends player actions to a log file as they happen. Each record is
+    flushed straight away, so the log survives a crash mid-session."""
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.count = 0
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+        self.file.flush()
+
+    def write(self, action, *args):
+        self.file.write(encode_action(action, args))
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        self.file.close()
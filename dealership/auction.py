@@ -0,0 +1,143 @@
+import heapq
+import random
+from .display import console, format_price
+from .lazy import Prompt
+
+def ask_bid(car, current_bid):
+    return Prompt.ask(f"Do you want to bid on {car.name}? Current bid is {format_price(current_bid)}. Enter your bid or type 'pass'.", default='pass')
+
+# Auction House for Buying and Selling Cars
+class AuctionHouse:
+    def __init__(self, game):
+        self.game = game
+        self.auctions = []
+
+    def list_car(self, car):
+        starting_bid = car.price * 0.6
+        self.auctions.append({"car": car, "highest_bid": starting_bid, "highest_bidder": None})
+        console.print(f"[cyan]{car.name} has been listed in the auction house with a starting bid of {format_price(starting_bid)}.")
+
+    def conduct_auction(self, player_bid=ask_bid):
+        # player_bid(car, current_bid) returns the player's answer for a lot
+        for auction in self.auctions:
+            car = auction["car"]
+            current_bid = auction["highest_bid"]
+            participants = self.game.ai_competitors + [self.game]
+            for participant in participants:
+                if participant == self.game:
+                    bid_input = player_bid(car, current_bid)
+                    if bid_input.lower() != 'pass':
+                        try:
+                            bid = float(bid_input)
+                            if bid > current_bid and bid <= self.game.money:
+                                auction["highest_bid"] = bid
+                                auction["highest_bidder"] = self.game
+                        except ValueError:
+                            console.print("[red]Invalid bid amount.")
+                else:
+                    bid = current_bid + random.randint(1000, 10000)
+                    if bid <= participant.money and bid > auction["highest_bid"]:
+                        auction["highest_bid"] = bid
+                        auction["highest_bidder"] = participant
+                        console.print(f"[magenta]{participant.name} bids {format_price(bid)} for {car.name}.")
+            if auction["highest_bidder"]:
+                auction["highest_bidder"].money -= auction["highest_bid"]
+                if auction["highest_bidder"] == self.game:
+                    self.game.owned[car.name] = car
+                    console.print(f"[green]You win the auction for {car.name} with a bid of {format_price(auction['highest_bid'])}.")
+                else:
+                    auction["highest_bidder"].owned_cars[car.name] = car
+                    console.print(f"[magenta]{auction['highest_bidder'].name} wins the auction for {car.name} with a bid of {format_price(auction['highest_bid'])}.")
+                car.sold = True
+            else:
+                console.print(f"[red]No bids were placed for {car.name}.")
+        self.auctions.clear()
+
+    def list_cars(self, cars):
+        for car in cars:
+            self.list_car(car)
+
+    def run_auctions(self, player_policy=None, rounds=10, bids_per_round=20, increment=(1000, 10000)):
+        """Runs every listed lot as one concurrent, multi-round auction with
+        no prompts. Each round every AI bidder bids on up to bids_per_round
+        open lots and the player bids wherever player_policy(car, current_bid,
+        game) returns an amount. Bids go through a priority queue, highest
+        first, and a bid is only accepted if the bidder's unreserved money
+        covers it; leading bids stay reserved until settlement. A lot with a
+        leader closes after a round without new bids. Returns {car name:
+        (winner, price)}."""
+        lots = self.auctions
+        bidders = list(self.game.ai_competitors) + ([self.game] if player_policy else [])
+        reserved = {id(bidder): 0 for bidder in bidders}
+        open_lots = list(range(len(lots)))
+        seq = 0
+        for _ in range(rounds):
+            if not open_lots:
+                break
+            bids = []
+            for bidder in bidders:
+                if bidder is self.game:
+                    candidates = open_lots
+                else:
+                    candidates = random.sample(open_lots, min(bids_per_round, len(open_lots)))
+                for index in candidates:
+                    lot = lots[index]
+                    if lot["highest_bidder"] is bidder:
+                        continue
+                    if bidder is self.game:
+                        bid = player_policy(lot["car"], lot["highest_bid"], self.game)
+                        if bid is None:
+                            continue
+                    else:
+                        bid = lot["highest_bid"] + random.randint(*increment)
+                    seq += 1
+                    bids.append((-bid, seq, index, bidder))
+            heapq.heapify(bids)
+
+            active = set()
+            while bids:
+                bid, _, index, bidder = heapq.heappop(bids)
+                bid, lot = -bid, lots[index]
+                if bid <= lot["highest_bid"] or bid > bidder.money - reserved[id(bidder)]:
+                    continue
+                if lot["highest_bidder"] is not None:
+                    reserved[id(lot["highest_bidder"])] -= lot["highest_bid"]
+                reserved[id(bidder)] += bid
+                lot["highest_bid"], lot["highest_bidder"] = bid, bidder
+                active.add(index)
+            open_lots = [index for index in open_lots if index in active or lots[index]["highest_bidder"] is None]
+
+        return self.settle_auctions()
+
+    def settle_auctions(self):
+        # Charges each winner once for all of their lots, then hands the cars over
+        results, totals = {}, {}
+        for lot in self.auctions:
+            car, winner = lot["car"], lot["highest_bidder"]
+            if winner is None:
+                continue
+            results[car.name] = (winner, lot["highest_bid"])
+            won = totals.setdefault(id(winner), [winner, 0, []])
+            won[1] += lot["highest_bid"]
+            won[2].append(car)
+        for winner, total, cars in totals.values():
+            winner.money -= total
+            holdings = self.game.owned if winner is self.game else winner.owned_cars
+            for car in cars:
+                holdings[car.name] = car
+                car.sold = True
+            name = "You" if winner is self.game else winner.name
+            console.print(f"[magenta]{name} won {len(cars)} lot(s) for a total of {format_price(total)}.")
+        unsold = len(self.auctions) - len(results)
+        if unsold:
+            console.print(f"[red]No bids were placed for {unsold} lot(s).")
+        self.auctions.clear()
+        return results
+
+def max_price_bidding(fraction=0.8, increment=1000):
+    """Player bidding policy for AuctionHouse.run_auctions(): outbid by a
+    fixed increment while staying under a fraction of the car's value."""
+    def policy(car, current_bid, game):
+        bid = current_bid + increment
+        return bid if bid <= car.price * fraction else None
+    return policy
@@ -0,0 +1,85 @@
+import random
+from .display import console, format_price
+from .lazy import LazyImport
+datetime = LazyImport("datetime", "datetime")
+
+# Employee Class with Training Programs
+class Employee:
+    def __init__(self, name, role, skill_level, **kwargs):
+        self.name = name
+        self.role = role
+        self.skill_level = skill_level
+        self.morale = 5
+        self.__dict__.update(kwargs)
+
+    def improve_skill(self):
+        self.skill_level += 1
+        console.print(f"[green]{self.name}'s skill level has improved to {self.skill_level}!")
+
+    def affect_morale(self, change):
+        self.morale = max(1, min(10, self.morale + change))
+        morale_status = "happy" if self.morale > 7 else "neutral" if self.morale > 4 else "unhappy"
+        console.print(f"[yellow]{self.name} is now {morale_status} with morale level {self.morale}.")
+
+# Training Programs for Employees
+class TrainingProgram:
+    def __init__(self, name, cost, skill_boost, morale_boost):
+        self.name = name
+        self.cost = cost
+        self.skill_boost = skill_boost
+        self.morale_boost = morale_boost
+
+    def enroll_employee(self, employee, game):
+        if self.cost <= game.money:
+            game.money -= self.cost
+            employee.improve_skill()
+            employee.affect_morale(self.morale_boost)
+            console.print(f"[green]{employee.name} attended {self.name} training. Skill level increased by {self.skill_boost} and morale increased by {self.morale_boost}.")
+        else:
+            console.print(f"[red]Not enough money to enroll {employee.name} in {self.name}.")
+
+# Marketing Campaigns
+class MarketingCampaign:
+    def __init__(self, name, cost, effectiveness):
+        self.name = name
+        self.cost = cost
+        self.effectiveness = effectiveness
+
+    def apply_campaign(self, dealership):
+        if dealership.money >= self.cost:
+            dealership.money -= self.cost
+            dealership.reputation += self.effectiveness
+            console.print(f"[green]Marketing campaign {self.name} launched! Effectiveness: {self.effectiveness}")
+        else:
+            console.print("[red]Not enough money for this campaign.")
+
+# Service Department for Car Maintenance
+class ServiceDepartment:
+    def __init__(self):
+        self.revenue = 0
+
+    def service_car(self, car, customer):
+        service_cost = random.randint(1000, 5000)
+        if customer.budget >= service_cost:
+            customer.budget -= service_cost
+            car.maintain(datetime.now().year)
+            self.revenue += service_cost
+            console.print(f"[green]{customer.name} paid {format_price(service_cost)} for servicing {car.name}. Revenue added: {format_price(service_cost)}.")
+        else:
+            console.print(f"[red]{customer.name} cannot afford the service.")
+
+# Car Leasing System
+class LeaseContract:
+    def __init__(self, car, customer, lease_duration, monthly_payment):
+        self.car = car
+        self.customer = customer
+        self.lease_duration = lease_duration
+        self.monthly_payment = monthly_payment
+
+    def process_lease(self):
+        total_cost = self.lease_duration * self.monthly_payment
+        if total_cost <= self.customer.budget:
+            self.customer.budget -= total_cost
+            console.print(f"[green]{self.customer.name} leased {self.car.name} for {self.lease_duration} months at {format_price(self.monthly_payment)} per month. Total: {format_price(total_cost)}.")
+        else:
+            console.print(f"[red]{self.customer.name} couldn't afford the lease for {self.car.name}.")
@@ -0,0 +1,137 @@
+from .display import console, format_price
+
+# Base Car Class
+class Car:
+    # Fixed slots instead of a per-car __dict__. The histories are tuples,
+    # only allocated once something is written to them; being immutable,
+    # they can be shared between forks of a game.
+    __slots__ = ("name", "price", "base_price", "mileage", "condition", "age", "owners", "sold", "region",
+                 "_maintenance_history", "_customizations", "_fleet", "_row")
+    segment = None  # Market segment name, set by the subclasses
+
+    def __init__(self, name, price, mileage, condition, age, **kwargs):
+        self.name = name
+        self.price = price
+        self.base_price = kwargs.get("base_price", price)  # Original price for calculations
+        self.mileage = mileage
+        self.condition = condition
+        self.age = age
+        self.owners = kwargs.get("owners", 0)
+        self.sold = kwargs.get("sold", False)
+        self.region = kwargs.get("region")  # Market region; None for the market's first one
+        # Accept the history lists from saved game state
+        self._maintenance_history = tuple(kwargs.get("maintenance_history") or ()) or None
+        self._customizations = tuple(kwargs.get("customizations") or ()) or None
+
+    @property
+    def maintenance_history(self):
+        return self._maintenance_history or ()
+
+    @maintenance_history.setter
+    def maintenance_history(self, value):
+        self._maintenance_history = tuple(value) or None
+
+    @property
+    def customizations(self):
+        return self._customizations or ()
+
+    @customizations.setter
+    def customizations(self, value):
+        self._customizations = tuple(value) or None
+
+    def depreciate(self):
+        # Depreciation logic based on car condition and age
+        depreciation_rate = 0.05 + (0.02 * self.age)
+        if self.condition == "Used":
+            depreciation_rate += 0.05
+        self.price = max(500, self.price * (1 - depreciation_rate))
+        self.price = round(self.price, 2)
+
+    def maintain(self, year):
+        # Maintenance cost increases with age
+        maintenance_cost = (500 * self.age) if self.condition == "New" else (1000 * self.age)
+        self._maintenance_history = self.maintenance_history + ({"year": year, "cost": maintenance_cost},)
+        return maintenance_cost
+
+    def modify(self, upgrade_type):
+        upgrades = {"performance": 10000, "luxury": 5000, "efficiency": 2000}
+        if upgrade_type in upgrades:
+            self.price += upgrades[upgrade_type]
+            self._customizations = self.customizations + (upgrade_type,)
+            console.print(f"[green]{upgrade_type.capitalize()} upgrade applied to {self.name}. New value: {format_price(self.price)}")
+        else:
+            console.print("[red]Invalid upgrade type.")
+
+    def fork(self):
+        # Copy for DealershipGame.fork(), sharing the immutable histories
+        car = object.__new__(type(self))
+        car.name, car.price, car.base_price, car.mileage = self.name, self.price, self.base_price, self.mileage
+        car.condition, car.age, car.owners, car.sold, car.region = self.condition, self.age, self.owners, self.sold, self.region
+        car._maintenance_history, car._customizations = self._maintenance_history, self._customizations
+        return car
+
+    def list_customizations(self):
+        return ', '.join(self.customizations) if self.customizations else "None"
+
+    def to_dict(self):
+        # Plain data for the save file
+        return {
+            "name": self.name,
+            "price": self.price,
+            "base_price": self.base_price,
+            "mileage": self.mileage,
+            "condition": self.condition,
+            "age": self.age,
+            "owners": self.owners,
+            "maintenance_history": list(self.maintenance_history),
+            "customizations": list(self.customizations),
+            "sold": self.sold,
+            "region": self.region,
+            "segment": self.segment
+        }
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        # Rebuilds the segment's subclass; older saves without one get a plain Car
+        car_class = CAR_CLASSES.get(data.get("segment"), Car)
+        return car_class(**dict(data, **kwargs))
+
+    def display_info(self):
+        info = (
+            f"Name: {self.name}\n"
+            f"Price: {format_price(self.price)}\n"
+            f"Mileage: {self.mileage}k miles\n"
+            f"Condition: {self.condition}\n"
+            f"Age: {self.age} years\n"
+            f"Owners: {self.owners}\n"
+            f"Customizations: {self.list_customizations()}\n"
+        )
+        return info
+
+# Segment and condition codes used by the array-backed stores
+SEGMENTS = ("Luxury", "Sports", "Economy")
+CONDITIONS = ("New", "Used")
+
+# Subclasses for different car types
+class LuxuryCar(Car):
+    __slots__ = ()
+    segment = "Luxury"
+
+    def luxury_tax(self):
+        self.price += 5000
+
+class SportsCar(Car):
+    __slots__ = ()
+    segment = "Sports"
+
+    def boost_performance(self):
+        self.price += 10000
+
+class EconomyCar(Car):
+    __slots__ = ()
+    segment = "Economy"
+
+    def fuel_efficiency_bonus(self):
+        self.price += 2000
+
+CAR_CLASSES = {car_class.segment: car_class for car_class in (LuxuryCar, SportsCar, EconomyCar)}
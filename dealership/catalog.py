@@ -0,0 +1,94 @@
+import bisect
+from .lazy import np
+
+# Car Catalog Queries
+class CarCatalog:
+    """Sorted price, mileage and age indexes over the cars in the luxury,
+    sports and economy dicts, overall and per segment, for filtered, sorted
+    and paged listings. Sold cars are skipped when met and dropped at the
+    next rebuild; after a repricing the indexes are rebuilt on first use."""
+    SORT_KEYS = ("price", "mileage", "age")
+
+    def __init__(self, categories):
+        self.categories = categories  # Segment name -> {car name: car}
+        self.indexes = None  # (segment or None, sort key) -> (sorted values, cars)
+        self.filed = {}  # Sort key -> {car id: value the car is filed under}
+
+    def invalidate(self):
+        self.indexes = None
+
+    def rebuild(self):
+        groups = {segment: [car for car in category.values() if not car.sold]
+                  for segment, category in self.categories.items()}
+        everything = [car for cars in groups.values() for car in cars]
+        cars = np.empty(len(everything), dtype=object)
+        cars[:] = everything
+        bounds, start = {None: (0, len(everything))}, 0
+        for segment, members in groups.items():
+            bounds[segment] = (start, start + len(members))
+            start += len(members)
+
+        self.indexes, self.filed = {}, {}
+        ids = [id(car) for car in everything]
+        for key in self.SORT_KEYS:
+            values = np.array([getattr(car, key) for car in everything], dtype=np.float64)
+            self.filed[key] = dict(zip(ids, values.tolist()))
+            for segment, (first, last) in bounds.items():
+                # Stable sort, so equal values stay in insertion order
+                order = first + np.argsort(values[first:last], kind="stable")
+                self.indexes[(segment, key)] = (values[order].tolist(), cars[order].tolist())
+
+    def add(self, car):
+        if self.indexes is None or car.sold:
+            return
+        for key in self.SORT_KEYS:
+            value = self.filed[key][id(car)] = getattr(car, key)
+            for index in ((car.segment, key), (None, key)):
+                values, cars = self.indexes.setdefault(index, ([], []))
+                position = bisect.bisect_right(values, value)
+                values.insert(position, value)
+                cars.insert(position, car)
+
+    def discard(self, car):
+        if self.indexes is None or id(car) not in self.filed["price"]:
+            return
+        for key in self.SORT_KEYS:
+            value = self.filed[key].pop(id(car))
+            for index in ((car.segment, key), (None, key)):
+                values, cars = self.indexes[index]
+                position = bisect.bisect_left(values, value)
+                while cars[position] is not car:
+                    position += 1
+                del values[position]
+                del cars[position]
+
+    def query(self, segment=None, min_price=None, max_price=None, max_mileage=None, max_age=None,
+              sort_by="price", descending=False, page=1, page_size=20):
+        """Returns (cars on the requested page, whether more pages follow)."""
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"Cannot sort by {sort_by!r}")
+        if self.indexes is None:
+            self.rebuild()
+        values, cars = self.indexes.get((segment, sort_by), ([], []))
+        # Narrow by bisection on the sort key, then filter the rest while walking
+        low, high = {"price": (min_price, max_price), "mileage": (None, max_mileage), "age": (None, max_age)}[sort_by]
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        stop = len(values) if high is None else bisect.bisect_right(values, high)
+        positions = range(stop - 1, start - 1, -1) if descending else range(start, stop)
+
+        skip, found = (page - 1) * page_size, []
+        for position in positions:
+            car = cars[position]
+            if car.sold:
+                continue
+            if (min_price is not None and car.price < min_price) or (max_price is not None and car.price > max_price):
+                continue
+            if (max_mileage is not None and car.mileage > max_mileage) or (max_age is not None and car.age > max_age):
+                continue
+            if skip:
+                skip -= 1
+            elif len(found) == page_size:
+                return found, True
+            else:
+                found.append(car)
+        return found, False
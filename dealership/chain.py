@@ -0,0 +1,386 @@
+import os
+import random
+from itertools import accumulate
+from .business import Employee
+from .cars import SEGMENTS, EconomyCar, LuxuryCar, SportsCar
+from .customers import CustomerStream, negotiate_prices
+from .display import console, format_price, headless
+from .inventory import Inventory
+from .lazy import np
+
+# Models the manufacturer delivers to chain dealerships: (class, model, list price, share of deliveries)
+STOCK_MODELS = [
+    (LuxuryCar, "Mercedes-Benz S-Class", 110_000, 1),
+    (LuxuryCar, "Bentley Mulsanne", 300_000, 0.5),
+    (SportsCar, "Porsche 911", 120_000, 1),
+    (SportsCar, "Ferrari 488", 250_000, 0.5),
+    (EconomyCar, "Toyota Corolla", 20_000, 4),
+    (EconomyCar, "Honda Civic", 19_000, 4),
+    (EconomyCar, "Ford Focus", 21_000, 4),
+]
+DELIVERY_WEIGHTS = list(accumulate(model[3] for model in STOCK_MODELS))
+DEALERSHIP_LOCATIONS = ("Showroom", "Warehouse")  # Every dealership's, so the chain can check moves before sending them
+
+# A Single Dealership
+class Dealership:
+    """One store of a DealershipChain, with its own Inventory (Showroom and
+    Warehouse), sales staff, money and customer flow. Every year it orders
+    up to deliveries new cars into the Warehouse to bring its stock back to
+    stock_target, refills the Showroom from it,
+    sells Showroom cars to a stream of prospects (at most sales_per_skill
+    cars per point of staff skill) and pays its staff. All its randomness
+    comes from its own generators, seeded from the chain seed and its name,
+    so a store's results don't depend on which shard runs it."""
+    def __init__(self, name, index, seed=0, owner=None, region=None, staff=None, money=500_000, traffic=None,
+                 deliveries=20, stock_target=30, showroom_size=20, salary=40_000, sales_per_skill=2, wholesale=0.75):
+        self.name = name
+        self.index = index  # Position in the chain, used to order transfers
+        self.owner = owner
+        self.region = region
+        self.random = random.Random(f"{seed}-{name}")
+        self.stream = CustomerStream(seed=self.random.getrandbits(64))
+        self.staff = staff if staff is not None else [Employee(f"{name} Sales {i + 1}", "Salesperson", 5) for i in range(3)]
+        self.money = money
+        self.traffic = traffic if traffic is not None else int(self.random.lognormvariate(np.log(300), 0.6))
+        self.deliveries = deliveries
+        self.stock_target = stock_target
+        self.showroom_size = showroom_size
+        self.salary = salary
+        self.sales_per_skill = sales_per_skill
+        self.wholesale = wholesale
+        self.inventory = Inventory(DEALERSHIP_LOCATIONS, low_stock_threshold=showroom_size // 2)
+        self.serial = 0
+        self.sales = 0
+        self.revenue = 0.0
+
+    def receive_deliveries(self):
+        cost = 0
+        count = min(self.deliveries, max(0, self.stock_target - len(self.inventory.cars)))
+        for car_class, model, price, _ in self.random.choices(STOCK_MODELS, cum_weights=DELIVERY_WEIGHTS, k=count):
+            self.serial += 1
+            car = car_class(f"{model} {self.name}-{self.serial}", price, 0, "New", 0, region=self.region)
+            self.inventory.add_car("Warehouse", car)
+            cost += price * self.wholesale
+        self.money -= cost
+        return cost
+
+    def restock_showroom(self):
+        # Fills the Showroom up to showroom_size from the Warehouse, oldest stock first
+        room = self.showroom_size - len(self.inventory.locations["Showroom"])
+        for car in self.inventory.cars_at("Warehouse")[:max(0, room)]:
+            self.inventory.move_car("Warehouse", "Showroom", car.name)
+
+    def serve_customers(self):
+        """Matches every prospect to a random Showroom car in their preferred
+        segment and sells to the earliest prospects who can afford one, one
+        buyer per car, until the staff run out of capacity."""
+        chunk = next(self.stream.chunks(self.traffic), None)
+        if chunk is None:
+            return 0, 0.0
+        rng = self.stream.rng
+        showroom = [[] for _ in SEGMENTS]
+        for car in self.inventory.locations["Showroom"].values():
+            showroom[SEGMENTS.index(car.segment)].append(car)
+        deals = []  # (prospect, segment, car index, price)
+        for code, cars in enumerate(showroom):
+            members = np.flatnonzero(chunk["preference"] == code)
+            if not len(members) or not cars:
+                continue
+            picks = rng.integers(0, len(cars), len(members))
+            prices = np.array([car.price for car in cars], dtype=np.float64)[picks]
+            final = negotiate_prices(prices, chunk["negotiation_skill"][members], chunk["trade_in_value"][members], rng)
+            affordable = np.flatnonzero(final <= chunk["budget"][members])
+            _, first = np.unique(picks[affordable], return_index=True)
+            won = affordable[first]
+            deals.extend(zip(members[won].tolist(), [code] * len(won), picks[won].tolist(), final[won].tolist()))
+        deals.sort()
+        capacity = sum(employee.skill_level for employee in self.staff) * self.sales_per_skill
+        revenue = 0.0
+        for _, code, index, price in deals[:capacity]:
+            car = showroom[code][index]
+            self.inventory.remove_car(car)
+            car.sold = True
+            car.owners += 1
+            revenue += price
+        sold = min(len(deals), capacity)
+        self.sales += sold
+        self.revenue += revenue
+        return sold, revenue
+
+    def run_year(self):
+        self.receive_deliveries()
+        self.restock_showroom()
+        sold, revenue = self.serve_customers()
+        payroll = self.salary * len(self.staff)
+        self.money += revenue - payroll
+        for car in self.inventory.cars.values():
+            car.depreciate()
+            car.age += 1
+            self.inventory.reprice(car)
+        return dict(self.stats(), sold=sold, revenue=revenue, payroll=payroll)
+
+    def stats(self):
+        return {"money": self.money, "showroom": len(self.inventory.locations["Showroom"]),
+                "warehouse": len(self.inventory.locations["Warehouse"]),
+                "stock_value": sum(car.price for car in self.inventory.cars.values())}
+
+    def take_cars(self, location, count=None, name=None):
+        # Removes a named car, or up to count cars, from a location for shipping
+        if name is not None:
+            matches = self.inventory.by_name.get((location, name))
+            cars = [next(iter(matches.values()))] if matches else []
+        else:
+            cars = self.inventory.cars_at(location)[:count]
+        for car in cars:
+            self.inventory.remove_car(car)
+        return cars
+
+# Shards
+class Shard:
+    """The dealerships one worker process owns. step() takes a batch of
+    messages, applies it and runs the year if one is given, and returns the
+    cars it is shipping to dealerships on other shards. Cars moving between
+    dealerships are always in transit until the next step, wherever the two
+    stores are, so results don't depend on how the chain is sharded."""
+    def __init__(self, index, seed=0):
+        self.index = index
+        self.seed = seed
+        self.dealerships = {}
+        self.transit = []  # (key, dealership, location, car) arriving at the next step
+
+    def step(self, batch):
+        outbox = []
+        for name, index, options in batch.get("open", ()):
+            self.dealerships[name] = Dealership(name, index, self.seed, **options)
+        # Arrivals land in a fixed order, however they got here
+        arrivals = sorted(self.transit + batch.get("arrivals", []), key=lambda item: item[0])
+        self.transit = []
+        for _, name, location, car in arrivals:
+            self.dealerships[name].inventory.add_car(location, car)
+        sequence = {}  # Per sending dealership, so the order doesn't depend on the sharding
+        for source, from_location, target, to_location, car_name, count in batch.get("moves", ()):
+            dealership = self.dealerships[source]
+            if source == target and car_name is not None:
+                dealership.inventory.move_car(from_location, to_location, car_name)
+                continue
+            for car in dealership.take_cars(from_location, count, car_name):
+                sequence[source] = sequence.get(source, -1) + 1
+                item = ((dealership.index, sequence[source]), target, to_location, car)
+                (self.transit if target in self.dealerships else outbox).append(item)
+        stats = {}
+        if batch.get("year"):
+            for name, dealership in self.dealerships.items():
+                stats[name] = dealership.run_year()
+        fetched = {name: self.dealerships[name] for name in batch.get("fetch", ()) if name in self.dealerships}
+        return {"outbox": outbox, "stats": stats, "in_transit": len(self.transit), "fetched": fetched}
+
+def _serve_shard(connection, index, seed):
+    # Worker process loop: one batch in, one result out, until None arrives
+    shard = Shard(index, seed)
+    with headless():
+        while True:
+            batch = connection.recv()
+            if batch is None:
+                break
+            connection.send(shard.step(batch))
+    connection.close()
+
+class _LocalShard:
+    # Runs a Shard in this process behind the same send/recv calls as a Pipe
+    def __init__(self, index, seed):
+        self.shard = Shard(index, seed)
+        self.result = None
+
+    def send(self, batch):
+        with headless():
+            self.result = self.shard.step(batch)
+
+    def recv(self):
+        return self.result
+
+# Dealership Chain
+class DealershipChain:
+    """Hundreds of Dealerships partitioned into shards, each shard in its
+    own worker process (or in this process with processes=False). The chain
+    only talks to the shards in batches: every step sends each shard one
+    message with the dealerships to open, the cars arriving from other
+    shards and the moves to make, and gets back that year's stats and the
+    cars it ships out. Adding dealerships spreads them over more shards (up
+    to os.cpu_count() by default), so a bigger chain uses more cores rather
+    than more wall-clock time.
+
+    Locations are (dealership, location) pairs. move_car() and transfer()
+    are queued and happen at the next advance_year() or flush(); a car
+    moving between two dealerships arrives one step after it leaves."""
+    def __init__(self, shards=None, processes=True, seed=0, restock_level=10, reserve=5):
+        self.shard_count = shards or os.cpu_count() or 1
+        self.processes = processes
+        self.seed = seed
+        self.restock_level = restock_level  # Showroom plus Warehouse below this asks other stores for cars
+        self.reserve = reserve  # Warehouse cars a store keeps before it ships any out
+        self.shard_of = {}  # Dealership name -> shard index
+        self.shard_sizes = [0] * self.shard_count
+        self.stats = {}  # Dealership name -> its latest year's stats
+        self.in_transit = 0
+        self.current_year = 2023
+        self.workers = None
+        self._pending = [self._new_batch() for _ in range(self.shard_count)]
+
+    def _new_batch(self):
+        return {"open": [], "arrivals": [], "moves": [], "fetch": [], "year": False}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.shard_of)
+
+    def start(self):
+        if self.workers is not None:
+            return
+        if not self.processes:
+            self.workers = [_LocalShard(index, self.seed) for index in range(self.shard_count)]
+            return
+        import multiprocessing
+        self.workers, self._processes = [], []
+        for index in range(self.shard_count):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve_shard, args=(child, index, self.seed), daemon=True)
+            process.start()
+            child.close()
+            self.workers.append(parent)
+            self._processes.append(process)
+
+    def close(self):
+        if self.workers is None:
+            return
+        if self.processes:
+            for connection in self.workers:
+                connection.send(None)
+                connection.close()
+            for process in self._processes:
+                process.join()
+        self.workers = None
+
+    def open_dealership(self, name, **options):
+        """Adds a Dealership (see its keyword options) to the least loaded shard."""
+        if name in self.shard_of:
+            console.print(f"[red]{name} is already part of the chain.")
+            return
+        shard = self.shard_sizes.index(min(self.shard_sizes))
+        self.shard_of[name] = shard
+        self.shard_sizes[shard] += 1
+        self._pending[shard]["open"].append((name, len(self.shard_of) - 1, options))
+        console.print(f"[green]Opened {name}. The chain now has {len(self.shard_of)} dealerships.")
+
+    def _queue_move(self, source, from_location, target, to_location, car_name=None, count=None):
+        # Checked here, since a car whose move fails on a shard would be lost
+        if (source not in self.shard_of or target not in self.shard_of
+                or from_location not in DEALERSHIP_LOCATIONS or to_location not in DEALERSHIP_LOCATIONS):
+            console.print("[red]Invalid location!")
+            return False
+        self._pending[self.shard_of[source]]["moves"].append((source, from_location, target, to_location, car_name, count))
+        return True
+
+    def move_car(self, from_location, to_location, car_name):
+        """Moves a car between (dealership, location) pairs, on any shards."""
+        if self._queue_move(*from_location, *to_location, car_name):
+            console.print(f"[green]Moving {car_name} from {from_location[0]} {from_location[1]} "
+                          f"to {to_location[0]} {to_location[1]}.")
+
+    def transfer(self, source, target, count, to_location="Warehouse"):
+        # Ships up to count Warehouse cars from one dealership to another
+        self._queue_move(source, "Warehouse", target, to_location, count=count)
+
+    def _exchange(self):
+        """Sends every shard its pending batch, then collects the results and
+        routes the cars they shipped to the batches for their new shards."""
+        self.start()
+        batches, self._pending = self._pending, [self._new_batch() for _ in range(self.shard_count)]
+        for worker, batch in zip(self.workers, batches):
+            worker.send(batch)
+        results = [worker.recv() for worker in self.workers]
+        self.in_transit = 0
+        fetched = {}
+        for result in results:
+            for item in result["outbox"]:
+                self._pending[self.shard_of[item[1]]]["arrivals"].append(item)
+            self.in_transit += len(result["outbox"]) + result["in_transit"]
+            self.stats.update(result["stats"])
+            fetched.update(result["fetched"])
+        return results, fetched
+
+    def flush(self):
+        # Carries out queued moves and delivers every car in transit
+        self._exchange()
+        if self.in_transit:
+            self._exchange()
+
+    def dealership(self, name):
+        """A copy of a dealership as it is now, after any queued moves, for
+        inspection; changing it doesn't change the chain."""
+        if name not in self.shard_of:
+            return None
+        self._pending[self.shard_of[name]]["fetch"].append(name)
+        _, fetched = self._exchange()
+        return fetched.get(name)
+
+    def rebalance(self):
+        """Queues transfers from stores with spare Warehouse cars to stores
+        running low, largest surplus first. Uses the latest stats only, so
+        it costs one pass over the chain and no messages of its own."""
+        needs, spares = [], []
+        for name in self.shard_of:
+            stats = self.stats.get(name)
+            if stats is None:
+                continue
+            stock = stats["showroom"] + stats["warehouse"]
+            if stock < self.restock_level:
+                needs.append([name, self.restock_level - stock])
+            elif stats["warehouse"] > self.reserve:
+                spares.append([name, stats["warehouse"] - self.reserve])
+        spares.sort(key=lambda spare: -spare[1])
+        transfers = 0
+        for need in needs:
+            for spare in spares:
+                if not need[1]:
+                    break
+                count = min(need[1], spare[1])
+                if count:
+                    self.transfer(spare[0], need[0], count)
+                    need[1] -= count
+                    spare[1] -= count
+                    transfers += count
+        return transfers
+
+    def advance_year(self):
+        """Runs one year at every dealership in parallel, queues the next
+        round of restocking transfers and returns the chain's totals."""
+        self.current_year += 1
+        for batch in self._pending:
+            batch["year"] = True
+        results, _ = self._exchange()
+        ran = {name for result in results for name in result["stats"]}
+        # Totals in chain order, so they don't depend on the sharding either
+        year_stats = [self.stats[name] for name in self.shard_of if name in ran]
+        transfers = self.rebalance()
+        summary = {
+            "year": self.current_year,
+            "dealerships": len(self.shard_of),
+            "sold": sum(stats["sold"] for stats in year_stats),
+            "revenue": sum(stats["revenue"] for stats in year_stats),
+            "money": sum(stats["money"] for stats in year_stats),
+            "stock": sum(stats["showroom"] + stats["warehouse"] for stats in year_stats),
+            "in_transit": self.in_transit,
+            "transfers": transfers,
+        }
+        console.print(f"[cyan]{summary['year']}: {summary['dealerships']} dealerships sold {summary['sold']} cars "
+                      f"for {format_price(summary['revenue'])}; {summary['transfers']} cars queued for transfer.")
+        return summary
+
+    def run_years(self, years):
+        with headless():
+            return [self.advance_year() for _ in range(years)]
@@ -0,0 +1,169 @@
+import random
+from .cars import SEGMENTS, Car
+from .display import console, format_price
+from .lazy import np
+
+# AI Competitor with Advanced Strategies
+class AICompetitor:
+    def __init__(self, name, money, strategy="Balanced", **kwargs):
+        self.name = name
+        self.money = money
+        self.owned_cars = {}
+        self.dealerships = 1
+        self.strategy = strategy
+        self.__dict__.update(kwargs)
+
+    def to_dict(self):
+        data = dict(self.__dict__)
+        data["owned_cars"] = {name: car.to_dict() for name, car in self.owned_cars.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        # Restores strategy, dealerships and owned cars along with the money
+        data = dict(data)
+        owned_cars = data.pop("owned_cars", {})
+        competitor = cls(data.pop("name"), data.pop("money"), **data)
+        competitor.owned_cars = {name: Car.from_dict(car) for name, car in owned_cars.items()}
+        return competitor
+
+    def fork(self, cars):
+        # cars maps id(car) -> the fork's copy of that car
+        competitor = object.__new__(AICompetitor)
+        competitor.__dict__.update(self.__dict__)
+        competitor.owned_cars = {name: cars(car) for name, car in self.owned_cars.items()}
+        return competitor
+
+    def expand_business(self, chain=None):
+        # With a DealershipChain the new dealership is a real store in it
+        if self.money >= 500_000:
+            self.money -= 500_000
+            self.dealerships += 1
+            if chain is not None:
+                chain.open_dealership(f"{self.name} {self.dealerships}", owner=self.name)
+            console.print(f"[magenta]{self.name} has opened a new dealership! Total dealerships: {self.dealerships}")
+        else:
+            console.print(f"[red]{self.name} doesn't have enough money to open a new dealership.")
+
+    def steal_customer(self, customers):
+        if self.strategy == "Aggressive" and customers:
+            target = random.choice(customers)
+            if random.random() > 0.5:
+                console.print(f"[magenta]{self.name} has stolen a customer: {target.name}!")
+                customers.remove(target)
+            else:
+                console.print(f"[cyan]{self.name} tried to steal a customer but failed.")
+        elif self.strategy == "Balanced":
+            pass
+
+    def sabotage(self, player_dealership):
+        if self.strategy == "Aggressive" and random.random() > 0.5 and player_dealership.owned:
+            affected_cars = random.sample(list(player_dealership.owned.values()), k=min(len(player_dealership.owned), 3))
+            for car in affected_cars:
+                car.price -= random.randint(5000, 20000)
+                console.print(f"[red]{self.name} sabotaged {car.name}, reducing its value!")
+
+    def buy_car(self, car):
+        negotiation = random.randint(-5000, 5000)
+        final_price = max(0, car.price + negotiation)
+        if self.money >= final_price and not car.sold:
+            self.owned_cars[car.name] = car
+            self.money -= final_price
+            car.owners += 1
+            car.sold = True
+            console.print(f"[magenta]{self.name} bought {car.name} for {format_price(final_price)}.")
+        else:
+            console.print(f"[red]{self.name} couldn't afford {car.name} or it's already sold.")
+
+    def sell_car(self, car):
+        sell_price = car.price
+        if car.name in self.owned_cars:
+            del self.owned_cars[car.name]
+            self.money += sell_price
+            console.print(f"[magenta]{self.name} sold {car.name} for {format_price(sell_price)}.")
+
+# Batched AI Turns
+class CompetitorScheduler:
+    """Runs the yearly turn of every AI competitor in three batched phases
+    instead of one full ai_turn() at a time. First all decisions are drawn
+    at once as arrays. Then conflicts are resolved deterministically: the
+    highest affordable offer gets a car, and the first competitor in list
+    order gets a contested customer. Finally the results are applied."""
+    expansion_cost = 500_000
+
+    def run(self, game):
+        competitors = game.ai_competitors
+        n = len(competitors)
+        if not n:
+            return {}
+        rng = np.random.default_rng(random.getrandbits(64))
+        money = np.array([competitor.money for competitor in competitors], dtype=np.float64)
+        aggressive = np.array([competitor.strategy == "Aggressive" for competitor in competitors])
+
+        # Expansion comes first and reduces what is left for buying
+        expands = money >= self.expansion_cost
+        money -= self.expansion_cost * expands
+
+        # Customer stealing: the first competitor to target a customer gets them
+        stolen = []
+        if game.customers:
+            targets = rng.integers(0, len(game.customers), n)
+            thieves = np.flatnonzero(aggressive & (rng.random(n) > 0.5))
+            _, first = np.unique(targets[thieves], return_index=True)
+            stolen = sorted(targets[thieves[first]].tolist())
+
+        saboteurs = np.flatnonzero(aggressive & (rng.random(n) > 0.5)) if game.owned else np.zeros(0, dtype=np.int64)
+        damage = rng.integers(5000, 20001, (len(saboteurs), 3))
+
+        # Trades: buyers pick a random unsold car from a random segment
+        buying = rng.random(n) < 0.5
+        segments = rng.integers(0, len(SEGMENTS), n)
+        picks = rng.random(n)
+        offer_deltas = rng.integers(-5000, 5001, n)
+        available = [[car for car in category.values() if not car.sold]
+                     for category in (game.luxury_cars, game.sports_cars, game.economy_cars)]
+        sizes = np.array([len(cars) for cars in available])
+        buyers = np.flatnonzero(buying & (sizes[segments] > 0))
+        car_index = (picks[buyers] * sizes[segments[buyers]]).astype(np.int64)
+        prices = np.array([available[segment][index].price for segment, index in
+                           zip(segments[buyers].tolist(), car_index.tolist())], dtype=np.float64)
+        offers = np.maximum(0, prices + offer_deltas[buyers])
+        affordable = money[buyers] >= offers
+        buyers, car_index, offers = buyers[affordable], car_index[affordable], offers[affordable]
+        car_key = segments[buyers] * (sizes.max() + 1) + car_index
+        # Highest offer wins a contested car; ties go to the earlier competitor
+        order = np.lexsort((buyers, -offers, car_key))
+        _, first = np.unique(car_key[order], return_index=True)
+        winners = order[first]
+
+        for index in np.flatnonzero(expands).tolist():
+            competitor = competitors[index]
+            competitor.money -= self.expansion_cost
+            competitor.dealerships += 1
+        owned = list(game.owned.values())
+        for row in range(len(saboteurs)):
+            for car, amount in zip(random.sample(owned, k=min(len(owned), 3)), damage[row].tolist()):
+                car.price -= amount
+        for winner in winners.tolist():
+            competitor = competitors[buyers[winner]]
+            car = available[segments[buyers[winner]]][car_index[winner]]
+            competitor.owned_cars[car.name] = car
+            competitor.money -= float(offers[winner])
+            car.owners += 1
+            car.sold = True
+        sellers = 0
+        for index in np.flatnonzero(~buying).tolist():
+            competitor = competitors[index]
+            if competitor.owned_cars:
+                name = random.choice(list(competitor.owned_cars))
+                competitor.money += competitor.owned_cars.pop(name).price
+                sellers += 1
+        for index in reversed(stolen):
+            del game.customers[index]
+
+        summary = {"expanded": int(expands.sum()), "customers_stolen": len(stolen), "sabotaged": len(saboteurs),
+                   "cars_bought": len(winners), "cars_sold": sellers}
+        console.print(f"[magenta]Competitors: {summary['expanded']} expanded, {summary['cars_bought']} cars bought, "
+                      f"{summary['cars_sold']} sold, {summary['customers_stolen']} customers stolen, "
+                      f"{summary['sabotaged']} sabotage attempts.")
+        return summary
@@ -0,0 +1,104 @@
+import random
+from .cars import SEGMENTS
+from .display import console, format_price, today
+from .lazy import np, Prompt
+
+# Customer Class with Trade-In Feature
+class Customer:
+    def __init__(self, name, budget, preference, negotiation_skill, loyalty=1, trade_in_car=None):
+        self.name = name
+        self.budget = budget
+        self.preference = preference
+        self.negotiation_skill = negotiation_skill
+        self.loyalty = loyalty
+        self.purchase_history = []
+        self.reviews = []
+        self.trade_in_car = trade_in_car
+
+    def negotiate_price(self, car_price):
+        discount = random.randint(0, int(car_price * (self.negotiation_skill / 100)))
+        final_price = car_price - discount
+        if self.trade_in_car:
+            final_price -= self.trade_in_car.price * 0.8  # Trade-in value is 80% of the car's current price
+        return max(0, final_price)
+
+    def provide_feedback(self, satisfaction_level):
+        self.loyalty = min(5, max(1, self.loyalty + (satisfaction_level - 3)))
+        console.print(f"[yellow]{self.name} gave a satisfaction rating of {satisfaction_level}. Loyalty is now {self.loyalty}.")
+
+    def leave_review(self, car):
+        review_text = Prompt.ask(f"[yellow]{self.name}, please leave a review for {car.name}:")
+        rating = Prompt.ask(f"[yellow]Rate your experience with {car.name} out of 5:", choices=["1", "2", "3", "4", "5"])
+        self.reviews.append({"car": car.name, "review": review_text, "rating": int(rating)})
+        console.print(f"[green]{self.name} left a review: {review_text} (Rating: {rating}/5)")
+
+    def purchase_car(self, car):
+        final_price = self.negotiate_price(car.price)
+        if final_price <= self.budget:
+            self.purchase_history.append({"car": car.name, "price": final_price, "date": today()})
+            self.budget -= final_price
+            console.print(f"[green]{self.name} purchased {car.name} for {format_price(final_price)}. Remaining budget: {format_price(self.budget)}")
+            self.leave_review(car)
+            car.sold = True
+            car.owners += 1
+            return True
+        else:
+            console.print(f"[red]{self.name} could not afford {car.name}.")
+            return False
+
+# Synthetic Customer Traffic
+def negotiate_prices(prices, negotiation_skill, trade_in_values, rng):
+    """Vectorized Customer.negotiate_price(): a uniform discount of up to
+    negotiation_skill percent, minus 80% of any trade-in's value."""
+    max_discount = np.floor(prices * (negotiation_skill / 100))
+    discount = np.floor(rng.random(len(prices)) * (max_discount + 1))
+    return np.maximum(0, prices - discount - 0.8 * trade_in_values)
+
+class CustomerStream:
+    """Generates prospective buyers as chunks of arrays (budget, preferred
+    segment, negotiation skill, trade-in value) instead of Customer objects,
+    so any amount of foot traffic fits in bounded memory."""
+    def __init__(self, budget_median=60_000, budget_sigma=0.8, preferences=None,
+                 skill_range=(1, 10), trade_in_rate=0.3, trade_in_median=8_000, seed=None):
+        self.budget_median = budget_median
+        self.budget_sigma = budget_sigma
+        self.preferences = preferences or {"Luxury": 0.15, "Sports": 0.2, "Economy": 0.65}
+        self.skill_range = skill_range
+        self.trade_in_rate = trade_in_rate
+        self.trade_in_median = trade_in_median
+        self.rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+
+    def chunks(self, total, chunk_size=100_000):
+        weights = np.array([self.preferences.get(segment, 0) for segment in SEGMENTS], dtype=np.float64)
+        weights /= weights.sum()
+        for start in range(0, total, chunk_size):
+            size = min(chunk_size, total - start)
+            trade_ins = self.rng.random(size) < self.trade_in_rate
+            yield {
+                "budget": self.rng.lognormal(np.log(self.budget_median), self.budget_sigma, size),
+                "preference": self.rng.choice(len(SEGMENTS), size, p=weights),
+                "negotiation_skill": self.rng.integers(self.skill_range[0], self.skill_range[1] + 1, size),
+                "trade_in_value": np.where(trade_ins, self.rng.lognormal(np.log(self.trade_in_median), 0.5, size), 0.0),
+            }
+
+def process_demand(categories, prospects, stream=None, chunk_size=100_000):
+    """Matches each prospect to a random unsold car in their preferred
+    segment, negotiates every price in the chunk at once and counts who can
+    afford it. Returns per-segment totals; no cars change hands."""
+    stream = stream or CustomerStream()
+    prices = [np.array([car.price for car in category.values() if not car.sold], dtype=np.float64)
+              for category in categories]
+    summary = {segment: {"prospects": 0, "buyers": 0, "revenue": 0.0} for segment in SEGMENTS}
+    for chunk in stream.chunks(prospects, chunk_size):
+        preference = chunk["preference"]
+        for code, segment in enumerate(SEGMENTS):
+            members = np.flatnonzero(preference == code)
+            summary[segment]["prospects"] += len(members)
+            if not len(members) or not len(prices[code]):
+                continue
+            offered = prices[code][stream.rng.integers(0, len(prices[code]), len(members))]
+            final = negotiate_prices(offered, chunk["negotiation_skill"][members], chunk["trade_in_value"][members], stream.rng)
+            affordable = final <= chunk["budget"][members]
+            summary[segment]["buyers"] += int(affordable.sum())
+            summary[segment]["revenue"] += float(final[affordable].sum())
+    return summary
@@ -0,0 +1,100 @@
+import os
+import time
+from contextlib import contextmanager
+from .lazy import LazyImport
+from .profiling import profiler
+datetime = LazyImport("datetime", "datetime")
+
+# Console shared by every module
+class NullConsole:
+    """Stand-in for the Rich console that discards all output."""
+    def print(self, *args, **kwargs):
+        pass
+
+    def clear(self, *args, **kwargs):
+        pass
+
+class ConsoleProxy:
+    """The console every module prints through. The Rich console behind it
+    is only created (and Rich imported) on first use, and headless() swaps
+    the target without anyone having to re-import the console."""
+    def __init__(self):
+        self.target = None
+
+    def load(self):
+        if self.target is None:
+            from rich.console import Console
+            self.target = Console()
+        return self.target
+
+    def print(self, *args, **kwargs):
+        if profiler.enabled:
+            profiler.count("console.print")
+        (self.target or self.load()).print(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+console = ConsoleProxy()
+
+@contextmanager
+def headless():
+    """Silences all console output for the duration of the block."""
+    previous, console.target = console.target, NullConsole()
+    try:
+        yield
+    finally:
+        console.target = previous
+
+def format_price(price):
+    if profiler.enabled:
+        profiler.count("format_price")
+    if price >= 1_000_000:
+        return f"${price / 1_000_000:.1f}M"
+    elif price >= 1_000:
+        return f"${price / 1_000:.1f}K"
+    else:
+        return f"${price:.2f}"
+
+_today = {"date": None, "until": 0.0}
+
+def today():
+    """datetime.now().strftime('%Y-%m-%d'), recomputed only once the day rolls over."""
+    if time.monotonic() >= _today["until"]:
+        now = datetime.now()
+        midnight = datetime(now.year, now.month, now.day).timestamp() + 86400
+        _today["date"] = now.strftime('%Y-%m-%d')
+        _today["until"] = time.monotonic() + max(1.0, midnight - now.timestamp())
+    return _today["date"]
+
+# Instant mode skips the artificial delays of the effects below
+INSTANT_MODE = os.environ.get("DEALERSHIP_INSTANT", "") not in ("", "0")
+
+def set_instant_mode(enabled):
+    global INSTANT_MODE
+    INSTANT_MODE = enabled
+
+def instant_mode():
+    # The current setting; a copy of INSTANT_MODE imported elsewhere goes stale
+    return INSTANT_MODE
+
+def typing_effect(text, delay=0.05):
+    """Simulates a typing effect for the given text."""
+    if INSTANT_MODE:
+        print(text)
+        return
+    for char in text:
+        print(char, end='', flush=True)
+        time.sleep(delay)
+    print()
+
+def loading_animation(text, duration=2):
+    """Displays a loading animation for a specified duration."""
+    if INSTANT_MODE:
+        return
+    from rich.progress import Progress
+    with Progress(console=console.load()) as progress:
+        task = progress.add_task(f"[cyan]{text}", total=100)
+        for _ in range(100):
+            time.sleep(duration / 100)
+            progress.advance(task)
@@ -0,0 +1,60 @@
+import random
+from itertools import accumulate
+from .cars import SEGMENTS
+from .fleet import event_effects
+
+# Random events, defined once. Each one is drawn with probability weight /
+# total weight and changes the value of every car in its segments (all of
+# them when segments is None): "add" events add sign * randint(low, high)
+# dollars per car, "mul" events scale each price by sign * low..high percent.
+RANDOM_EVENTS = [
+    {"event": "economic boom", "description": "An economic boom increases car values significantly.", "weight": 1, "segments": None, "effect": "add", "sign": 1, "low": 10000, "high": 50000},
+    {"event": "recession", "description": "A recession decreases car values significantly.", "weight": 1, "segments": None, "effect": "add", "sign": -1, "low": 10000, "high": 50000},
+    {"event": "new tax law", "description": "A new tax law negatively affects car values.", "weight": 1, "segments": None, "effect": "add", "sign": -1, "low": 5000, "high": 25000},
+    {"event": "high demand", "description": "High demand increases car values moderately.", "weight": 1, "segments": None, "effect": "add", "sign": 1, "low": 5000, "high": 30000},
+    {"event": "low demand", "description": "Low demand decreases car values moderately.", "weight": 1, "segments": None, "effect": "add", "sign": -1, "low": 5000, "high": 30000},
+    {"event": "new technology", "description": "New technology boosts car values.", "weight": 1, "segments": None, "effect": "add", "sign": 1, "low": 5000, "high": 20000},
+    {"event": "market saturation", "description": "Market saturation decreases car values.", "weight": 1, "segments": None, "effect": "add", "sign": -1, "low": 10000, "high": 40000},
+    {"event": "natural disaster", "description": "A natural disaster significantly lowers car values.", "weight": 1, "segments": None, "effect": "add", "sign": -1, "low": 20000, "high": 60000},
+]
+
+# Segment-targeted examples, off by default: EventEngine(RANDOM_EVENTS + SEGMENT_EVENTS)
+SEGMENT_EVENTS = [
+    {"event": "luxury tax hike", "description": "A new luxury tax cuts luxury car values.", "weight": 0.5, "segments": ("Luxury",), "effect": "mul", "sign": -1, "low": 5, "high": 15},
+    {"event": "motorsport win", "description": "A motorsport win makes sports cars more desirable.", "weight": 0.5, "segments": ("Sports",), "effect": "mul", "sign": 1, "low": 5, "high": 20},
+    {"event": "fuel price spike", "description": "Expensive fuel sends buyers towards economy cars.", "weight": 0.5, "segments": ("Economy",), "effect": "mul", "sign": 1, "low": 5, "high": 10},
+]
+
+# Event Engine
+class EventEngine:
+    """Compiles an event table once (segment codes and cumulative weights) so
+    drawing and applying events needs no per-call setup. Effects for all
+    targeted cars are drawn in one block, in catalog order, and the Fleet
+    path gives exactly the same prices as the per-car path."""
+    def __init__(self, events=RANDOM_EVENTS):
+        self.events = []
+        for event in events:
+            segments = event.get("segments") or SEGMENTS
+            compiled = dict(event, weight=event.get("weight", 1), effect=event.get("effect", "add"),
+                            codes=tuple(sorted(SEGMENTS.index(segment) for segment in segments)))
+            if compiled["effect"] not in ("add", "mul"):
+                raise ValueError(f"Unknown effect {compiled['effect']!r} for event {event['event']!r}.")
+            self.events.append(compiled)
+        self.cum_weights = list(accumulate(event["weight"] for event in self.events))
+
+    def draw(self, count=1):
+        return random.choices(self.events, cum_weights=self.cum_weights, k=count)
+
+    def apply(self, event, game):
+        if game.fleet is not None:
+            game.fleet.apply_event(event)
+            return
+        categories = [game.luxury_cars, game.sports_cars, game.economy_cars]
+        cars = [car for code in event["codes"] for car in categories[code].values()]
+        effects = event_effects(event, len(cars)).tolist()
+        if event["effect"] == "add":
+            for car, amount in zip(cars, effects):
+                car.price = max(0, car.price + amount)
+        else:
+            for car, factor in zip(cars, effects):
+                car.price = max(0, round(car.price * factor, 2))
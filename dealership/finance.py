@@ -0,0 +1,380 @@
+from .display import console, format_price, today
+from .lazy import LazyImport, np
+sqlite3 = LazyImport("sqlite3")
+
+# Loan Book
+class LoanBook:
+    """Loans held as parallel arrays with their amortization schedule
+    precomputed. Every loan is paid off in term_years * 12 equal installments
+    of total_payment, each split into a fixed principal and interest part.
+    Installments for all loans are processed in one vectorized step, and
+    paid-off loans are dropped by compacting the arrays."""
+    columns = ("amount", "interest_rate", "term_years", "total_payment", "installment",
+               "principal_part", "interest_part", "outstanding", "periods", "periods_paid")
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.principal_paid = 0.0
+        self.interest_paid = 0.0
+        for column in self.columns:
+            setattr(self, column, np.zeros(capacity, dtype=np.int64 if column.startswith("periods") else np.float64))
+
+    def __len__(self):
+        return self.count
+
+    def add(self, amount, interest_rate, term_years):
+        if self.count == len(self.amount):
+            for column in self.columns:
+                old = getattr(self, column)
+                new = np.zeros(len(old) * 2, dtype=old.dtype)
+                new[:self.count] = old[:self.count]
+                setattr(self, column, new)
+        row = self.count
+        total_payment = amount * (1 + interest_rate / 100) ** term_years
+        periods = term_years * 12
+        self.amount[row], self.interest_rate[row], self.term_years[row] = amount, interest_rate, term_years
+        self.total_payment[row] = self.outstanding[row] = total_payment
+        self.installment[row] = total_payment / periods
+        self.principal_part[row] = amount / periods
+        self.interest_part[row] = (total_payment - amount) / periods
+        self.periods[row], self.periods_paid[row] = periods, 0
+        self.count += 1
+        return total_payment
+
+    def pay_installments(self):
+        """Pays one installment on every loan. Returns the total paid and the
+        amounts of the loans that are now fully repaid."""
+        n = self.count
+        if not n:
+            return 0.0, []
+        self.outstanding[:n] -= self.installment[:n]
+        self.periods_paid[:n] += 1
+        self.principal_paid += float(self.principal_part[:n].sum())
+        self.interest_paid += float(self.interest_part[:n].sum())
+        total = float(self.installment[:n].sum())
+        done = self.periods_paid[:n] >= self.periods[:n]
+        repaid = self.amount[:n][done].tolist()
+        if repaid:
+            keep = np.flatnonzero(~done)
+            for column in self.columns:
+                array = getattr(self, column)
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+        return total, repaid
+
+    def fork(self):
+        book = object.__new__(LoanBook)
+        book.__dict__.update(self.__dict__)
+        for column in self.columns:
+            setattr(book, column, getattr(self, column).copy())
+        return book
+
+    def outstanding_by_year(self, years):
+        """Total outstanding balance at the end of each of the next years."""
+        n = self.count
+        remaining = (self.periods[:n] - self.periods_paid[:n])[None, :] - 12 * np.arange(1, years + 1)[:, None]
+        return (np.maximum(0, remaining) * self.installment[:n][None, :]).sum(axis=1)
+
+    def schedule(self, row):
+        # (principal, interest) per remaining period of one loan
+        remaining = int(self.periods[row] - self.periods_paid[row])
+        return np.full(remaining, self.principal_part[row]), np.full(remaining, self.interest_part[row])
+
+    def as_dicts(self):
+        return [{"amount": float(self.amount[row]), "interest_rate": float(self.interest_rate[row]),
+                 "term_years": int(self.term_years[row]), "total_payment": float(self.total_payment[row]),
+                 "outstanding": float(self.outstanding[row])} for row in range(self.count)]
+
+# Transaction Ledger Backend
+class TransactionLedger:
+    """Persistent transaction log on a long-lived SQLite connection. Records
+    are buffered and written with executemany once buffer_size accumulate,
+    or when read back; P&L queries use the period and type indexes."""
+
+    def __init__(self, path, buffer_size=10_000):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS transactions
+                (id INTEGER PRIMARY KEY, date TEXT, period INTEGER, type TEXT, amount REAL, description TEXT);
+            CREATE INDEX IF NOT EXISTS transactions_by_period ON transactions (period, type);
+            CREATE INDEX IF NOT EXISTS transactions_by_type ON transactions (type, period);
+        ''')
+
+    def record(self, date, period, transaction_type, amount, description):
+        self.buffer.append((date, period, transaction_type, amount, description))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def record_many(self, rows):
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO transactions (date, period, type, amount, description) VALUES (?, ?, ?, ?, ?)",
+                    self.buffer)
+            self.buffer = []
+
+    def __len__(self):
+        self.flush()
+        return self.conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    def profit_loss(self, start=None, end=None):
+        """{period: {type: total}} for periods in [start, end]."""
+        self.flush()
+        query = "SELECT period, type, SUM(amount) FROM transactions"
+        clauses, params = self._period_filter(start, end)
+        rows = self.conn.execute(query + clauses + " GROUP BY period, type ORDER BY period", params)
+        statement = {}
+        for period, transaction_type, total in rows:
+            statement.setdefault(period, {})[transaction_type] = total
+        return statement
+
+    def total(self, transaction_type, start=None, end=None):
+        self.flush()
+        clauses, params = self._period_filter(start, end)
+        clauses += (" AND" if clauses else " WHERE") + " type = ?"
+        return self.conn.execute("SELECT COALESCE(SUM(amount), 0) FROM transactions" + clauses,
+                                 params + [transaction_type]).fetchone()[0]
+
+    def entries(self, start=None, end=None, transaction_type=None, batch_size=500):
+        """Yields (date, period, type, amount, description) rows in insertion
+        order, fetching batch_size at a time from a cursor."""
+        self.flush()
+        clauses, params = self._period_filter(start, end)
+        if transaction_type is not None:
+            clauses += (" AND" if clauses else " WHERE") + " type = ?"
+            params.append(transaction_type)
+        cursor = self.conn.execute(
+            "SELECT date, period, type, amount, description FROM transactions" + clauses + " ORDER BY id", params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def _period_filter(self, start, end):
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("period >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("period <= ?")
+            params.append(end)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+# Financial Manager with Detailed Management
+class FinancialManager:
+    def __init__(self, game):
+        self.game = game
+        self.profit_loss_statement = []
+        self.balance_sheet = {}
+        self.cash_flow = 0
+        self.loan_book = LoanBook()
+        self.investments = []
+        self.crypto_portfolio = {}
+        self.taxes_due = 0
+        self.ledger = None
+
+    def fork(self, game):
+        # A fork keeps its transactions in memory rather than writing into
+        # the parent's SQLite ledger
+        manager = object.__new__(FinancialManager)
+        manager.__dict__.update(self.__dict__)
+        manager.game = game
+        manager.profit_loss_statement = list(self.profit_loss_statement)
+        manager.balance_sheet = dict(self.balance_sheet)
+        manager.loan_book = self.loan_book.fork()
+        manager.investments = list(self.investments)
+        manager.crypto_portfolio = dict(self.crypto_portfolio)
+        manager.ledger = None
+        return manager
+
+    def use_ledger(self, path, buffer_size=10_000):
+        """Sends transactions to a SQLite ledger instead of the in-memory
+        profit_loss_statement."""
+        if self.ledger is None:
+            self.ledger = TransactionLedger(path, buffer_size)
+        return self.ledger
+
+    def record_transaction(self, transaction_type, amount, description):
+        if self.ledger is not None:
+            self.ledger.record(today(), self.game.current_year, transaction_type, amount, description)
+        else:
+            self.profit_loss_statement.append({
+                "date": today(),
+                "type": transaction_type,
+                "amount": amount,
+                "description": description
+            })
+        self.cash_flow += amount if transaction_type == "income" else -amount
+        console.print(f"[green]Recorded {transaction_type} of {format_price(amount)}: {description}")
+
+    def record_transactions(self, transactions):
+        """Records (type, amount, description) tuples with a single summary line."""
+        date, period = today(), self.game.current_year
+        rows = [(date, period, transaction_type, amount, description)
+                for transaction_type, amount, description in transactions]
+        if self.ledger is not None:
+            self.ledger.record_many(rows)
+        else:
+            self.profit_loss_statement.extend(
+                {"date": date, "type": transaction_type, "amount": amount, "description": description}
+                for date, period, transaction_type, amount, description in rows)
+        self.cash_flow += sum(row[3] if row[2] == "income" else -row[3] for row in rows)
+        console.print(f"[green]Recorded {len(rows)} transactions.")
+
+    @property
+    def loans(self):
+        # The old loan dicts, built from the LoanBook on each access; a tuple, since
+        # changes to it would be lost. take_loan is the way to add one.
+        return tuple(self.loan_book.as_dicts())
+
+    def take_loan(self, amount, interest_rate, term_years):
+        total_payment = self.loan_book.add(amount, interest_rate, term_years)
+        self.game.money += amount  # Add loan amount to game money
+        console.print(f"[green]Loan of {format_price(amount)} taken with {interest_rate}% interest over {term_years} years. Total repayment: {format_price(total_payment)}.")
+
+    def calculate_taxes(self, profit):
+        tax_rate = 0.3
+        self.taxes_due = profit * tax_rate
+
+    def pay_taxes(self):
+        if self.taxes_due > 0:
+            if self.game.money >= self.taxes_due:
+                self.game.money -= self.taxes_due
+                console.print(f"[green]Taxes of {format_price(self.taxes_due)} paid.")
+                self.taxes_due = 0
+            else:
+                console.print("[red]Not enough money to pay taxes.")
+        else:
+            console.print("[cyan]No taxes due.")
+
+    def invest_in_stock(self, stock_name, amount):
+        if amount <= self.game.money:
+            self.game.money -= amount
+            self.investments.append({"stock": stock_name, "amount": amount, "purchase_date": today()})
+            console.print(f"[green]Invested {format_price(amount)} in {stock_name}.")
+        else:
+            console.print(f"[red]Not enough money to invest in {stock_name}.")
+
+    def invest_in_crypto(self, crypto_name, amount):
+        if amount <= self.game.money:
+            self.game.money -= amount
+            self.crypto_portfolio[crypto_name] = self.crypto_portfolio.get(crypto_name, 0) + amount
+            console.print(f"[green]Invested {format_price(amount)} in {crypto_name} cryptocurrency.")
+        else:
+            console.print(f"[red]Not enough money to invest in {crypto_name}.")
+
+    def pay_loan_installments(self):
+        total_installment, repaid = self.loan_book.pay_installments()
+        if len(repaid) <= 10:
+            for amount in repaid:
+                console.print(f"[green]Loan of {format_price(amount)} has been fully repaid.")
+        else:
+            console.print(f"[green]{len(repaid)} loans totaling {format_price(sum(repaid))} have been fully repaid.")
+        if total_installment > 0:
+            if self.game.money >= total_installment:
+                self.game.money -= total_installment
+                console.print(f"[yellow]Paid loan installments totaling {format_price(total_installment)}.")
+            else:
+                console.print("[red]Not enough money to pay loan installments.")
+
+# Ledger with Per-Year Running Totals
+class Ledger(list):
+    """List of {"type", "amount", "car", "year"} entries that keeps running
+    totals per year and per (year, type) as entries are appended, so yearly
+    profit and category breakdowns don't have to rescan the history. Any
+    other change to the list (pop, remove, item or slice assignment, del,
+    clear, insert, *=) recounts the totals from scratch."""
+    def __init__(self, entries=()):
+        super().__init__()
+        self.totals = {}
+        self.by_type = {}
+        self.extend(entries)
+
+    def _add(self, entry):
+        year, amount = entry["year"], entry["amount"]
+        self.totals[year] = self.totals.get(year, 0) + amount
+        categories = self.by_type.setdefault(year, {})
+        categories[entry["type"]] = categories.get(entry["type"], 0) + amount
+
+    def _recount(self):
+        self.totals = {}
+        self.by_type = {}
+        for entry in self:
+            self._add(entry)
+
+    def __reduce__(self):
+        return (Ledger, (list(self),))
+
+    def fork(self):
+        # Entries are never changed once appended, so the copy shares them
+        ledger = Ledger()
+        list.extend(ledger, self)
+        ledger.totals = dict(self.totals)
+        ledger.by_type = {year: dict(categories) for year, categories in self.by_type.items()}
+        return ledger
+
+    def append(self, entry):
+        super().append(entry)
+        self._add(entry)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def insert(self, index, entry):
+        super().insert(index, entry)
+        self._add(entry)
+
+    def pop(self, index=-1):
+        entry = super().pop(index)
+        self._recount()
+        return entry
+
+    def remove(self, entry):
+        super().remove(entry)
+        self._recount()
+
+    def clear(self):
+        super().clear()
+        self._recount()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._recount()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recount()
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._recount()
+        return self
+
+    def total(self, year):
+        return self.totals.get(year, 0)
+
+    def category_total(self, year, category):
+        return self.by_type.get(year, {}).get(category, 0)
+
+    def breakdown(self, year):
+        return dict(self.by_type.get(year, {}))
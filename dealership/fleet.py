@@ -0,0 +1,270 @@
+import random
+from .cars import CONDITIONS, SEGMENTS
+from .lazy import np
+
+# Vectorized Fleet Store
+
+def randint_block(low, high, n):
+    """Returns the same n values as n successive random.randint(low, high)
+    calls, and advances the global random state identically, but draws the
+    underlying 32-bit words in bulk instead of one call at a time."""
+    span = high - low + 1
+    bits = span.bit_length()
+    if n <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if bits > 32:
+        # Wider draws take several words each; rare enough to make one at a time
+        return np.array([random.randint(low, high) for _ in range(n)], dtype=np.int64)
+    # randint() rejects any getrandbits(bits) result >= span, and each
+    # getrandbits() call of <= 32 bits consumes exactly one 32-bit word.
+    state = random.getstate()
+    words_needed = n + n // 2 + 16
+    while True:
+        raw = random.getrandbits(32 * words_needed).to_bytes(4 * words_needed, "little")
+        values = np.frombuffer(raw, dtype=np.uint32) >> np.uint32(32 - bits)
+        accepted = np.flatnonzero(values < span)
+        if len(accepted) >= n:
+            break
+        random.setstate(state)
+        words_needed *= 2
+    used = int(accepted[n - 1]) + 1
+    random.setstate(state)
+    random.getrandbits(32 * used)
+    return low + values[accepted[:n]].astype(np.int64)
+
+def random_block(n):
+    """Returns the same n values as n successive random.random() calls, and
+    advances the global random state identically. Each value is built from
+    two 32-bit words the same way random() builds it."""
+    if n <= 0:
+        return np.zeros(0, dtype=np.float64)
+    raw = random.getrandbits(64 * n).to_bytes(8 * n, "little")
+    words = np.frombuffer(raw, dtype=np.uint32)
+    high, low = (words[0::2] >> np.uint32(5)).astype(np.float64), (words[1::2] >> np.uint32(6)).astype(np.float64)
+    return (high * 67108864.0 + low) / 9007199254740992.0
+
+def event_effects(event, n):
+    """Per-car effects of a compiled event for n cars, drawn in one block:
+    amounts to add for additive events, factors for multiplicative ones
+    (whose low/high are percentages)."""
+    if event["effect"] == "add":
+        return event["sign"] * randint_block(event["low"], event["high"], n)
+    low, high = event["low"], event["high"]
+    return 1 + event["sign"] * (low + (high - low) * random_block(n)) / 100
+
+def round_cents(values):
+    """Vectorized round(value, 2) that agrees with Python's round(), which
+    np.round can miss by a cent when value * 100 lands next to .5."""
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for index in near_tie.tolist():
+        rounded[index] = round(float(values[index]), 2)
+    return rounded
+
+
+class FleetCarView:
+    """Mixin that backs a car's numeric fields with its row in a Fleet."""
+    __slots__ = ()
+
+    def _column(column, cast):
+        def getter(self):
+            return cast(getattr(self._fleet, column)[self._row])
+
+        def setter(self, value):
+            getattr(self._fleet, column)[self._row] = value
+        return property(getter, setter)
+
+    price = _column("price", float)
+    base_price = _column("base_price", float)
+    age = _column("age", int)
+    mileage = _column("mileage", int)
+    sold = _column("sold", bool)
+    del _column
+
+    @property
+    def condition(self):
+        return CONDITIONS[self._fleet.used[self._row]]
+
+    @condition.setter
+    def condition(self, value):
+        self._fleet.used[self._row] = CONDITIONS.index(value)
+
+    @property
+    def region(self):
+        return self._fleet.region_names[self._fleet.region[self._row]]
+
+    @region.setter
+    def region(self, value):
+        self._fleet.region[self._row] = self._fleet.region_code(value)
+
+class Fleet:
+    """Struct-of-arrays table of cars whose yearly update (random event,
+    depreciation, market trends, ageing) runs as whole-column NumPy
+    operations. Cars added to the fleet keep working as normal Car objects,
+    but read and write their numeric fields through the table."""
+    view_classes = {}
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.cars = []
+        self.names = []
+        self.price = np.zeros(capacity)
+        self.base_price = np.zeros(capacity)
+        self.age = np.zeros(capacity, dtype=np.int64)
+        self.mileage = np.zeros(capacity, dtype=np.int64)
+        self.used = np.zeros(capacity, dtype=np.int8)
+        self.segment = np.zeros(capacity, dtype=np.int8)
+        self.region = np.zeros(capacity, dtype=np.int32)  # Index into region_names
+        self.region_names = [None]
+        self._region_codes = {None: 0}
+        self.sold = np.zeros(capacity, dtype=bool)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self._next_seq = 0
+        self._order = None
+        self._ordered_names = None
+
+    @classmethod
+    def from_categories(cls, categories):
+        fleet = cls(capacity=max(1024, sum(len(category) for category in categories)))
+        for category in categories:
+            for car in category.values():
+                fleet.add(car)
+        return fleet
+
+    @classmethod
+    def view_class(cls, car_class):
+        if issubclass(car_class, FleetCarView):
+            return car_class
+        if car_class not in cls.view_classes:
+            cls.view_classes[car_class] = type(f"Fleet{car_class.__name__}", (FleetCarView, car_class), {"__slots__": ()})
+        return cls.view_classes[car_class]
+
+    def fork(self):
+        """Copy of the table with its own car views, for DealershipGame.fork().
+        Returns the fleet and {id(old car): new car}."""
+        fleet = object.__new__(Fleet)
+        fleet.__dict__.update(self.__dict__)
+        for column in ("price", "base_price", "age", "mileage", "used", "segment", "region", "sold", "seq"):
+            setattr(fleet, column, getattr(self, column).copy())
+        fleet.names = list(self.names)
+        fleet.region_names = list(self.region_names)
+        fleet._region_codes = dict(self._region_codes)
+        fleet.cars, cars = [], {}
+        for car in self.cars:
+            view = object.__new__(type(car))
+            view.name, view.owners = car.name, car.owners
+            view._maintenance_history, view._customizations = car._maintenance_history, car._customizations
+            view._fleet, view._row = fleet, car._row
+            fleet.cars.append(view)
+            cars[id(car)] = view
+        return fleet, cars
+
+    def _grow(self):
+        capacity = len(self.price) * 2
+        for column in ("price", "base_price", "age", "mileage", "used", "segment", "region", "sold", "seq"):
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, column, new)
+
+    def add(self, car, seq=None):
+        # seq places the car in catalog order; by default it goes last
+        if isinstance(car, FleetCarView):
+            return
+        if self.size == len(self.price):
+            self._grow()
+        row = self.size
+        values = (car.price, car.base_price, car.age, car.mileage, car.condition, car.sold, car.region)
+        self.price[row], self.base_price[row], self.age[row], self.mileage[row] = values[:4]
+        self.used[row] = CONDITIONS.index(values[4])
+        self.sold[row] = values[5]
+        self.region[row] = self.region_code(values[6])
+        self.segment[row] = SEGMENTS.index(car.segment) if car.segment in SEGMENTS else len(SEGMENTS)
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        self.seq[row] = seq
+        for column in ("price", "base_price", "age", "mileage", "condition", "sold", "region"):
+            delattr(car, column)  # Free the per-car values, the table owns them now
+        car.__class__ = self.view_class(type(car))
+        car._fleet, car._row = self, row
+        self.cars.append(car)
+        self.names.append(car.name)
+        self.size += 1
+        self._order = None
+
+    def discard(self, car):
+        # Swap-remove the car's row and turn it back into a plain Car
+        row, last = car._row, self.size - 1
+        values = (car.price, car.base_price, car.age, car.mileage, car.condition, car.sold, car.region)
+        if row != last:
+            for column in ("price", "base_price", "age", "mileage", "used", "segment", "region", "sold", "seq"):
+                array = getattr(self, column)
+                array[row] = array[last]
+            moved = self.cars[last]
+            moved._row = row
+            self.cars[row] = moved
+            self.names[row] = moved.name
+        self.cars.pop()
+        self.names.pop()
+        self.size -= 1
+        self._order = None
+        car.__class__ = car.__class__.__bases__[1]
+        del car._fleet, car._row
+        car.price, car.base_price, car.age, car.mileage, car.condition, car.sold, car.region = values
+
+    def replace(self, old, car):
+        # car takes old's place in catalog order, as it does in the category dict
+        seq = int(self.seq[old._row])
+        self.discard(old)
+        self.add(car, seq)
+
+    def region_code(self, name):
+        # Regions are interned per fleet; Market codes are looked up in apply_trends()
+        if name not in self._region_codes:
+            self._region_codes[name] = len(self.region_names)
+            self.region_names.append(name)
+        return self._region_codes[name]
+
+    def order(self):
+        # Row order matching iteration over the luxury, sports and economy dicts
+        if self._order is None:
+            self._order = np.lexsort((self.seq[:self.size], self.segment[:self.size]))
+            self._ordered_names = [self.names[row] for row in self._order.tolist()]
+        return self._order
+
+    def ordered_names(self):
+        self.order()
+        return self._ordered_names
+
+    def apply_event(self, event):
+        # Applies a compiled event (see events.EventEngine) to the cars in its
+        # segments, drawing their effects in catalog order
+        order = self.order()
+        if len(event["codes"]) < len(SEGMENTS):
+            order = order[np.isin(self.segment[order], event["codes"])]
+        effects = event_effects(event, len(order))
+        price = self.price[:self.size]
+        if event["effect"] == "add":
+            price[order] = np.maximum(0, price[order] + effects)
+        else:
+            price[order] = round_cents(np.maximum(0, price[order] * effects))
+
+    def depreciate(self):
+        price = self.price[:self.size]
+        rate = 0.05 + 0.02 * self.age[:self.size]
+        rate = rate + np.where(self.used[:self.size] == 1, 0.05, 0.0)
+        price[:] = round_cents(np.maximum(500, price * (1 - rate)))
+
+    def apply_trends(self, market):
+        # Translates the fleet's segment and region codes into the market's
+        # once per call, then looks every car's factor up in one gather
+        segment_codes = np.array([market.segment_codes.get(segment, -1) for segment in SEGMENTS] + [-1])
+        region_codes = np.array([market.region_code(name) for name in self.region_names])
+        price = self.price[:self.size]
+        price *= market.trend_factors(segment_codes[self.segment[:self.size]], region_codes[self.region[:self.size]])
+        price[:] = np.maximum(500, round_cents(price))
+
+    def age_one_year(self):
+        self.age[:self.size] += 1
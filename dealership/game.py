@@ -0,0 +1,473 @@
+import copy
+import os
+import random
+from .actionlog import ActionRecorder
+from .auction import AuctionHouse, ask_bid
+from .business import Employee, MarketingCampaign, ServiceDepartment, TrainingProgram
+from .cars import SEGMENTS, Car, EconomyCar, LuxuryCar, SportsCar
+from .catalog import CarCatalog
+from .competitors import AICompetitor
+from .customers import Customer, process_demand
+from .display import console, format_price, headless
+from .events import EventEngine
+from .finance import FinancialManager, Ledger
+from .fleet import Fleet, FleetCarView
+from .history import PriceHistory
+from .inventory import Inventory
+from .lazy import LazyImport
+from .market import Market
+from .profiling import profiler
+from .saves import SaveJournal
+json = LazyImport("json")
+
+# What the employee and marketing menus offer
+TRAINING_PROGRAMS = [
+    TrainingProgram("Sales Mastery", 5000, 1, 2),
+    TrainingProgram("Technical Workshop", 7000, 1, 1),
+    TrainingProgram("Leadership Seminar", 10000, 2, 3)
+]
+MARKETING_CAMPAIGNS = [
+    MarketingCampaign("Social Media Blast", 50000, 10),
+    MarketingCampaign("TV Commercial", 150000, 30),
+    MarketingCampaign("Billboard Ads", 100000, 20)
+]
+
+# Game State and Rules
+class DealershipGame:
+    """The dealership's state and yearly rules, without any menus. Every
+    player action is a plain method call; CarDealershipSimulator in ui.py
+    adds the interactive menus on top."""
+    def __init__(self):
+        self.money = 1_000_000
+        self.current_year = 2023
+        self.owned = {}
+        self.price_history = PriceHistory()
+        self.income_history = Ledger()
+        self.expense_history = Ledger()
+        self.reputation = 50  # Starting reputation
+        self.ai_competitors = [
+            AICompetitor("AutoElite", 800_000, strategy="Aggressive"),
+            AICompetitor("Luxury Motors", 1_200_000, strategy="Balanced"),
+            AICompetitor("Economy Wheels", 600_000, strategy="Economical")
+        ]
+        self.customers = [
+            Customer("John Doe", 150_000, "Luxury", 8),
+            Customer("Jane Smith", 50_000, "Economy", 5),
+            Customer("Alice Johnson", 200_000, "Sports", 7),
+            Customer("Bob Brown", 80_000, "Economy", 6)
+        ]
+        self.employees = [
+            Employee("Alex", "Salesperson", 5),
+            Employee("Beth", "Mechanic", 7),
+            Employee("Charlie", "Finance Manager", 6)
+        ]
+        self.inventory = Inventory()
+        self.financial_manager = FinancialManager(self)
+        self.auction_house = AuctionHouse(self)
+        self.market = Market()
+        self.event_engine = EventEngine()
+        self.events_per_year = 1
+        self.service_department = ServiceDepartment()
+
+        self.luxury_cars = {}
+        self.sports_cars = {}
+        self.economy_cars = {}
+        self.fleet = None
+        self.competitor_scheduler = None  # Set to a CompetitorScheduler to batch AI turns
+        self.save_journals = {}
+        self.recorder = None  # ActionRecorder while a session is being recorded
+        self.populate_cars()
+        self.catalog = CarCatalog({"Luxury": self.luxury_cars, "Sports": self.sports_cars, "Economy": self.economy_cars})
+
+    def use_fleet(self):
+        """Moves the catalog into a vectorized Fleet so the yearly update runs
+        as array operations. Results match the per-car path for the same seed."""
+        if self.fleet is None:
+            self.fleet = Fleet.from_categories([self.luxury_cars, self.sports_cars, self.economy_cars])
+        return self.fleet
+
+    def simulate_demand(self, prospects, stream=None, chunk_size=100_000):
+        """Runs a year's worth of synthetic foot traffic against the unsold
+        catalog and returns per-segment prospect, buyer and revenue totals."""
+        return process_demand([self.luxury_cars, self.sports_cars, self.economy_cars], prospects, stream, chunk_size)
+
+    def populate_cars(self):
+        # Luxury Cars
+        luxury_car_list = [
+            ("Rolls Royce Phantom", 450_000, 5, "New", 0),
+            ("Bentley Mulsanne", 300_000, 10, "New", 1),
+            ("Mercedes-Benz S-Class", 110_000, 5, "New", 1),
+            # Add more luxury cars here...
+        ]
+        for name, price, mileage, condition, age in luxury_car_list:
+            car = LuxuryCar(name, price, mileage, condition, age)
+            self.luxury_cars[name] = car
+
+        # Sports Cars
+        sports_car_list = [
+            ("Ferrari 488", 250_000, 10, "New", 1),
+            ("Porsche 911", 120_000, 20, "Used", 2),
+            ("Lamborghini Aventador", 400_000, 4, "New", 0),
+            # Add more sports cars here...
+        ]
+        for name, price, mileage, condition, age in sports_car_list:
+            car = SportsCar(name, price, mileage, condition, age)
+            self.sports_cars[name] = car
+
+        # Economy Cars
+        economy_car_list = [
+            ("Toyota Corolla", 20_000, 55, "Used", 5),
+            ("Honda Civic", 19_000, 60, "Used", 6),
+            ("Ford Focus", 21_000, 58, "Used", 6),
+            # Add more economy cars here...
+        ]
+        for name, price, mileage, condition, age in economy_car_list:
+            car = EconomyCar(name, price, mileage, condition, age)
+            self.economy_cars[name] = car
+
+    def register_car(self, category, car):
+        # Adds a car to a category dict, keeping the fleet table in sync
+        replaced = category.get(car.name)
+        if replaced is not None:
+            self.catalog.discard(replaced)
+        if self.fleet is not None:
+            if isinstance(replaced, FleetCarView):
+                self.fleet.replace(replaced, car)
+            else:
+                self.fleet.add(car)
+        category[car.name] = car
+        self.catalog.add(car)
+
+    def fork(self):
+        """Returns an independent branch of the game for what-if runs. Data
+        that never changes once written (ledger entries, price history rows,
+        maintenance and customization logs, names, the event table) is
+        shared with the branch; only the mutable structure around it, down
+        to each car's own fields or Fleet columns, is copied. Cars referred
+        to from several places stay one car in the branch. A branch keeps
+        its transactions in memory and doesn't record or share save slots."""
+        branch = object.__new__(type(self))
+        branch.__dict__.update(self.__dict__)
+        copies = {}
+        if self.fleet is not None:
+            branch.fleet, copies = self.fleet.fork()
+
+        def fork_car(car):
+            if id(car) not in copies:
+                copies[id(car)] = car.fork()
+            return copies[id(car)]
+
+        for category in ("luxury_cars", "sports_cars", "economy_cars", "owned"):
+            setattr(branch, category, {name: fork_car(car) for name, car in getattr(self, category).items()})
+        branch.catalog = CarCatalog({"Luxury": branch.luxury_cars, "Sports": branch.sports_cars, "Economy": branch.economy_cars})
+        branch.price_history = self.price_history.fork()
+        branch.income_history = self.income_history.fork()
+        branch.expense_history = self.expense_history.fork()
+        branch.ai_competitors = [competitor.fork(fork_car) for competitor in self.ai_competitors]
+        branch.customers = []
+        for customer in self.customers:
+            customer = copy.copy(customer)
+            customer.purchase_history, customer.reviews = list(customer.purchase_history), list(customer.reviews)
+            if customer.trade_in_car is not None:
+                customer.trade_in_car = fork_car(customer.trade_in_car)
+            branch.customers.append(customer)
+        branch.employees = [copy.copy(employee) for employee in self.employees]
+        branch.inventory = self.inventory.fork(fork_car)
+        branch.financial_manager = self.financial_manager.fork(branch)
+        branch.market = self.market.fork()
+        branch.service_department = copy.copy(self.service_department)
+        bidders = {id(self): branch}
+        bidders.update(zip(map(id, self.ai_competitors), branch.ai_competitors))
+        branch.auction_house = AuctionHouse(branch)
+        branch.auction_house.auctions = [
+            dict(lot, car=fork_car(lot["car"]), highest_bidder=bidders.get(id(lot["highest_bidder"])))
+            for lot in self.auction_house.auctions]
+        branch.save_journals = {}
+        branch.recorder = None
+        return branch
+
+    # --- Recording; see replay.Replay for playing a log back ---
+
+    def start_recording(self, path, seed=None):
+        """Seeds the global random state and logs every player action from
+        here on to path. Start it on a fresh game, since a replay begins from
+        a new one. Returns the seed."""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.stop_recording()
+        random.seed(seed)
+        self.recorder = ActionRecorder(path, seed)
+        return seed
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def record(self, action, *args):
+        if self.recorder is not None:
+            self.recorder.write(action, *args)
+
+    # --- Player actions; the menus collect input and call these ---
+
+    def purchase(self, car):
+        """Buys a car at its price plus a random negotiation swing and returns
+        the price paid, or None if the purchase didn't go through."""
+        self.record("purchase", SEGMENTS.index(car.segment), car.name)
+        negotiation = random.randint(-5000, 5000)
+        final_price = max(0, car.price + negotiation)
+        if self.money - final_price < 0:
+            console.print("[red]You don't have enough money.")
+            return None
+        if car.name in self.owned:
+            console.print("[red]You already own this car.")
+            return None
+        self.owned[car.name] = car
+        self.money -= final_price
+        car.owners += 1
+        car.sold = True
+        self.catalog.discard(car)
+        self.expense_history.append({"type": "purchase", "amount": final_price, "car": car.name, "year": self.current_year})
+        console.print(f"[green]You bought a {car.name} for {format_price(final_price)}.")
+        return final_price
+
+    def sell(self, carname):
+        """Sells an owned car at its current value and returns the price."""
+        self.record("sell", carname)
+        if carname not in self.owned:
+            console.print("[red]You do not own this car.")
+            return None
+        car = self.owned.pop(carname)
+        sellprice = car.price
+        self.money += sellprice
+        self.income_history.append({"type": "sale", "amount": sellprice, "car": carname, "year": self.current_year})
+        console.print(f"[green]You sold your {carname} for {format_price(sellprice)}.")
+        return sellprice
+
+    def add_own_car(self, name, price, mileage, condition, age):
+        """Lists a car of the player's own in the segment its price falls in."""
+        self.record("add_own_car", name, price, mileage, condition, age)
+        if price >= 200_000:
+            car = LuxuryCar(name, price, mileage, condition, age)
+            self.register_car(self.luxury_cars, car)
+        elif price >= 100_000:
+            car = SportsCar(name, price, mileage, condition, age)
+            self.register_car(self.sports_cars, car)
+        else:
+            car = EconomyCar(name, price, mileage, condition, age)
+            self.register_car(self.economy_cars, car)
+        console.print(f"[green]Your car {name} has been added successfully.")
+        return car
+
+    def upgrade(self, carname, modification):
+        """Applies a performance, luxury or efficiency upgrade to an owned car."""
+        self.record("upgrade", carname, modification)
+        if carname not in self.owned:
+            console.print("[red]You do not own this car.")
+            return False
+        self.owned[carname].modify(modification)
+        self.inventory.reprice(self.owned[carname])
+        return True
+
+    def auction(self, carname, answers=None):
+        """Lists an owned car and runs the auction house. The player's answer
+        for each lot (a bid or 'pass') comes from answers when given,
+        otherwise from the prompt."""
+        if carname not in self.owned:
+            self.record("auction", carname, [])
+            console.print("[red]You do not own this car.")
+            return False
+        pending = None if answers is None else iter(answers)
+        given = []
+
+        def player_bid(car, current_bid):
+            answer = ask_bid(car, current_bid) if pending is None else next(pending, "pass")
+            given.append(answer)
+            return answer
+
+        self.auction_house.list_car(self.owned[carname])
+        self.auction_house.conduct_auction(player_bid)
+        # Recorded afterwards, once the answers are known
+        self.record("auction", carname, given)
+        return True
+
+    def take_loan(self, amount, interest_rate, term_years):
+        self.record("take_loan", amount, interest_rate, term_years)
+        self.financial_manager.take_loan(amount, interest_rate, term_years)
+
+    def invest(self, kind, name, amount):
+        """Invests amount in a stock or, with kind "crypto", a cryptocurrency."""
+        self.record("invest", kind, name, amount)
+        if kind == "crypto":
+            self.financial_manager.invest_in_crypto(name, amount)
+        else:
+            self.financial_manager.invest_in_stock(name, amount)
+
+    def pay_taxes(self):
+        self.record("pay_taxes")
+        self.financial_manager.pay_taxes()
+
+    def train_employee(self, employee, program):
+        """Enrolls employee (an index into employees) in TRAINING_PROGRAMS[program]."""
+        self.record("train_employee", employee, program)
+        TRAINING_PROGRAMS[program].enroll_employee(self.employees[employee], self)
+
+    def launch_campaign(self, campaign):
+        self.record("launch_campaign", campaign)
+        MARKETING_CAMPAIGNS[campaign].apply_campaign(self)
+
+    def service_car(self, customer, carname):
+        """Services a customer's car (customer is an index into customers)."""
+        self.record("service_car", customer, carname)
+        # For simplicity, we'll assume the customer owns the car they want serviced.
+        car = Car(carname, 0, 0, "Used", 0)  # Placeholder car
+        self.service_department.service_car(car, self.customers[customer])
+
+    def advance_year(self):
+        """Runs one simulated year (events, market, maintenance, depreciation,
+        AI turns, profit and taxes) and returns that year's results."""
+        self.record("advance_year")
+        self.current_year += 1
+        with profiler.phase("random_event"):
+            events = self.random_events()
+        with profiler.phase("update_market"):
+            self.market.update_market()
+        with profiler.phase("maintenance"):
+            maintenance_costs = self.calculate_maintenance_costs()
+        with profiler.phase("depreciation"):
+            if self.fleet is not None:
+                self.fleet.depreciate()
+                self.fleet.apply_trends(self.market)
+                self.price_history.append_year(self.current_year, self.fleet.ordered_names(), self.fleet.price[self.fleet.order()])
+                self.fleet.age_one_year()
+            else:
+                names, prices = [], []
+                for category in [self.luxury_cars, self.sports_cars, self.economy_cars]:
+                    for car in category.values():
+                        car.depreciate()
+                        self.market.apply_trends(car)
+                        names.append(car.name)
+                        prices.append(car.price)
+                        car.age += 1  # Increase the age of each car by 1 year
+                self.price_history.append_year(self.current_year, names, prices)
+
+            self.catalog.invalidate()  # Every price has changed
+        with profiler.phase("ai_turn"):
+            if self.competitor_scheduler is not None:
+                self.competitor_scheduler.run(self)
+            else:
+                for competitor in self.ai_competitors:
+                    self.ai_turn(competitor)
+        self.inventory.reprice_all()  # Events, trends and sabotage have all moved prices
+
+        with profiler.phase("calculate_profit"):
+            net_profit = self.calculate_profit(maintenance_costs)
+        profiler.end_year(self.current_year)
+        return {
+            "year": self.current_year,
+            "event": ", ".join(event["event"] for event in events),
+            "money": self.money,
+            "reputation": self.reputation,
+            "fleet_value": sum(car.price for car in self.owned.values()),
+            "maintenance_costs": maintenance_costs,
+            "net_profit": net_profit,
+            "taxes_due": self.financial_manager.taxes_due,
+            "market_trends": dict(self.market.market_trends),
+        }
+
+    def run_years(self, years):
+        """Advances the game headlessly (no prompts, sleeps or console output)
+        and returns the per-year results of advance_year()."""
+        with headless():
+            return [self.advance_year() for _ in range(years)]
+
+    def calculate_maintenance_costs(self):
+        total_cost = 0
+        for carname, car in self.owned.items():
+            maintenance_cost = car.maintain(self.current_year)
+            total_cost += maintenance_cost
+            self.expense_history.append({"type": "maintenance", "amount": maintenance_cost, "car": carname, "year": self.current_year})
+        return total_cost
+
+    def calculate_profit(self, maintenance_costs):
+        total_income = self.income_history.total(self.current_year)
+        total_expenses = self.expense_history.total(self.current_year)
+        net_profit = total_income - total_expenses
+        self.financial_manager.calculate_taxes(net_profit)
+        return net_profit
+
+    def random_event(self):
+        return self.random_events()[0]
+
+    def random_events(self):
+        # Draws events_per_year events from the engine's table and applies each in turn
+        events = self.event_engine.draw(self.events_per_year)
+        for event in events:
+            console.print(f"[magenta]Random event this year: [yellow]{event['event']}")
+            console.print(f"[yellow]{event['description']}")
+            self.event_engine.apply(event, self)
+        return events
+
+    def ai_turn(self, competitor):
+        competitor.expand_business()
+        competitor.steal_customer(self.customers)
+        competitor.sabotage(self)
+        if random.choice([True, False]):
+            segment = random.choice(range(len(SEGMENTS)))
+            available_cars = [self.luxury_cars, self.sports_cars, self.economy_cars][segment]
+            if self.fleet is not None:
+                # Same candidates, in the same order, straight from the fleet columns
+                order = self.fleet.order()
+                rows = order[(self.fleet.segment[order] == segment) & ~self.fleet.sold[order]]
+                if len(rows):
+                    competitor.buy_car(self.fleet.cars[random.choice(rows)])
+                return
+            available_cars = [car for car in available_cars.values() if not car.sold]
+            if available_cars:
+                car = random.choice(available_cars)
+                competitor.buy_car(car)
+        else:
+            if competitor.owned_cars:
+                car = random.choice(list(competitor.owned_cars.values()))
+                competitor.sell_car(car)
+
+    def save_journal(self, slot):
+        # One long-lived journal (and SQLite connection) per slot, shared
+        # with any other game saving to the same file
+        if slot not in self.save_journals:
+            self.save_journals[slot] = SaveJournal.open(f'car_dealership_save_{slot}.db')
+        return self.save_journals[slot]
+
+    def save_to_slot(self, slot):
+        return self.save_journal(slot).save(self)
+
+    def load_from_slot(self, slot, year=None):
+        """Loads the slot's latest save, or its latest save made in year."""
+        if self.recorder is not None:
+            # A replay can't reproduce the loaded state from the log's seed
+            console.print(f"[yellow]Stopped recording to {self.recorder.path}: loaded games can't be replayed.")
+            self.stop_recording()
+        journal = self.save_journal(slot)
+        if journal.load(self, year):
+            return True
+        return year is None and self.load_legacy_save(journal.conn)
+
+    def slot_snapshots(self, slot):
+        return self.save_journal(slot).snapshots()
+
+    def load_legacy_save(self, conn):
+        # Saves written before the journal stored one full row per save
+        if not conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'game_state'").fetchone():
+            return False
+        row = conn.execute("SELECT * FROM game_state ORDER BY id DESC LIMIT 1").fetchone()
+        if not row:
+            return False
+        self.money = row[1]
+        self.current_year = row[2]
+        self.owned = {name: Car.from_dict(car) for name, car in json.loads(row[3]).items()}
+        self.price_history = PriceHistory.from_dict(json.loads(row[4]), self.current_year)
+        self.income_history = Ledger(json.loads(row[5]))
+        self.expense_history = Ledger(json.loads(row[6]))
+        self.ai_competitors = [AICompetitor.from_dict(dict(data, name=name)) for name, data in json.loads(row[7]).items()]
+        self.employees = [Employee(**emp) for emp in json.loads(row[8])]
+        return True
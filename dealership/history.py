@@ -0,0 +1,140 @@
+import os
+from .lazy import np
+
+# Columnar Price History
+class PriceHistory:
+    """Price history stored as one float64 row per simulated year, with a
+    column per car (NaN where a car had no price that year). Rows are
+    never modified once written, and with spill_dir set each one is moved
+    to a memory-mapped .npy file instead of being kept in memory."""
+    def __init__(self, spill_dir=None):
+        self.names = []  # Column -> car name
+        self.columns = {}  # Car name -> column
+        self.years = []  # Row -> year
+        self.rows = []
+        self.row_of = {}  # Year -> row
+        self.spill_dir = spill_dir
+        self._last_names = None
+        self._last_columns = None
+
+    @classmethod
+    def from_dict(cls, histories, last_year):
+        # Builds the store from {name: [prices]} lists that all end at last_year
+        store = cls()
+        store.add_names(list(histories))
+        length = max((len(prices) for prices in histories.values()), default=0)
+        for offset in range(length):
+            row = np.full(len(store.names), np.nan)
+            for column, prices in enumerate(histories.values()):
+                index = offset - (length - len(prices))
+                if index >= 0:
+                    row[column] = prices[index]
+            store.add_row(last_year - length + 1 + offset, row)
+        return store
+
+    def fork(self):
+        # Rows are never modified, so the copy shares them. New rows of a
+        # fork stay in memory, so its spill files can't clash with ours.
+        store = object.__new__(PriceHistory)
+        store.__dict__.update(self.__dict__)
+        store.names, store.columns = list(self.names), dict(self.columns)
+        store.years, store.rows, store.row_of = list(self.years), list(self.rows), dict(self.row_of)
+        store.spill_dir = None
+        return store
+
+    def add_names(self, names):
+        # Every name gets a column of its own, repeated ones too, since cars in
+        # different segments can share a name. Lookups by name find the first.
+        for name in names:
+            self.columns.setdefault(name, len(self.names))
+            self.names.append(name)
+
+    def column_indices(self, names):
+        if names is self._last_names:
+            return self._last_columns
+        known = len(self.names)
+        if len(names) >= known and names[:known] == self.names:
+            self.add_names(names[known:])
+            columns = None  # Same order as the store, no scatter needed
+        else:
+            # The k-th car with a name gets the k-th column with that name
+            columns_of = {}
+            for column, name in enumerate(self.names):
+                columns_of.setdefault(name, []).append(column)
+            seen = {}
+            columns = np.empty(len(names), dtype=np.int64)
+            for index, name in enumerate(names):
+                occurrence = seen[name] = seen.get(name, -1) + 1
+                candidates = columns_of.setdefault(name, [])
+                if occurrence == len(candidates):
+                    candidates.append(len(self.names))
+                    self.add_names([name])
+                columns[index] = candidates[occurrence]
+        self._last_names, self._last_columns = names, columns
+        return columns
+
+    def append_year(self, year, names, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        columns = self.column_indices(names)
+        if columns is None and len(prices) == len(self.names):
+            row = prices.copy()
+        else:
+            row = np.full(len(self.names), np.nan)
+            row[columns if columns is not None else slice(0, len(prices))] = prices
+        self.add_row(year, row)
+
+    def add_row(self, year, row):
+        if self.spill_dir:
+            path = os.path.join(self.spill_dir, f"prices_{len(self.rows):06d}.npy")
+            np.save(path, row)
+            row = np.load(path, mmap_mode="r")
+        self.row_of[year] = len(self.rows)
+        self.years.append(year)
+        self.rows.append(row)
+
+    def year_prices(self, year):
+        # Prices of every car in the given year, in column order
+        row = self.rows[self.row_of[year]]
+        if len(row) < len(self.names):
+            row = np.concatenate([row, np.full(len(self.names) - len(row), np.nan)])
+        return row
+
+    def prices(self, name, start_year=None, end_year=None):
+        # Prices of one car for the years in [start_year, end_year], NaN where missing
+        column = self.columns[name]
+        rows = [self.rows[self.row_of[year]] for year in self.years
+                if (start_year is None or year >= start_year) and (end_year is None or year <= end_year)]
+        return np.array([row[column] if column < len(row) else np.nan for row in rows])
+
+    def recent(self, years):
+        # (name, [prices]) for every car over the last few years
+        rows = self.rows[-years:]
+        if not rows:
+            return []
+        table = np.full((len(rows), len(self.names)), np.nan)
+        for i, row in enumerate(rows):
+            table[i, :len(row)] = row
+        return [(name, [price for price in column if price == price])
+                for name, column in zip(self.names, table.T.tolist())]
+
+    # Read-only mapping view, for code that expects {name: [prices]}
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, name):
+        return [price for price in self.prices(name).tolist() if price == price]
+
+    def get(self, name, default=None):
+        return self[name] if name in self.columns else default
+
+    def items(self):
+        return self.recent(len(self.rows))
+
+    def to_dict(self):
+        return dict(self.items())
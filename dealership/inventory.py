@@ -0,0 +1,169 @@
+import bisect
+from .display import console
+
+# Inventory Management
+class Inventory:
+    """Cars keyed by id, with indexes by location, name, segment, condition
+    and price band so that adds, moves, removals and lookups don't scan.
+    Locations below low_stock_threshold are tracked as cars come and go."""
+    def __init__(self, locations=("Showroom", "Warehouse"), low_stock_threshold=5, price_band_width=50_000):
+        self.low_stock_threshold = low_stock_threshold
+        self.price_band_width = price_band_width
+        self.cars = {}  # Car id -> car
+        self.location_of = {}  # Car id -> location
+        self.locations = {}  # Location -> {car id: car}
+        self.by_name = {}  # (location, name) -> {car id: car}
+        self.by_segment = {}
+        self.by_condition = {}
+        self.by_price_band = {}
+        self.band_of = {}  # Car id -> price band it is indexed under
+        self.bands = []  # Sorted band numbers, for price range queries
+        self.low_stock = set()
+        for location in locations:
+            self.add_location(location)
+
+    def fork(self, cars):
+        # Same indexes over the fork's copies of the cars (cars maps a car to its copy)
+        inventory = object.__new__(Inventory)
+        inventory.__dict__.update(self.__dict__)
+        copies = {car_id: cars(car) for car_id, car in self.cars.items()}
+
+        def rekey(mapping):
+            return {id(copies[car_id]): value for car_id, value in mapping.items()}
+
+        inventory.cars = rekey(copies)
+        inventory.location_of = rekey(self.location_of)
+        inventory.band_of = rekey(self.band_of)
+        for index in ("locations", "by_name", "by_segment", "by_condition", "by_price_band"):
+            setattr(inventory, index, {key: {id(copies[car_id]): copies[car_id] for car_id in bucket}
+                                       for key, bucket in getattr(self, index).items()})
+        inventory.bands = list(self.bands)
+        inventory.low_stock = set(self.low_stock)
+        return inventory
+
+    def add_location(self, location):
+        if location not in self.locations:
+            self.locations[location] = {}
+            self.low_stock.add(location)
+
+    def _index(self, index, key, car):
+        index.setdefault(key, {})[id(car)] = car
+
+    def _unindex(self, index, key, car):
+        bucket = index[key]
+        del bucket[id(car)]
+        if not bucket:
+            del index[key]
+
+    def _band(self, price):
+        return int(price // self.price_band_width)
+
+    def _update_stock(self, location):
+        if len(self.locations[location]) < self.low_stock_threshold:
+            self.low_stock.add(location)
+        else:
+            self.low_stock.discard(location)
+
+    def _place(self, location, car):
+        car_id = id(car)
+        self.location_of[car_id] = location
+        self.locations[location][car_id] = car
+        self._index(self.by_name, (location, car.name), car)
+        self._update_stock(location)
+
+    def _unplace(self, car):
+        car_id = id(car)
+        location = self.location_of.pop(car_id)
+        del self.locations[location][car_id]
+        self._unindex(self.by_name, (location, car.name), car)
+        self._update_stock(location)
+        return location
+
+    def add_car(self, location, car):
+        if location not in self.locations:
+            console.print("[red]Invalid location!")
+        elif id(car) in self.cars:
+            console.print(f"[red]{car.name} is already in the inventory.")
+        else:
+            self.cars[id(car)] = car
+            self._place(location, car)
+            self._index(self.by_segment, car.segment, car)
+            self._index(self.by_condition, car.condition, car)
+            band = self.band_of[id(car)] = self._band(car.price)
+            if band not in self.by_price_band:
+                bisect.insort(self.bands, band)
+            self._index(self.by_price_band, band, car)
+            console.print(f"[green]Added {car.name} to {location}.")
+
+    def remove_car(self, car):
+        car_id = id(car)
+        if car_id not in self.cars:
+            return None
+        del self.cars[car_id]
+        location = self._unplace(car)
+        self._unindex(self.by_segment, car.segment, car)
+        self._unindex(self.by_condition, car.condition, car)
+        self._remove_from_band(car)
+        return location
+
+    def _remove_from_band(self, car):
+        band = self.band_of.pop(id(car))
+        self._unindex(self.by_price_band, band, car)
+        if band not in self.by_price_band:
+            del self.bands[bisect.bisect_left(self.bands, band)]
+
+    def move_car(self, from_location, to_location, car_name):
+        if from_location in self.locations and to_location in self.locations:
+            matches = self.by_name.get((from_location, car_name))
+            if matches:
+                car = next(iter(matches.values()))
+                # Move the car and remove from original location
+                self._unplace(car)
+                self._place(to_location, car)
+                console.print(f"[green]Moved {car.name} from {from_location} to {to_location}.")
+            else:
+                console.print(f"[red]{car_name} not found in {from_location}.")
+        else:
+            console.print("[red]Invalid location!")
+
+    def reprice(self, car):
+        # Re-files a car whose price has changed under its new price band
+        if id(car) in self.cars and self._band(car.price) != self.band_of[id(car)]:
+            self._remove_from_band(car)
+            band = self.band_of[id(car)] = self._band(car.price)
+            if band not in self.by_price_band:
+                bisect.insort(self.bands, band)
+            self._index(self.by_price_band, band, car)
+
+    def reprice_all(self):
+        # Re-files every car after a round of price changes, like the yearly update
+        for car in self.cars.values():
+            self.reprice(car)
+
+    def cars_at(self, location):
+        return list(self.locations.get(location, {}).values())
+
+    def cars_in_segment(self, segment):
+        return list(self.by_segment.get(segment, {}).values())
+
+    def cars_with_condition(self, condition):
+        return list(self.by_condition.get(condition, {}).values())
+
+    def cars_in_price_range(self, low, high):
+        first = bisect.bisect_left(self.bands, self._band(low))
+        last = bisect.bisect_right(self.bands, self._band(high))
+        return [car for band in self.bands[first:last]
+                for car in self.by_price_band[band].values() if low <= car.price <= high]
+
+    def low_stock_locations(self):
+        return set(self.low_stock)
+
+    def check_inventory(self, listing_limit=10):
+        for location, cars in self.locations.items():
+            console.print(f"[bold yellow]{location}: {len(cars)} cars")
+            if len(cars) <= listing_limit:
+                for car in cars.values():
+                    # Display each car
+                    console.print(f" - {car.name}")
+        for location in self.low_stock:
+            console.print(f"[red]Low stock alert at {location}!")
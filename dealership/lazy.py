@@ -0,0 +1,36 @@
+import importlib
+
+# Deferred imports, so the domain layer loads without numpy or Rich
+class LazyImport:
+    """Stands in for a module, or for one attribute of a module, and only
+    imports it on first use. Attributes looked up through a module stand-in
+    are cached on it, so later lookups cost the same as on the module."""
+    def __init__(self, module, attribute=None):
+        self._module = module
+        self._attribute = attribute
+        self._target = None
+
+    def _load(self):
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            if self._attribute is not None:
+                target = getattr(target, self._attribute)
+            self._target = target
+        return self._target
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in ("_module", "_attribute", "_target"):
+            raise AttributeError(name)
+        value = getattr(self._load(), name)
+        if self._attribute is None:
+            setattr(self, name, value)
+        return value
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<lazy {self._module}{'.' + self._attribute if self._attribute else ''}>"
+
+np = LazyImport("numpy")
+Prompt = LazyImport("rich.prompt", "Prompt")
@@ -0,0 +1,139 @@
+import copy
+import random
+from collections.abc import MutableMapping
+from .cars import SEGMENTS
+from .display import console
+from .lazy import np
+
+def correlation_matrix(size, correlation):
+    # A full matrix is used as given; a number means that correlation between every pair
+    if np.ndim(correlation) == 2:
+        return np.asarray(correlation, dtype=np.float64)
+    return np.full((size, size), float(correlation)) + (1 - float(correlation)) * np.eye(size)
+
+class SegmentTrends(MutableMapping):
+    """The first region's {segment: factor}, read from and written through
+    to a Market, so market_trends[segment] *= change still moves the market."""
+    def __init__(self, market):
+        self.market = market
+
+    def __getitem__(self, segment):
+        return self.market._rows[0][self.market.segment_codes[segment]]
+
+    def __setitem__(self, segment, factor):
+        self.market.set_trend(segment, factor)
+
+    def __delitem__(self, segment):
+        raise TypeError("Market segments can't be removed.")
+
+    def __iter__(self):
+        return iter(self.market.segments)
+
+    def __len__(self):
+        return len(self.market.segments)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+# Market Class with Seasonal and Trend Influences
+class Market:
+    """Trend factors for every (region, segment) pair, moved each year by a
+    correlated random walk on their logs. The walk's covariance is
+    kron(region correlation, volatility**2 * segment correlation), so one
+    step is L_r @ Z @ L_s.T for a standard normal Z and the two Cholesky
+    factors, without ever building the full covariance matrix. Cars look
+    up their factor by segment and region code; a car without a region is
+    in the first one, and unknown segments or regions aren't affected."""
+    def __init__(self, regions=("National",), segments=SEGMENTS, volatility=0.03, region_correlation=0.5,
+                 segment_correlation=0.3, drift=0.0, seed=None):
+        self.regions = tuple(regions)
+        self.segments = tuple(segments)
+        self.region_codes = {name: code for code, name in enumerate(self.regions)}
+        self.segment_codes = {name: code for code, name in enumerate(self.segments)}
+        self.region_factor = np.linalg.cholesky(correlation_matrix(len(self.regions), region_correlation))
+        self.segment_factor = volatility * np.linalg.cholesky(correlation_matrix(len(self.segments), segment_correlation))
+        self.drift = drift
+        self.seed = seed
+        self.rng = None  # Seeded from random on first use, so a seeded game replays the same walk
+        self.log_trends = np.zeros((len(self.regions), len(self.segments)))
+        self._set_trends()
+
+    def fork(self):
+        market = object.__new__(Market)
+        market.__dict__.update(self.__dict__)
+        market.log_trends = self.log_trends.copy()
+        market.rng = copy.deepcopy(self.rng)
+        market._set_trends()
+        return market
+
+    def _set_trends(self):
+        self.trends = np.exp(self.log_trends)
+        self._rows = self.trends.tolist()
+
+    @property
+    def market_trends(self):
+        """{segment: factor} for the first region; changes write back."""
+        return SegmentTrends(self)
+
+    @market_trends.setter
+    def market_trends(self, trends):
+        for segment, factor in trends.items():
+            self.set_trend(segment, factor)
+
+    def set_trend(self, segment, factor, region=None):
+        # Unknown segments or regions raise KeyError rather than being ignored
+        row = 0 if region is None else self.region_codes[region]
+        self.log_trends[row, self.segment_codes[segment]] = np.log(factor)
+        self._set_trends()
+
+    def covariance(self):
+        # The full (regions * segments) square matrix, for inspection only
+        region_cov = self.region_factor @ self.region_factor.T
+        segment_cov = self.segment_factor @ self.segment_factor.T
+        return np.kron(region_cov, segment_cov)
+
+    def steps(self, count):
+        """count correlated log-steps, shape (count, regions, segments)."""
+        if self.rng is None:
+            self.rng = np.random.default_rng(random.getrandbits(64) if self.seed is None else self.seed)
+        shape = (count, len(self.regions), len(self.segments))
+        # Segments first as one flat matmul, then regions across the stack
+        noise = self.rng.standard_normal(shape).reshape(-1, shape[2]) @ self.segment_factor.T
+        steps = self.region_factor @ noise.reshape(shape)
+        if self.drift:
+            steps += self.drift
+        return steps
+
+    def update_market(self):
+        self.log_trends += self.steps(1)[0]
+        self._set_trends()
+        if self.trends.size <= len(SEGMENTS):
+            for segment, factor in self.market_trends.items():
+                console.print(f"[yellow]The market trend for {segment} cars is now {factor:.2f}.")
+        else:
+            console.print(f"[yellow]Market trends across {len(self.regions)} regions and {len(self.segments)} segments "
+                          f"now range from {self.trends.min():.2f} to {self.trends.max():.2f}.")
+
+    def simulate(self, years):
+        """Advances the walk by years in one batch and returns every year's
+        trend factors, shape (years, regions, segments)."""
+        paths = self.log_trends + np.cumsum(self.steps(years), axis=0)
+        if years:
+            self.log_trends = paths[-1].copy()
+            self._set_trends()
+        return np.exp(paths)
+
+    def region_code(self, region):
+        return 0 if region is None else self.region_codes.get(region, -1)
+
+    def trend_factors(self, segment_codes, region_codes):
+        """Factors for arrays of segment and region codes; -1 codes get 1.0."""
+        segment_codes, region_codes = np.asarray(segment_codes), np.asarray(region_codes)
+        known = (segment_codes >= 0) & (region_codes >= 0)
+        return np.where(known, self.trends[np.maximum(region_codes, 0), np.maximum(segment_codes, 0)], 1.0)
+
+    def apply_trends(self, car):
+        segment, region = self.segment_codes.get(car.segment, -1), self.region_code(car.region)
+        if segment >= 0 and region >= 0:
+            car.price *= self._rows[region][segment]
+        car.price = max(500, round(car.price, 2))
@@ -0,0 +1,62 @@
+import random
+from .display import headless
+from .game import DealershipGame
+from .lazy import np
+from .optimizer import Policy
+
+# Monte Carlo Analysis
+MONTE_CARLO_METRICS = ("money", "reputation", "fleet_value", "taxes_due")
+
+def run_trajectories(seed, start, stop, years, policy=None, setup=None):
+    """Runs trajectories start..stop-1 headlessly and returns their per-year
+    metrics as an array of shape (trajectories, years, metrics). Each game
+    is passed to setup(game) if given, then played by a fresh Policy built
+    from the policy parameters, which acts before every year."""
+    results = np.empty((stop - start, years, len(MONTE_CARLO_METRICS)))
+    for offset, index in enumerate(range(start, stop)):
+        # Every trajectory gets its own stream, so results don't depend on
+        # which worker ran it or in what order
+        random.seed(f"{seed}-{index}")
+        game = DealershipGame()
+        if setup is not None:
+            setup(game)
+        player = Policy(**(policy or {}))
+        with headless():
+            for year in range(years):
+                player.act(game)
+                result = game.advance_year()
+                results[offset, year] = [result[metric] for metric in MONTE_CARLO_METRICS]
+    return start, stop, results
+
+def run_monte_carlo(trajectories=10_000, years=50, seed=0, workers=None, batch_size=50,
+                    percentiles=(5, 25, 50, 75, 95), on_batch=None, policy=None, setup=None):
+    """Runs many independent seeded games across a process pool and returns
+    per-year percentile bands for each metric in MONTE_CARLO_METRICS.
+
+    The player in every game is an optimizer Policy: policy is a Policy or
+    a dict of its parameters (the defaults when None). setup, if given, is
+    called with each new game before the first year and must be picklable,
+    e.g. a module-level function. Workers only send back arrays of per-year
+    metrics. on_batch, if given, is called as on_batch(start, stop, results)
+    as each batch arrives."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    if isinstance(policy, Policy):
+        policy = policy.params
+    results = np.empty((trajectories, years, len(MONTE_CARLO_METRICS)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_trajectories, seed, start, min(start + batch_size, trajectories), years, policy, setup)
+            for start in range(0, trajectories, batch_size)
+        ]
+        for future in as_completed(futures):
+            start, stop, batch = future.result()
+            results[start:stop] = batch
+            if on_batch:
+                on_batch(start, stop, batch)
+
+    bands = {}
+    for index, metric in enumerate(MONTE_CARLO_METRICS):
+        levels = np.percentile(results[:, :, index], percentiles, axis=0)
+        bands[metric] = {f"p{p}": levels[i] for i, p in enumerate(percentiles)}
+    first_year = DealershipGame().current_year + 1
+    return {"years": list(range(first_year, first_year + years)), "bands": bands, "results": results}
@@ -0,0 +1,160 @@
+import random
+from .cars import SEGMENTS
+from .display import headless
+from .game import MARKETING_CAMPAIGNS, TRAINING_PROGRAMS, DealershipGame
+from .lazy import LazyImport, np
+NormalDist = LazyImport("statistics", "NormalDist")
+
+# Player Policies
+# The values each policy parameter is drawn from; see Policy for what they mean
+POLICY_SPACE = {
+    "buy_discount": (0.0, 0.05, 0.1, 0.2, 0.3),
+    "buy_segments": (("Luxury",), ("Sports",), ("Economy",), ("Sports", "Economy"), SEGMENTS),
+    "max_owned": (1, 3, 5, 10),
+    "sell_markup": (-0.1, 0.0, 0.1, 0.25),
+    "hold_years": (1, 2, 3, 5),
+    "modify": (None, "performance", "luxury", "efficiency"),
+    "modify_segments": (("Sports",), ("Luxury",), SEGMENTS),
+    "loan": (0, 100_000, 500_000),
+    "campaign": (None,) + tuple(range(len(MARKETING_CAMPAIGNS))),
+    "training": (None,) + tuple(range(len(TRAINING_PROGRAMS))),
+}
+
+class Policy:
+    """A parameterized player that acts once at the start of every year:
+    buys unsold cars in buy_segments once their price is buy_discount below
+    base_price (up to max_owned cars), sells a car once it is worth
+    sell_markup more than it cost or has been held hold_years, applies the
+    modify upgrade to owned cars in modify_segments, takes a loan in the
+    first year, and runs a marketing campaign and a training program
+    (indexes into MARKETING_CAMPAIGNS and TRAINING_PROGRAMS) when it can
+    afford them. Actions go through the DealershipGame player methods."""
+    def __init__(self, **params):
+        unknown = params.keys() - POLICY_SPACE.keys()
+        if unknown:
+            raise ValueError(f"Unknown policy parameters: {', '.join(sorted(unknown))}")
+        self.params = {name: values[0] for name, values in POLICY_SPACE.items()}
+        self.params.update(params)
+        self.bought = {}  # Car name -> (price paid, year bought)
+        self.start_year = None
+
+    def __repr__(self):
+        changed = ", ".join(f"{name}={value!r}" for name, value in self.params.items()
+                            if value != POLICY_SPACE[name][0])
+        return f"Policy({changed})"
+
+    def act(self, game):
+        p = self.params
+        if self.start_year is None:
+            self.start_year = game.current_year
+        if p["loan"] and game.current_year == self.start_year:
+            game.take_loan(p["loan"], 5.0, 5)
+        for name, car in list(game.owned.items()):
+            paid, year = self.bought.get(name, (car.price, game.current_year))
+            if car.price >= paid * (1 + p["sell_markup"]) or game.current_year - year >= p["hold_years"]:
+                game.sell(name)
+                self.bought.pop(name, None)
+        categories = dict(zip(SEGMENTS, (game.luxury_cars, game.sports_cars, game.economy_cars)))
+        for segment in p["buy_segments"]:
+            for car in list(categories[segment].values()):
+                if len(game.owned) >= p["max_owned"]:
+                    break
+                if not car.sold and car.price <= car.base_price * (1 - p["buy_discount"]) and car.price <= game.money:
+                    paid = game.purchase(car)
+                    if paid is not None:
+                        self.bought[car.name] = (paid, game.current_year)
+        if p["modify"]:
+            for name, car in game.owned.items():
+                if car.segment in p["modify_segments"] and p["modify"] not in car.customizations:
+                    game.upgrade(name, p["modify"])
+        if p["campaign"] is not None and game.money >= 2 * MARKETING_CAMPAIGNS[p["campaign"]].cost:
+            game.launch_campaign(p["campaign"])
+        if p["training"] is not None and game.employees and game.money >= 2 * TRAINING_PROGRAMS[p["training"]].cost:
+            game.train_employee(game.current_year % len(game.employees), p["training"])
+
+    def run(self, game, years):
+        with headless():
+            for _ in range(years):
+                self.act(game)
+                game.advance_year()
+        return net_worth(game)
+
+def net_worth(game):
+    """Money plus the value of owned cars, less outstanding loans and taxes due."""
+    loans = game.financial_manager.loan_book
+    return (game.money + sum(car.price for car in game.owned.values())
+            - float(loans.outstanding[:loans.count].sum()) - game.financial_manager.taxes_due)
+
+def sample_policies(count, rng=None):
+    """count distinct parameter sets drawn uniformly from POLICY_SPACE."""
+    rng = rng or random.Random()
+    size = int(np.prod([len(values) for values in POLICY_SPACE.values()]))
+    picks = rng.sample(range(size), min(count, size))
+    policies = []
+    for pick in picks:
+        params = {}
+        for name, values in POLICY_SPACE.items():
+            pick, index = divmod(pick, len(values))
+            params[name] = values[index]
+        policies.append(params)
+    return policies
+
+def evaluate_policies(candidates, seed, start, stop, years):
+    """Scores every parameter set on the seeded games start..stop-1 and
+    returns an array of shape (candidates, games). Every candidate plays
+    the same games, so differences come from the policies."""
+    scores = np.empty((len(candidates), stop - start))
+    for row, params in enumerate(candidates):
+        for column, index in enumerate(range(start, stop)):
+            random.seed(f"{seed}-{index}")
+            scores[row, column] = Policy(**params).run(DealershipGame(), years)
+    return scores
+
+# Successive Halving Search
+def optimize_policies(candidates=1000, years=10, seed=0, min_games=4, max_games=64, eta=3, top=5,
+                      confidence=0.95, workers=None, batch_size=10, on_round=None):
+    """Searches for the best Policy parameters. candidates is a count to
+    sample from POLICY_SPACE or a list of parameter dicts. Every round plays
+    the surviving candidates on more seeded games (min_games, then eta times
+    as many, up to max_games) across a process pool, drops every candidate
+    whose confidence interval lies wholly below that of the top-th best, and
+    keeps at most 1/eta of the field. Returns the top candidates, best
+    first, with their mean net worth and confidence interval.
+
+    on_round, if given, is called as on_round(games, alive, dropped) after
+    each round that prunes the field, where dropped counts every candidate
+    the round removed."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    if isinstance(candidates, int):
+        candidates = sample_policies(candidates, random.Random(seed))
+    scores = np.full((len(candidates), max_games), np.nan)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    alive, played, games = list(range(len(candidates))), 0, min(min_games, max_games)
+
+    def interval(index):
+        values = scores[index, :played]
+        half = z * values.std(ddof=1) / np.sqrt(len(values)) if len(values) > 1 else np.inf
+        return values.mean(), values.mean() - half, values.mean() + half
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            futures = {pool.submit(evaluate_policies, [candidates[i] for i in batch], seed, played, games, years): batch
+                       for batch in (alive[start:start + batch_size] for start in range(0, len(alive), batch_size))}
+            for future in as_completed(futures):
+                scores[futures[future], played:games] = future.result()
+            played = games
+            stats = {index: interval(index) for index in alive}
+            if len(alive) <= top or played >= max_games:
+                break
+            ranked = sorted(alive, key=lambda index: stats[index][0], reverse=True)
+            bar = stats[ranked[top - 1]][1]
+            survivors = [index for index in ranked if stats[index][2] >= bar]
+            kept = survivors[:max(top, len(alive) // eta)]
+            dropped, alive = len(alive) - len(kept), kept
+            games = min(max_games, games * eta)
+            if on_round:
+                on_round(played, len(alive), dropped)
+
+    ranked = sorted(alive, key=lambda index: stats[index][0], reverse=True)[:top]
+    return [{"params": candidates[index], "mean": stats[index][0], "low": stats[index][1], "high": stats[index][2],
+             "games": played} for index in ranked]
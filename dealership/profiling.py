@@ -0,0 +1,99 @@
+import os
+import time
+from .lazy import LazyImport
+json = LazyImport("json")
+
+# Opt-in profiling of game phases and hot calls
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_PHASE = _NullPhase()
+
+class _Phase:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats[0] += 1
+        self.stats[1] += time.perf_counter() - self.start
+        return False
+
+class Profiler:
+    """Times named phases (with profiler.phase("name"): ...) and counts calls
+    to format_price and console.print. Disabled, phase() hands back a shared
+    no-op context manager and the counters are a single flag check. Totals
+    are cumulative and can be exported after each simulated year as JSON or
+    Prometheus text."""
+    def __init__(self):
+        self.enabled = False
+        self.phases = {}  # Phase name -> [calls, seconds]
+        self.counts = {}  # Function name -> calls
+        self.export_path = None
+        self.export_format = "json"
+        self.year = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return NULL_PHASE
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = [0, 0.0]
+        return _Phase(stats)
+
+    def count(self, name):
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def enable(self, export_path=None, export_format="json"):
+        if export_format not in ("json", "prometheus"):
+            raise ValueError("export_format must be 'json' or 'prometheus'")
+        self.export_path, self.export_format = export_path, export_format
+        self.enabled = True
+        return self
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.phases.clear()
+        self.counts.clear()
+
+    def snapshot(self):
+        return {"year": self.year,
+                "phases": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self.phases.items()},
+                "counts": dict(self.counts)}
+
+    def to_prometheus(self):
+        lines = ["# TYPE dealership_phase_seconds_total counter"]
+        lines += [f'dealership_phase_seconds_total{{phase="{name}"}} {seconds:.9f}' for name, (calls, seconds) in self.phases.items()]
+        lines.append("# TYPE dealership_phase_calls_total counter")
+        lines += [f'dealership_phase_calls_total{{phase="{name}"}} {calls}' for name, (calls, seconds) in self.phases.items()]
+        lines.append("# TYPE dealership_calls_total counter")
+        lines += [f'dealership_calls_total{{function="{name}"}} {calls}' for name, calls in self.counts.items()]
+        if self.year is not None:
+            lines += ["# TYPE dealership_year gauge", f"dealership_year {self.year}"]
+        return "\n".join(lines) + "\n"
+
+    def end_year(self, year):
+        """Called once per simulated year; writes the export file if one is set."""
+        if not self.enabled:
+            return
+        self.year = year
+        if self.export_path:
+            text = self.to_prometheus() if self.export_format == "prometheus" else json.dumps(self.snapshot(), indent=2)
+            # Write then rename so a scraper never sees a half-written file
+            partial = self.export_path + ".tmp"
+            with open(partial, "w") as f:
+                f.write(text)
+            os.replace(partial, self.export_path)
+
+profiler = Profiler()
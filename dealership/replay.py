@@ -0,0 +1,66 @@
+import random
+from .actionlog import read_action_log
+from .display import headless
+from .game import DealershipGame
+
+# Session Replay
+class Replay:
+    """Plays an action log recorded with DealershipGame.start_recording()
+    back through the same game methods, headlessly and without prompts.
+    run(stop) stops before action number stop so the game can be inspected;
+    a later run() carries on from there, or starts over if stop is earlier.
+    The replay keeps its own random state between runs, so whatever the
+    caller does with random in between doesn't change the outcome."""
+    def __init__(self, path, game_class=DealershipGame):
+        self.path = path
+        self.seed, self.actions = read_action_log(path)
+        self.game_class = game_class
+        self.game = None
+        self.position = 0
+        self.random_state = None
+
+    def __len__(self):
+        return len(self.actions)
+
+    def restart(self):
+        self.game = self.game_class()
+        self.position = 0
+        self.random_state = random.Random(self.seed).getstate()
+        return self.game
+
+    def apply(self, action, args):
+        game = self.game
+        if action == "purchase":
+            segment, name = args
+            game.purchase([game.luxury_cars, game.sports_cars, game.economy_cars][segment][name])
+        else:
+            getattr(game, action)(*args)
+
+    def run(self, stop=None):
+        """Replays up to (not including) action number stop, or to the end,
+        and returns the game."""
+        stop = len(self.actions) if stop is None else min(stop, len(self.actions))
+        if self.game is None or stop < self.position:
+            self.restart()
+        outer_state = random.getstate()
+        random.setstate(self.random_state)
+        try:
+            with headless():
+                while self.position < stop:
+                    self.apply(*self.actions[self.position])
+                    self.position += 1
+        finally:
+            self.random_state = random.getstate()
+            random.setstate(outer_state)
+        return self.game
+
+    def step(self, count=1):
+        return self.run(self.position + count)
+
+    def next_action(self):
+        """The (action, args) the next run() or step() will apply, or None at the end."""
+        return self.actions[self.position] if self.position < len(self.actions) else None
+
+def replay(path, stop=None, game_class=DealershipGame):
+    """Returns the game as it was after the first stop actions of the log at path."""
+    return Replay(path, game_class).run(stop)
@@ -0,0 +1,274 @@
+import os
+from .business import Employee
+from .cars import Car
+from .competitors import AICompetitor
+from .finance import Ledger
+from .history import PriceHistory
+from .lazy import LazyImport, np
+json = LazyImport("json")
+sqlite3 = LazyImport("sqlite3")
+datetime = LazyImport("datetime", "datetime")
+
+# Journaled Save Files
+class SaveJournal:
+    """Append-only save file for one slot. Each save writes only the records
+    that changed since the previous save or load; every compact_every saves
+    the whole state is written out as a fresh checkpoint. Any save can be
+    loaded back by replaying its checkpoint plus the deltas up to it, found
+    through the year index. Saves older than keep_years are dropped a whole
+    checkpoint chain at a time, so some older years can outlive the window."""
+    RECORD_SECTIONS = ("owned", "ai_competitors", "employees")
+    LIST_SECTIONS = ("income_history", "expense_history")
+    # What a caller can ask read() for, and the record sections each one needs
+    SECTIONS = {"meta": ("meta",), "owned": ("owned", "maintenance"), "ai_competitors": ("ai_competitors",),
+                "employees": ("employees",), "price_history": ("price_history", "price_names"),
+                "income_history": ("income_history",), "expense_history": ("expense_history",)}
+    _open = {}  # Path -> journal, so every game saving to a file shares one connection
+
+    @classmethod
+    def open(cls, path, **kwargs):
+        key = os.path.abspath(path)
+        if key not in cls._open:
+            cls._open[key] = cls(path, **kwargs)
+        return cls._open[key]
+
+    def __init__(self, path, compact_every=25, keep_years=10):
+        self.path = path
+        self.compact_every = compact_every
+        self.keep_years = keep_years
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS saves
+                (id INTEGER PRIMARY KEY, kind TEXT, year INTEGER, money REAL, reputation INTEGER, created TEXT);
+            CREATE TABLE IF NOT EXISTS records
+                (id INTEGER PRIMARY KEY, save_id INTEGER, section TEXT, key TEXT, op TEXT, value TEXT);
+            CREATE INDEX IF NOT EXISTS records_by_save ON records (save_id);
+            CREATE INDEX IF NOT EXISTS saves_by_year ON saves (year, id);
+            CREATE INDEX IF NOT EXISTS saves_by_kind ON saves (kind, id);
+        ''')
+        self.written = None  # What the file holds, as of the last save or load
+        self.tracked = {}  # The history objects that were written, to detect replacements
+        self.saves_since_checkpoint = 0
+
+    def _empty(self):
+        return {"meta": {}, "owned": {}, "maintenance": {}, "ai_competitors": {}, "employees": {},
+                "price_history": {"names": 0, "rows": 0}, "income_history": 0, "expense_history": 0}
+
+    def _diff(self, game, written):
+        rows = []
+        meta = {"money": game.money, "current_year": game.current_year, "reputation": game.reputation}
+        for key, value in meta.items():
+            if key not in written["meta"] or written["meta"][key] != value:
+                rows.append(("meta", key, "set", json.dumps(value)))
+                written["meta"][key] = value
+
+        # Maintenance logs grow every year, so they are journaled like the
+        # histories below rather than re-sent with the owned car's record
+        maintenance = written["maintenance"]
+        tracked_cars = self.tracked.get("owned", {})
+        owned = {}
+        for name, car in game.owned.items():
+            owned[name] = data = car.to_dict()
+            log = data.pop("maintenance_history")
+            if tracked_cars.get(name) is not car:
+                rows.append(("maintenance", name, "set", json.dumps(log)))
+            elif len(log) > maintenance[name]:
+                rows.append(("maintenance", name, "extend", json.dumps(log[maintenance[name]:])))
+            maintenance[name] = len(log)
+        for name in maintenance.keys() - owned.keys():
+            del maintenance[name]
+
+        records = {
+            "owned": owned,
+            "ai_competitors": {comp.name: comp.to_dict() for comp in game.ai_competitors},
+            "employees": {str(i): emp.__dict__ for i, emp in enumerate(game.employees)},
+        }
+        for section, current in records.items():
+            previous = written[section]
+            for key, data in current.items():
+                value = json.dumps(data)
+                if previous.get(key) != value:
+                    rows.append((section, key, "set", value))
+                    previous[key] = value
+            for key in previous.keys() - current.keys():
+                rows.append((section, key, "del", None))
+                del previous[key]
+
+        # Histories only ever grow, so unless the object itself was replaced
+        # (e.g. by a load) only the new tail needs writing. Price rows go in
+        # as raw float64 bytes.
+        store, written_prices = game.price_history, written["price_history"]
+        if self.tracked.get("price_history") is not store:
+            rows.append(("price_history", "", "clear", None))
+            written_prices.update(names=0, rows=0)
+        if len(store.names) > written_prices["names"]:
+            rows.append(("price_names", "", "extend", json.dumps(store.names[written_prices["names"]:])))
+        for row in range(written_prices["rows"], len(store.rows)):
+            rows.append(("price_history", str(store.years[row]), "row", np.ascontiguousarray(store.rows[row]).tobytes()))
+        written_prices.update(names=len(store.names), rows=len(store.rows))
+        for section in self.LIST_SECTIONS:
+            entries = getattr(game, section)
+            if self.tracked.get(section) is not entries:
+                rows.append((section, "", "set", json.dumps(entries)))
+            elif len(entries) > written[section]:
+                rows.append((section, "", "extend", json.dumps(entries[written[section]:])))
+            written[section] = len(entries)
+        return rows
+
+    def _track(self, game):
+        self.tracked = {section: getattr(game, section) for section in ("price_history",) + self.LIST_SECTIONS}
+        self.tracked["owned"] = dict(game.owned)
+
+    def save(self, game):
+        checkpoint = self.written is None or self.saves_since_checkpoint >= self.compact_every
+        if checkpoint:
+            self.tracked = {}
+            written = self._empty()
+        else:
+            written = self.written
+        try:
+            rows = self._diff(game, written)
+        except Exception:
+            self.written = None  # Half-updated; start over with a checkpoint
+            raise
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO saves (kind, year, money, reputation, created) VALUES (?, ?, ?, ?, ?)",
+                ("checkpoint" if checkpoint else "delta", game.current_year, game.money, game.reputation,
+                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            save_id = cursor.lastrowid
+            self.conn.executemany("INSERT INTO records (save_id, section, key, op, value) VALUES (?, ?, ?, ?, ?)",
+                                  [(save_id,) + row for row in rows])
+            pruned = self._prune(game.current_year)
+        if checkpoint or pruned:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        if checkpoint:
+            self.saves_since_checkpoint = 0
+        else:
+            self.saves_since_checkpoint += 1
+        self.written = written
+        self._track(game)
+        return len(rows)
+
+    def _prune(self, year):
+        # Keeps every save from the last keep_years years, along with the
+        # checkpoint (and the deltas after it) the oldest of them replays from
+        if self.keep_years is None:
+            return False
+        first = self.conn.execute("SELECT MIN(id) FROM saves WHERE year > ?", (year - self.keep_years,)).fetchone()[0]
+        base = first and self._base(first)
+        if not base or not self.conn.execute("SELECT 1 FROM saves WHERE id < ? LIMIT 1", (base,)).fetchone():
+            return False
+        self.conn.execute("DELETE FROM records WHERE save_id < ?", (base,))
+        self.conn.execute("DELETE FROM saves WHERE id < ?", (base,))
+        return True
+
+    def _base(self, save_id):
+        row = self.conn.execute("SELECT MAX(id) FROM saves WHERE kind = 'checkpoint' AND id <= ?", (save_id,)).fetchone()
+        return row[0]
+
+    def find(self, year=None):
+        """Id of the latest save, or of the latest save made in year."""
+        if year is None:
+            row = self.conn.execute("SELECT MAX(id) FROM saves").fetchone()
+        else:
+            row = self.conn.execute("SELECT MAX(id) FROM saves WHERE year = ?", (year,)).fetchone()
+        return row[0]
+
+    def snapshots(self):
+        """Headline numbers of every save, newest first, without decoding any records."""
+        rows = self.conn.execute("SELECT id, kind, year, money, reputation, created FROM saves ORDER BY id DESC")
+        return [dict(zip(("id", "kind", "year", "money", "reputation", "created"), row)) for row in rows]
+
+    def read(self, year=None, sections=None):
+        """Decodes the given sections (all of them by default) of the latest
+        save, or of the latest save in year, without touching a game. Owned
+        cars, competitors and employees come back as plain dicts."""
+        target = self.find(year)
+        base = target and self._base(target)
+        if not base:
+            return None
+        wanted = list(self.SECTIONS) if sections is None else list(sections)
+        query = "SELECT section, key, op, value FROM records WHERE save_id BETWEEN ? AND ?"
+        params = [base, target]
+        if sections is not None:
+            record_sections = [name for section in wanted for name in self.SECTIONS[section]]
+            query += f" AND section IN ({', '.join('?' * len(record_sections))})"
+            params += record_sections
+        state = {"save_id": target, "meta": {}, "owned": {}, "maintenance": {}, "ai_competitors": {}, "employees": {},
+                 "price_history": PriceHistory(), "income_history": [], "expense_history": []}
+        for section, key, op, value in self.conn.execute(query + " ORDER BY id", params):
+            if section == "meta":
+                state["meta"][key] = json.loads(value)
+            elif section in self.RECORD_SECTIONS:
+                if op == "set":
+                    state[section][key] = value
+                else:
+                    state[section].pop(key, None)
+            elif section == "maintenance":
+                if op == "set":
+                    state["maintenance"][key] = json.loads(value)
+                else:
+                    state["maintenance"][key].extend(json.loads(value))
+            elif section == "price_names":
+                state["price_history"].add_names(json.loads(value))
+            elif section == "price_history":
+                if op == "clear":
+                    state["price_history"] = PriceHistory()
+                else:
+                    state["price_history"].add_row(int(key), np.frombuffer(value, dtype=np.float64))
+            elif op == "set":
+                state[section] = json.loads(value)
+            else:
+                state[section].extend(json.loads(value))
+        # Only decode the JSON records that were asked for
+        for section in self.RECORD_SECTIONS:
+            if section in wanted:
+                state[section] = {key: json.loads(value) for key, value in state[section].items()}
+        for name, car in state["owned"].items():
+            car["maintenance_history"] = state["maintenance"].get(name, [])
+        return {section: state[section] for section in ["save_id"] + wanted}
+
+    def load(self, game, year=None):
+        state = self.read(year)
+        if state is None:
+            return False
+        meta = state["meta"]
+        game.money = meta["money"]
+        game.current_year = meta["current_year"]
+        game.reputation = meta.get("reputation", game.reputation)
+        game.owned = {name: Car.from_dict(car) for name, car in state["owned"].items()}
+        game.price_history = state["price_history"]
+        game.income_history = Ledger(state["income_history"])
+        game.expense_history = Ledger(state["expense_history"])
+        game.ai_competitors = [AICompetitor.from_dict(comp) for comp in state["ai_competitors"].values()]
+        game.employees = [Employee(**state["employees"][key]) for key in sorted(state["employees"], key=int)]
+
+        if state["save_id"] != self.find():
+            # Later saves aren't part of this one's history, so the next save
+            # has to start a fresh checkpoint rather than a delta on top of them
+            self.written = None
+            self.tracked = {}
+            return True
+        written = self._empty()
+        written["meta"] = dict(meta)
+        for car in state["owned"].values():
+            del car["maintenance_history"]  # Journaled separately, see _diff()
+        for section in self.RECORD_SECTIONS:
+            written[section] = {key: json.dumps(value) for key, value in state[section].items()}
+        written["maintenance"] = {name: len(car.maintenance_history) for name, car in game.owned.items()}
+        written["price_history"] = {"names": len(game.price_history.names), "rows": len(game.price_history.rows)}
+        for section in self.LIST_SECTIONS:
+            written[section] = len(state[section])
+        self.written = written
+        base = self._base(state["save_id"])
+        self.saves_since_checkpoint = self.conn.execute("SELECT COUNT(*) FROM saves WHERE id > ?", (base,)).fetchone()[0]
+        self._track(game)
+        return True
+
+    def close(self):
+        if self._open.get(os.path.abspath(self.path)) is self:
+            del self._open[os.path.abspath(self.path)]
+        self.conn.close()
@@ -0,0 +1,657 @@
+import string
+from .catalog import CarCatalog
+from .display import console, format_price, loading_animation
+from .game import MARKETING_CAMPAIGNS, TRAINING_PROGRAMS, DealershipGame
+from .lazy import LazyImport, Prompt
+from .optimizer import Policy
+from .profiling import profiler
+
+# Rich and colorama are only imported once something is drawn
+Group = LazyImport("rich.console", "Group")
+Panel = LazyImport("rich.panel", "Panel")
+Table = LazyImport("rich.table", "Table")
+Text = LazyImport("rich.text", "Text")
+box = LazyImport("rich.box")
+
+_terminal_ready = False
+
+def start_terminal():
+    """Initializes colorama the first time the interactive menus start."""
+    global _terminal_ready
+    if not _terminal_ready:
+        from colorama import init
+        init(autoreset=True)
+        # Importing Rich draws from the global random state, so it has to
+        # happen before main_menu() seeds it for a recording
+        console.load()
+        _terminal_ready = True
+
+MAIN_MENU_OPTIONS = [
+    ("1", "View Available Cars"),
+    ("2", "Buy a Car"),
+    ("3", "View Your Owned Cars"),
+    ("4", "Sell a Car"),
+    ("5", "Add Your Own Car"),
+    ("6", "Modify a Car"),
+    ("7", "Auction a Car"),
+    ("8", "Simulate Next Year"),
+    ("9", "Manage Employees"),
+    ("10", "Manage Marketing"),
+    ("11", "Manage Finances"),
+    ("12", "Manage Service Department"),
+    ("13", "Save Game"),
+    ("14", "Load Game"),
+    ("15", "View User Guide"),
+    ("16", "Exit")
+]
+
+class ScreenCache:
+    """Keeps static screen parts pre-rendered as terminal output, so a
+    redraw only has to render what changed. Entries are rebuilt when the
+    terminal is resized."""
+    def __init__(self):
+        self.rendered = {}
+
+    def get(self, key, build):
+        size = tuple(console.size)
+        entry = self.rendered.get(key)
+        if entry is None or entry[0] != size:
+            with console.capture() as capture:
+                console.print(build())
+            entry = self.rendered[key] = (size, capture.get())
+        return entry[1]
+
+    def draw(self, key, build):
+        console.file.write(self.get(key, build))
+
+screen_cache = ScreenCache()
+
+# Interactive Game
+class CarDealershipSimulator(DealershipGame):
+    """DealershipGame driven through the Rich menus."""
+    def clear_console(self):
+        # Clear with escape codes rather than spawning a cls/clear process
+        console.clear()
+
+    def build_main_menu(self):
+        header_panel = Panel(
+            Text("Welcome to the Advanced Car Dealership Simulator!", justify="center", style="bold cyan"),
+            title="Main Menu",
+            subtitle="Select an option",
+            style="bold cyan",
+            width=70,
+            padding=(1, 2)
+        )
+
+        table = Table.grid(padding=1)
+        table.add_column(justify="center", style="bold yellow", width=3)
+        table.add_column(justify="left", style="white", width=45)
+
+        for key, value in MAIN_MENU_OPTIONS:
+            table.add_row(f"[yellow]{key}[/yellow]", f"[white]{value}[/white]")
+
+        body_panel = Panel(table, style="green", padding=(1, 2), box=box.ROUNDED)
+        return Group(header_panel, body_panel)
+
+    def main_menu(self, record=None):
+        """Runs the menus until the player exits. With record set to a path,
+        the session's actions are logged there for replay.Replay."""
+        start_terminal()
+        if record is not None:
+            seed = self.start_recording(record)
+            console.print(f"[cyan]Recording this session to {record} (seed {seed}).")
+        options = MAIN_MENU_OPTIONS
+        while True:
+            self.clear_console()
+            # Only the footer changes between redraws
+            screen_cache.draw("main_menu", self.build_main_menu)
+            footer_text = Text(f"Year: {self.current_year} | Money: {format_price(self.money)} | Reputation: {self.reputation}", style="dim white", justify="center")
+            console.print(Panel(footer_text, style="bold cyan", box=box.ROUNDED))
+
+            choice = Prompt.ask("\n[bold yellow]Enter your choice: [/bold yellow]", choices=[opt[0] for opt in options])
+            with profiler.phase("menu: " + dict(options)[choice]):
+                if choice == '1':
+                    # Call view available cars
+                    self.view_available_cars()
+                elif choice == '2':
+                    self.buy_car_menu()
+                elif choice == '3':
+                    self.view_owned_cars()
+                elif choice == '4':
+                    self.sell_car()
+                elif choice == '5':
+                    self.add_user_car()
+                elif choice == '6':
+                    self.modify_car()
+                elif choice == '7':
+                    self.auction_car()
+                elif choice == '8':
+                    self.simulate()
+                elif choice == '9':
+                    self.manage_employees()
+                elif choice == '10':
+                    self.manage_marketing()
+                elif choice == '11':
+                    self.manage_finances()
+                elif choice == '12':
+                    self.manage_service_department()
+                elif choice == '13':
+                    self.save_game()
+                elif choice == '14':
+                    self.load_game()
+                elif choice == '15':
+                    self.view_user_guide()
+                elif choice == '16':
+                    console.print("[cyan]Exiting the game. Goodbye!")
+                    self.stop_recording()
+                    break
+
+    def view_available_cars(self):
+        page, filters = 1, {}
+        while True:
+            self.clear_console()
+            console.print(Panel("🚗 [bold green]Available Cars:[/bold green]", title="[bold white]Car Listings[/bold white]", box=box.DOUBLE))
+
+            cars, has_more = self.catalog.query(page=page, **filters)
+            table = Table(show_header=True, header_style="bold magenta", title=f"Current Inventory (page {page})", box=box.MINIMAL_DOUBLE_HEAD)
+            table.add_column("Name", style="dim")
+            table.add_column("Price", justify="right")
+            table.add_column("Mileage", justify="right")
+            table.add_column("Condition", justify="center")
+            table.add_column("Age", justify="center")
+
+            for car in cars:
+                table.add_row(
+                    car.name,
+                    format_price(car.price),
+                    f"{car.mileage}k miles",
+                    car.condition,
+                    f"{car.age} years"
+                )
+
+            console.print(table)
+            choice = Prompt.ask("\nType 'next'/'prev' to page, 'filter' to filter and sort, 'menu' to return to the main menu or press Enter to refresh...").strip().lower()
+            if choice == 'menu':
+                break
+            elif choice == 'next' and has_more:
+                page += 1
+            elif choice == 'prev' and page > 1:
+                page -= 1
+            elif choice == 'filter':
+                filters = self.ask_catalog_filters()
+                page = 1
+
+    def ask_catalog_filters(self):
+        filters = {}
+        try:
+            for key, question in (("max_price", "Maximum price"), ("max_mileage", "Maximum mileage (k miles)"), ("max_age", "Maximum age (years)")):
+                answer = Prompt.ask(f"{question} (leave empty for any)", default="").strip()
+                if answer:
+                    filters[key] = int(answer)
+        except ValueError:
+            console.print("[red]Invalid number, filter ignored.")
+        filters["sort_by"] = Prompt.ask("Sort by", choices=list(CarCatalog.SORT_KEYS), default="price")
+        return filters
+
+    def buy_car_menu(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Buy a Car Menu:", title="Select a Car Category"))
+            categories = {"1": "Luxury", "2": "Sports", "3": "Economy", "4": "Return to Main Menu"}
+            for key, value in categories.items():
+                console.print(f"[yellow]{key}. {value}")
+
+            choice = Prompt.ask("\nEnter your choice", choices=list(categories.keys()))
+            if choice == '1':
+                self.buy_car("Luxury", self.luxury_cars)
+            elif choice == '2':
+                self.buy_car("Sports", self.sports_cars)
+            elif choice == '3':
+                self.buy_car("Economy", self.economy_cars)
+            elif choice == '4':
+                break
+
+    def buy_car(self, category, car_list):
+        page = 1
+        while True:
+            self.clear_console()
+            console.print(Panel(f"[bold green]{category} Cars:", title="Available Cars"))
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Name", style="dim")
+            table.add_column("Price")
+            table.add_column("Mileage")
+            table.add_column("Condition")
+            table.add_column("Age")
+
+            available_cars, has_more = self.catalog.query(segment=category, page=page)
+            if not available_cars:
+                console.print("[red]No cars available in this category.")
+                input("Press Enter to return...")
+                break
+
+            for car in available_cars:
+                table.add_row(car.name, format_price(car.price), f"{car.mileage}k miles", car.condition, f"{car.age} years")
+
+            console.print(table)
+            paging = (['next'] if has_more else []) + (['prev'] if page > 1 else [])
+            carname = Prompt.ask("\nWhich car would you like to buy?", choices=[car.name for car in available_cars] + paging + ['menu'])
+
+            if carname.lower() == 'menu':
+                break
+            if carname in ('next', 'prev'):
+                page += 1 if carname == 'next' else -1
+                continue
+
+            car = car_list.get(carname)
+            if car:
+                self.process_car_purchase(car)
+                break
+
+    def process_car_purchase(self, car):
+        while True:
+            console.print(f"[yellow]{car.name}: {format_price(car.price)} | Mileage: {car.mileage}k miles | Condition: {car.condition} | Age: {car.age} years")
+            buythiscar = Prompt.ask("Do you want to buy this car?", choices=["yes", "no"])
+            if buythiscar == "yes":
+                self.purchase(car)
+            else:
+                console.print("[cyan]Purchase cancelled.")
+            choice = Prompt.ask("\nType 'menu' to return to the main menu or press Enter to continue...").strip().lower()
+            if choice == 'menu':
+                break
+
+    def view_owned_cars(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Your Owned Cars:", title="Owned Cars"))
+            if not self.owned:
+                console.print("[red]You do not own any cars.")
+                input("Press Enter to return...")
+                break
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Name", style="dim")
+            table.add_column("Value")
+            table.add_column("Age")
+            table.add_column("Mileage")
+            table.add_column("Condition")
+            table.add_column("Owners")
+            table.add_column("Maintenance History")
+
+            for carname, car in self.owned.items():
+                maintenance = ', '.join([f"{entry['year']}: {format_price(entry['cost'])}" for entry in car.maintenance_history])
+                table.add_row(carname, format_price(car.price), f"{car.age} years", f"{car.mileage}k miles", car.condition, str(car.owners), maintenance)
+
+            console.print(table)
+            choice = Prompt.ask("\nType 'menu' to return to the main menu or press Enter to refresh...").strip().lower()
+            if choice == 'menu':
+                break
+
+    def sell_car(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Sell a Car:", title="Sell Car"))
+            if not self.owned:
+                console.print("[red]You do not own any cars.")
+                input("Press Enter to return...")
+                break
+            carname = Prompt.ask("\nWhich car would you like to sell?", choices=list(self.owned.keys()) + ['menu'])
+            if carname.lower() == 'menu':
+                break
+            self.sell(carname)
+            choice = Prompt.ask("\nType 'menu' to return to the main menu or press Enter to continue...").strip().lower()
+            if choice == 'menu':
+                break
+
+    def add_user_car(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Add Your Own Car:", title="Add Car"))
+            carname = string.capwords(Prompt.ask("Enter the name of the car"))
+            if carname.lower() == 'menu':
+                break
+            try:
+                carprice = int(Prompt.ask("Enter the value of the car: $"))
+                carmileage = int(Prompt.ask("Enter the mileage of the car: "))
+                carcondition = Prompt.ask("Enter the condition of the car (New/Used)", choices=["New", "Used"])
+                carage = int(Prompt.ask("Enter the age of the car (years): "))
+            except ValueError:
+                console.print("[red]Invalid input. Please enter valid numbers.")
+                input("\nPress Enter to return to the main menu...")
+                continue
+
+            if carcondition not in ["New", "Used"]:
+                console.print("[red]Invalid condition. Please enter 'New' or 'Used'.")
+                input("\nPress Enter to return to the main menu...")
+                continue
+
+            self.add_own_car(carname, carprice, carmileage, carcondition, carage)
+            choice = Prompt.ask("\nType 'menu' to return to the main menu or press Enter to continue...").strip().lower()
+            if choice == 'menu':
+                break
+
+    def modify_car(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Modify a Car:", title="Modify Car"))
+            if not self.owned:
+                console.print("[red]You do not own any cars.")
+                input("Press Enter to return...")
+                break
+            carname = Prompt.ask("\nWhich car would you like to modify?", choices=list(self.owned.keys()) + ['menu'])
+            if carname.lower() == 'menu':
+                break
+            if carname in self.owned:
+                car = self.owned[carname]
+                console.print(f"[yellow]{carname}: 1 car | Value: {format_price(car.price)}")
+                options = {"1": "Performance Upgrade (+$10,000)", "2": "Luxury Upgrade (+$5,000)", "3": "Efficiency Upgrade (+$2,000)"}
+                for key, value in options.items():
+                    console.print(f"[yellow]{key}. {value}")
+
+                upgrade_choice = Prompt.ask("Choose an upgrade (1-3)", choices=list(options.keys()))
+                self.upgrade(carname, {"1": "performance", "2": "luxury", "3": "efficiency"}[upgrade_choice])
+            else:
+                console.print("[red]You do not own this car.")
+            choice = Prompt.ask("\nType 'menu' to return to the main menu or press Enter to continue...").strip().lower()
+            if choice == 'menu':
+                break
+
+    def auction_car(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Auction a Car:", title="Auction Car"))
+            if not self.owned:
+                console.print("[red]You do not own any cars.")
+                input("Press Enter to return...")
+                break
+            carname = Prompt.ask("\nWhich car would you like to auction?", choices=list(self.owned.keys()) + ['menu'])
+            if carname.lower() == 'menu':
+                break
+            self.auction(carname)
+            choice = Prompt.ask("\nType 'menu' to return to the main menu or press Enter to continue...").strip().lower()
+            if choice == 'menu':
+                break
+
+    def simulate(self):
+        self.clear_console()
+        console.print(Panel("[bold cyan]Simulating Car Prices for the next year...", title="Simulation"))
+        loading_animation("Processing", duration=2)
+
+        results = self.advance_year()
+
+        with profiler.phase("render"):
+            console.print(Panel("[bold green]New Car Prices:", title="Updated Prices"))
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Name", style="dim")
+            table.add_column("Price")
+            table.add_column("Mileage")
+            table.add_column("Condition")
+            table.add_column("Age")
+
+            for category in [self.luxury_cars, self.sports_cars, self.economy_cars]:
+                for car in category.values():
+                    table.add_row(car.name, format_price(car.price), f"{car.mileage}k miles", car.condition, f"{car.age} years")
+
+            console.print(table)
+
+            console.print(Panel("[cyan]Your owned cars:", title="Owned Cars"))
+            for carname, car in self.owned.items():
+                console.print(f"[yellow]{carname}: 1 car")
+
+        with profiler.phase("yearly_report"):
+            self.yearly_report(results["maintenance_costs"])
+        # advance_year() doesn't print these, so they come after the report
+        console.print(f"[yellow]Taxes calculated on profit: {format_price(results['taxes_due'])}")
+        console.print(f"[green]Net Profit for the year: {format_price(results['net_profit'])}")
+
+        input("\nPress Enter to return to the main menu...")
+
+    def yearly_report(self, maintenance_costs):
+        self.clear_console()
+        console.print(Panel("[bold cyan]Yearly Report:", title="Yearly Summary"))
+        console.print(f"[yellow]Year: {self.current_year}")
+        console.print(f"[yellow]Money: {format_price(self.money)}")
+        console.print(f"[yellow]Owned Cars: {list(self.owned.keys())}")
+        console.print("[green]\nPrice History (last 5 years):")
+        for model, history in self.price_history.recent(5):
+            console.print(f"[yellow]{model}: {', '.join(map(format_price, history))}")
+        console.print("[green]\nIncome History:")
+        for entry in self.income_history:
+            console.print(f"[yellow]{entry}")
+        console.print("[green]\nExpense History:")
+        for entry in self.expense_history:
+            console.print(f"[yellow]{entry}")
+        console.print(f"[green]\nTotal Maintenance Costs: {format_price(maintenance_costs)}")
+        input("\nPress Enter to return to the main menu...")
+
+    def manage_employees(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("👥 [bold green]Manage Employees[/bold green]", title="[bold white]Employee Management[/bold white]"))
+
+            table = Table(show_header=True, header_style="bold magenta", title="Employee Roster")
+            table.add_column("No.", style="dim", width=3)
+            table.add_column("Name", style="white", width=15)
+            table.add_column("Role", style="yellow", width=15)
+            table.add_column("Skill Level", style="cyan", justify="right")
+
+            for i, employee in enumerate(self.employees, start=1):
+                table.add_row(str(i), employee.name, employee.role, str(employee.skill_level))
+
+            console.print(table)
+            choice = Prompt.ask("Select an employee to improve their skills (or type 'menu' to return)").strip().lower()
+            if choice == 'menu':
+                break
+            try:
+                choice = int(choice) - 1
+                if 0 <= choice < len(self.employees):
+                    console.print("Available Training Programs:")
+                    for idx, program in enumerate(TRAINING_PROGRAMS, start=1):
+                        console.print(f"[yellow]{idx}. {program.name} - Cost: {format_price(program.cost)}")
+                    program_choice = Prompt.ask("Select a training program (or type 'menu' to return)").strip().lower()
+                    if program_choice == 'menu':
+                        continue
+                    program_choice = int(program_choice) - 1
+                    if 0 <= program_choice < len(TRAINING_PROGRAMS):
+                        self.train_employee(choice, program_choice)
+                    else:
+                        console.print("[red]Invalid training program selection.")
+                else:
+                    console.print("[red]Invalid employee selection.")
+            except ValueError:
+                console.print("[red]Please enter a valid number.")
+            input("\nPress Enter to return to the previous menu...")
+
+    def manage_marketing(self):
+        campaigns = MARKETING_CAMPAIGNS
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Manage Marketing Campaigns", title="Marketing"))
+            for i, campaign in enumerate(campaigns, start=1):
+                console.print(f"[yellow]{i}. {campaign.name} - Cost: {format_price(campaign.cost)} - Effectiveness: {campaign.effectiveness}")
+
+            choice = Prompt.ask("\nSelect a campaign to launch or type 'menu' to return", choices=[str(i) for i in range(1, len(campaigns) + 1)] + ['menu'])
+            if choice == 'menu':
+                break
+            else:
+                self.launch_campaign(int(choice) - 1)
+                input("\nPress Enter to return to the previous menu...")
+                break
+
+    def manage_finances(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("[bold green]Manage Finances", title="Finances"))
+            console.print(f"[yellow]Cash Flow: {format_price(self.financial_manager.cash_flow)}")
+            console.print(f"[yellow]Outstanding Loans: {len(self.financial_manager.loan_book)}")
+            console.print(f"[yellow]Investments: {len(self.financial_manager.investments)}")
+            console.print(f"[yellow]Crypto Portfolio: {len(self.financial_manager.crypto_portfolio)}")
+            console.print(f"[yellow]Taxes Due: {format_price(self.financial_manager.taxes_due)}")
+            choice = Prompt.ask("\n1. Pay Taxes\n2. Take Loan\n3. Invest\n4. View Profit/Loss Statement\nmenu. Return to Menu", choices=["1", "2", "3", "4", "menu"])
+            if choice == '1':
+                self.pay_taxes()
+            elif choice == '2':
+                amount = int(Prompt.ask("Enter loan amount: $"))
+                interest_rate = float(Prompt.ask("Enter interest rate: %"))
+                term_years = int(Prompt.ask("Enter term in years: "))
+                self.take_loan(amount, interest_rate, term_years)
+            elif choice == '3':
+                invest_choice = Prompt.ask("1. Stock\n2. Cryptocurrency", choices=["1", "2"])
+                amount = int(Prompt.ask("Enter investment amount: $"))
+                if invest_choice == '1':
+                    stock_name = Prompt.ask("Enter stock name:")
+                    self.invest("stock", stock_name, amount)
+                else:
+                    crypto_name = Prompt.ask("Enter cryptocurrency name:")
+                    self.invest("crypto", crypto_name, amount)
+            elif choice == '4':
+                self.show_profit_loss()
+                input("\nPress Enter to return to the previous menu...")
+            elif choice == 'menu':
+                break
+            input("\nPress Enter to return to the previous menu...")
+
+    def show_profit_loss(self, page_size=500):
+        ledger = self.financial_manager.ledger
+        if ledger is None:
+            console.print(self.financial_manager.profit_loss_statement)
+            return
+        for period, totals in ledger.profit_loss().items():
+            console.print(f"[yellow]Year {period}: " + ", ".join(f"{kind} {format_price(total)}" for kind, total in totals.items()))
+        # Stream the entries from the ledger's cursor, one table per page
+        table = None
+        for count, (date, period, transaction_type, amount, description) in enumerate(ledger.entries(batch_size=page_size)):
+            if count % page_size == 0:
+                if table is not None:
+                    console.print(table)
+                table = Table(show_header=True, header_style="bold magenta", box=box.SIMPLE)
+                for column in ("Date", "Year", "Type", "Amount", "Description"):
+                    table.add_column(column)
+            table.add_row(date, str(period), transaction_type, format_price(amount), description)
+        if table is not None:
+            console.print(table)
+
+    def manage_service_department(self):
+        while True:
+            self.clear_console()
+            console.print(Panel("🔧 [bold green]Manage Service Department[/bold green]", title="[bold white]Service Management[/bold white]"))
+
+            table = Table(show_header=True, header_style="bold magenta", title="Service Customers")
+            table.add_column("No.", style="dim", width=3)
+            table.add_column("Customer Name", style="white", width=20)
+            table.add_column("Budget", style="yellow", justify="right")
+
+            for i, customer in enumerate(self.customers, start=1):
+                table.add_row(str(i), customer.name, format_price(customer.budget))
+
+            console.print(table)
+            choice = Prompt.ask("\nSelect a customer for service or type 'menu' to return", choices=[str(i) for i in range(1, len(self.customers) + 1)] + ['menu'])
+            if choice == 'menu':
+                break
+            else:
+                car_name = Prompt.ask("Enter car name for service:")
+                self.service_car(int(choice) - 1, car_name)
+                input("\nPress Enter to return to the previous menu...")
+                break
+
+    def save_game(self):
+        while True:
+            slot = Prompt.ask("Enter save slot number (1-3) or type 'menu' to return").strip().lower()
+            if slot == 'menu':
+                break
+            if slot in ["1", "2", "3"]:
+                self.save_to_slot(slot)
+                console.print("[green]Game saved successfully.")
+                input("\nPress Enter to return to the main menu...")
+                break
+            else:
+                console.print("[red]Invalid slot number.")
+
+    def load_game(self):
+        while True:
+            slot = Prompt.ask("Enter load slot number (1-3) or type 'menu' to return").strip().lower()
+            if slot == 'menu':
+                break
+            if slot in ["1", "2", "3"]:
+                year = self.pick_snapshot(slot)
+                if year == 'menu':
+                    break
+                if self.load_from_slot(slot, year):
+                    console.print("[green]Game loaded successfully.")
+                else:
+                    console.print("[red]No saved game found in this slot. Starting a new game.")
+                input("\nPress Enter to return to the main menu...")
+                break
+            else:
+                console.print("[red]Invalid slot number.")
+
+    def pick_snapshot(self, slot):
+        # Lists the slot's saves from their headline numbers alone; returns
+        # the chosen year, or None for the latest save
+        snapshots = self.slot_snapshots(slot)
+        if len(snapshots) < 2:
+            return None
+        table = Table(show_header=True, header_style="bold magenta", title=f"Slot {slot}")
+        for column in ("Year", "Money", "Reputation", "Saved"):
+            table.add_column(column)
+        years = []
+        for snapshot in snapshots:
+            if snapshot["year"] not in years:
+                years.append(snapshot["year"])
+                table.add_row(str(snapshot["year"]), format_price(snapshot["money"]), str(snapshot["reputation"]), snapshot["created"])
+        console.print(table)
+        choice = Prompt.ask("Enter the year to load or type 'menu' to return", choices=[str(year) for year in years] + ['menu'], default=str(years[0]))
+        return choice if choice == 'menu' else int(choice)
+
+    def build_user_guide(self):
+        guide_menu = Table(show_header=False, box=None)
+        guide_menu.add_row("[bold yellow]1[/bold yellow]. View available cars")
+        guide_menu.add_row("[bold yellow]2[/bold yellow]. Buy a car")
+        guide_menu.add_row("[bold yellow]3[/bold yellow]. View your owned cars")
+        guide_menu.add_row("[bold yellow]4[/bold yellow]. Sell a car")
+        guide_menu.add_row("[bold yellow]5[/bold yellow]. Add your own car")
+        guide_menu.add_row("[bold yellow]6[/bold yellow]. Modify a car")
+        guide_menu.add_row("[bold yellow]7[/bold yellow]. Auction a car")
+        guide_menu.add_row("[bold yellow]8[/bold yellow]. Simulate next year")
+        guide_menu.add_row("[bold yellow]9[/bold yellow]. Manage Employees")
+        guide_menu.add_row("[bold yellow]10[/bold yellow]. Manage Marketing")
+        guide_menu.add_row("[bold yellow]11[/bold yellow]. Manage Finances")
+        guide_menu.add_row("[bold yellow]12[/bold yellow]. Manage Service Department")
+        guide_menu.add_row("[bold yellow]13[/bold yellow]. Save game")
+        guide_menu.add_row("[bold yellow]14[/bold yellow]. Load game")
+        guide_menu.add_row("[bold yellow]15[/bold yellow]. Exit")
+        guide_menu.add_row("[bold yellow]0[/bold yellow]. Return to Main Menu")
+        return Group(Panel("[bold green]User Guide:", title="Guide"), guide_menu)
+
+    def view_user_guide(self):
+        while True:
+            self.clear_console()
+            screen_cache.draw("user_guide", self.build_user_guide)
+
+            try:
+                choice = Prompt.ask("\nEnter '0' to return to the main menu", choices=["0"])
+                if choice == "0":
+                    break
+            except ValueError:
+                console.print("[red]Invalid input. Please enter '0' to return to the main menu.")
+
+def show_monte_carlo_report(report, metric="money"):
+    table = Table(show_header=True, header_style="bold magenta", title=f"Monte Carlo: {metric}")
+    table.add_column("Year", style="dim")
+    bands = report["bands"][metric]
+    for band in bands:
+        table.add_column(band, justify="right")
+    fmt = (lambda value: f"{value:.0f}") if metric == "reputation" else format_price
+    for i, year in enumerate(report["years"]):
+        table.add_row(str(year), *(fmt(values[i]) for values in bands.values()))
+    console.print(table)
+
+def show_policy_report(results, confidence=0.95):
+    table = Table(show_header=True, header_style="bold magenta", title="Best Policies")
+    table.add_column("Rank", style="dim")
+    table.add_column("Policy")
+    table.add_column("Mean Net Worth", justify="right")
+    table.add_column(f"{confidence:.0%} Interval", justify="right")
+    table.add_column("Games", justify="right")
+    for rank, result in enumerate(results, 1):
+        table.add_row(str(rank), repr(Policy(**result["params"])), format_price(result["mean"]),
+                      f"{format_price(result['low'])} - {format_price(result['high'])}", str(result["games"]))
+    console.print(table)
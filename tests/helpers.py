@@ -0,0 +1,47 @@
+import random
+from dealership import DealershipGame, EconomyCar, LuxuryCar, Market, SportsCar, headless
+
+def catalog(game):
+    return [car for category in (game.luxury_cars, game.sports_cars, game.economy_cars) for car in category.values()]
+
+# What game_state() compares, by name
+STATE = {
+    "money": lambda game: game.money,
+    "year": lambda game: game.current_year,
+    "reputation": lambda game: game.reputation,
+    "taxes_due": lambda game: game.financial_manager.taxes_due,
+    "owned": lambda game: {name: car.to_dict() for name, car in game.owned.items()},
+    "catalog": lambda game: [car.to_dict() for car in catalog(game)],
+    "income": lambda game: list(game.income_history),
+    "expenses": lambda game: list(game.expense_history),
+    "loans": lambda game: game.financial_manager.loans,
+    "price_history": lambda game: game.price_history.to_dict(),
+    "market": lambda game: game.market.trends.tolist(),
+    "competitors": lambda game: [competitor.to_dict() for competitor in game.ai_competitors],
+    "employees": lambda game: [dict(employee.__dict__) for employee in game.employees],
+    "customers": lambda game: [customer.budget for customer in game.customers],
+}
+# The parts a save slot keeps
+SAVED_STATE = ("money", "year", "reputation", "owned", "price_history", "income", "expenses", "competitors", "employees")
+
+def game_state(game, parts=tuple(STATE)):
+    """Everything in parts as plain data, for comparing two games."""
+    return {part: STATE[part](game) for part in parts}
+
+def make_game(fleet=False, cars=300, regions=None, seed=11):
+    """A seeded game with cars extra catalog cars of random segments, prices
+    and regions, on the fleet path if fleet is set."""
+    random.seed(seed)
+    rng = random.Random(1)
+    game = DealershipGame()
+    if regions:
+        game.market = Market(regions=regions)
+    categories = {LuxuryCar: game.luxury_cars, SportsCar: game.sports_cars, EconomyCar: game.economy_cars}
+    with headless():
+        for i in range(cars):
+            car_class = rng.choice(list(categories))
+            region = rng.choice((regions or [None]) + [None, "Nowhere"])
+            game.register_car(categories[car_class], car_class(f"Car {i}", rng.randint(10_000, 500_000), 1, "New", 1, region=region))
+        if fleet:
+            game.use_fleet()
+    return game
@@ -0,0 +1,41 @@
+import random
+
+from dealership import AICompetitor, EconomyCar, DealershipGame, headless, max_price_bidding
+
+def crowded_auction(seed, lots=300, bidders=40):
+    random.seed(seed)
+    game = DealershipGame()
+    game.money = 60_000
+    game.ai_competitors = [AICompetitor(f"AI {i}", random.randint(0, 150_000)) for i in range(bidders)]
+    with headless():
+        game.auction_house.list_cars(EconomyCar(f"Lot {i}", random.randint(5_000, 60_000), 10, "Used", 3)
+                                     for i in range(lots))
+    return game
+
+def run(game):
+    with headless():
+        return game.auction_house.run_auctions(max_price_bidding(0.9), rounds=8, bids_per_round=15)
+
+def test_budget_reservation_never_overspends():
+    game = crowded_auction(1)
+    before = {id(bidder): bidder.money for bidder in game.ai_competitors + [game]}
+    results = run(game)
+    assert results and not game.auction_house.auctions
+    paid = {}
+    for name, (winner, price) in results.items():
+        paid[id(winner)] = paid.get(id(winner), 0) + price
+        holdings = game.owned if winner is game else winner.owned_cars
+        assert holdings[name].sold
+    for bidder in game.ai_competitors + [game]:
+        assert bidder.money >= 0
+        assert bidder.money == before[id(bidder)] - paid.get(id(bidder), 0)
+    won = [name for bidder in game.ai_competitors for name in bidder.owned_cars] + list(game.owned)
+    assert sorted(won) == sorted(results)
+
+def test_auctions_replay_from_the_seed():
+    outcomes = []
+    for _ in range(2):
+        game = crowded_auction(7)
+        outcomes.append({name: ("You" if winner is game else winner.name, price)
+                         for name, (winner, price) in run(game).items()})
+    assert outcomes[0] == outcomes[1]
@@ -0,0 +1,10 @@
+import os
+import tempfile
+
+from benchmark import run_benchmark
+
+def test_save_load_benchmark_cleans_up_its_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    result = run_benchmark("save_load", 1000, 3)
+    assert result["ops"] == 10 and result["best"] > 0
+    assert os.listdir(tmp_path) == []
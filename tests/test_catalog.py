@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from dealership import EconomyCar, headless
+from helpers import catalog, make_game
+
+def linear_scan(game, segment=None, min_price=None, max_price=None, max_mileage=None, max_age=None,
+                sort_by="price", descending=False, page=1, page_size=20):
+    cars = [car for car in catalog(game) if not car.sold and segment in (None, car.segment)
+            and (min_price is None or car.price >= min_price) and (max_price is None or car.price <= max_price)
+            and (max_mileage is None or car.mileage <= max_mileage) and (max_age is None or car.age <= max_age)]
+    cars.sort(key=lambda car: getattr(car, sort_by))
+    if descending:
+        cars.reverse()
+    start = (page - 1) * page_size
+    return cars[start:start + page_size], len(cars) > start + page_size
+
+def random_queries(rng, count):
+    for _ in range(count):
+        low = rng.choice((None, rng.randint(10_000, 200_000)))
+        yield {"segment": rng.choice((None, "Luxury", "Sports", "Economy")), "min_price": low,
+               "max_price": rng.choice((None, (low or 0) + rng.randint(50_000, 400_000))),
+               "max_mileage": rng.choice((None, 0, 1, 20)), "max_age": rng.choice((None, 1, 3)),
+               "sort_by": rng.choice(("price", "mileage", "age")), "descending": rng.random() < 0.5,
+               "page": rng.randint(1, 4), "page_size": rng.choice((5, 20))}
+
+def assert_matches_scan(game, rng, count=200):
+    for filters in random_queries(rng, count):
+        cars, more = game.catalog.query(**filters)
+        expected, expected_more = linear_scan(game, **filters)
+        assert [car.name for car in cars] == [car.name for car in expected], filters
+        assert more == expected_more
+
+@pytest.mark.parametrize("fleet", [False, True])
+def test_queries_match_a_linear_scan(fleet):
+    game = make_game(fleet, cars=400, seed=8)
+    rng = random.Random(3)
+    assert_matches_scan(game, rng)
+    with headless():
+        for car in rng.sample(catalog(game), 40):
+            game.purchase(car)
+        for i in range(10):
+            game.register_car(game.economy_cars, EconomyCar(f"Added {i}", rng.randint(5_000, 60_000), i, "Used", i))
+    assert_matches_scan(game, rng)
+    game.run_years(2)  # Reprices every car
+    assert_matches_scan(game, rng)
+
+def test_unknown_sort_key_is_rejected():
+    with pytest.raises(ValueError):
+        make_game(cars=0).catalog.query(sort_by="colour")
@@ -0,0 +1,54 @@
+import pytest
+from dealership import DealershipChain, headless
+
+def open_chain(shards, processes=False, stores=6, years=1):
+    chain = DealershipChain(shards=shards, processes=processes, seed=7)
+    with headless():
+        for i in range(stores):
+            chain.open_dealership(f"S{i}", traffic=0)  # No customers, so the stock stays put
+        for _ in range(years):
+            chain.advance_year()
+    return chain
+
+def showroom_car(chain, name):
+    return chain.dealership(name).inventory.cars_at("Showroom")[0].name
+
+def all_car_names(chain):
+    return sorted(car.name for name in chain.shard_of for car in chain.dealership(name).inventory.cars.values())
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_move_car_between_shards(processes):
+    chain = open_chain(2, processes)
+    try:
+        assert chain.shard_of["S0"] != chain.shard_of["S1"]
+        car = showroom_car(chain, "S0")
+        with headless():
+            chain.move_car(("S0", "Showroom"), ("S1", "Warehouse"), car)
+            chain.flush()
+        assert car in {c.name for c in chain.dealership("S1").inventory.cars_at("Warehouse")}
+        assert car not in {c.name for c in chain.dealership("S0").inventory.cars.values()}
+    finally:
+        chain.close()
+
+@pytest.mark.parametrize("source, target", [(("S0", "Showroom"), ("S2", "Showrom")), (("S0", "Showrom"), ("S2", "Warehouse")),
+                                            (("S0", "Showroom"), ("S99", "Showroom"))])
+def test_move_to_an_invalid_location_keeps_the_car(source, target):
+    chain = open_chain(3)
+    before = all_car_names(chain)
+    car = showroom_car(chain, "S0")
+    with headless():
+        chain.move_car(source, target, car)
+        assert not any(batch["moves"] for batch in chain._pending)
+        chain.flush()
+    assert all_car_names(chain) == before
+
+def test_results_do_not_depend_on_sharding():
+    runs = []
+    for shards in (1, 3):
+        chain = DealershipChain(shards=shards, processes=False, seed=5)
+        with headless():
+            for i in range(12):
+                chain.open_dealership(f"S{i}", traffic=100 + 60 * i)
+            runs.append((chain.run_years(4), chain.stats))
+    assert runs[0] == runs[1]
+    assert sum(year["transfers"] for year in runs[0][0]) > 0
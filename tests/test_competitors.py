@@ -0,0 +1,36 @@
+import random
+
+from dealership import AICompetitor, CompetitorScheduler, Customer, headless
+from helpers import catalog, make_game
+
+def crowded_market(seed, competitors=2000, customers=300):
+    game = make_game(cars=500, seed=seed)
+    game.ai_competitors = [AICompetitor(f"AI {i}", random.randint(0, 900_000), random.choice(("Aggressive", "Balanced")))
+                           for i in range(competitors)]
+    game.customers = [Customer(f"Customer {i}", 50_000, "Sports", 1) for i in range(customers)]
+    game.competitor_scheduler = CompetitorScheduler()
+    return game
+
+def test_every_car_and_customer_goes_to_one_competitor_at_most():
+    game = crowded_market(3)
+    customers = list(game.customers)
+    owners = {id(car): car.owners for car in catalog(game)}
+    with headless():
+        summary = game.competitor_scheduler.run(game)
+    bought = [car for competitor in game.ai_competitors for car in competitor.owned_cars.values()]
+    assert len(bought) == len({id(car) for car in bought}) == summary["cars_bought"] > 0
+    assert all(car.sold and car.owners == owners[id(car)] + 1 for car in bought)
+    assert sum(car.sold for car in catalog(game)) == len(bought)
+    assert all(competitor.money >= 0 for competitor in game.ai_competitors)
+    assert summary["customers_stolen"] > 0
+    assert len(game.customers) == len(customers) - summary["customers_stolen"]
+    assert [customer for customer in customers if customer in game.customers] == game.customers
+
+def test_scheduled_years_replay_from_the_seed():
+    runs = []
+    for _ in range(2):
+        game = crowded_market(5, competitors=300)
+        results = game.run_years(3)
+        runs.append((results, [competitor.to_dict() for competitor in game.ai_competitors],
+                     [customer.name for customer in game.customers]))
+    assert runs[0] == runs[1]
@@ -0,0 +1,61 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from dealership import SEGMENTS, Customer, CustomerStream, EconomyCar, negotiate_prices, process_demand
+
+def test_negotiate_prices_matches_customer_negotiate_price(monkeypatch):
+    rng = np.random.default_rng(4)
+    prices = rng.integers(1_000, 500_000, 2000).astype(np.float64)
+    skills = rng.integers(1, 11, 2000)
+    trade_ins = np.where(rng.random(2000) < 0.3, rng.integers(1_000, 20_000, 2000), 0).astype(np.float64)
+    draws = np.random.default_rng(9).random(2000)
+    final = negotiate_prices(prices, skills, trade_ins, np.random.default_rng(9))
+
+    for price, skill, trade_in, draw, expected in zip(prices.tolist(), skills.tolist(), trade_ins.tolist(),
+                                                     draws.tolist(), final.tolist()):
+        # The scalar method's randint(0, most) gets the same discount the arrays drew
+        monkeypatch.setattr(random, "randint", lambda low, most: low + math.floor(draw * (most + 1)))
+        car = EconomyCar("Trade-in", trade_in, 10, "Used", 5) if trade_in else None
+        customer = Customer("Prospect", 0, "Economy", skill, trade_in_car=car)
+        assert customer.negotiate_price(price) == expected
+        assert max(0, price * (1 - skill / 100) - 0.8 * trade_in - 1) <= expected <= max(0, price - 0.8 * trade_in)
+
+def test_stream_chunks_are_bounded_and_follow_the_distributions():
+    stream = CustomerStream(preferences={"Luxury": 0.1, "Sports": 0.3, "Economy": 0.6}, skill_range=(2, 6),
+                            trade_in_rate=0.25, seed=1)
+    chunks = list(stream.chunks(250_000, chunk_size=40_000))
+    assert [len(chunk["budget"]) for chunk in chunks] == [40_000] * 6 + [10_000]
+    merged = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+    assert np.bincount(merged["preference"], minlength=3) / 250_000 == pytest.approx([0.1, 0.3, 0.6], abs=0.01)
+    assert merged["negotiation_skill"].min() == 2 and merged["negotiation_skill"].max() == 6
+    assert (merged["trade_in_value"] > 0).mean() == pytest.approx(0.25, abs=0.01)
+    assert np.median(merged["budget"]) == pytest.approx(60_000, rel=0.02)
+
+def test_process_demand_matches_a_scalar_pass():
+    cars = {segment: {f"{segment} {i}": EconomyCar(f"{segment} {i}", 20_000 + 9_000 * i, 1, "New", 0) for i in range(12)}
+            for segment in SEGMENTS}
+    summary = process_demand(list(cars.values()), 30_000, CustomerStream(seed=3), chunk_size=7_000)
+
+    stream = CustomerStream(seed=3)
+    expected = {segment: {"prospects": 0, "buyers": 0, "revenue": 0.0} for segment in SEGMENTS}
+    for chunk in stream.chunks(30_000, 7_000):
+        for code, segment in enumerate(SEGMENTS):
+            members = np.flatnonzero(chunk["preference"] == code).tolist()
+            prices = [car.price for car in cars[segment].values()]
+            picks = stream.rng.integers(0, len(prices), len(members)).tolist()
+            draws = stream.rng.random(len(members)).tolist()
+            for member, pick, draw in zip(members, picks, draws):
+                price = prices[pick]
+                discount = math.floor(draw * (math.floor(price * chunk["negotiation_skill"][member] / 100) + 1))
+                final = max(0, price - discount - 0.8 * chunk["trade_in_value"][member])
+                expected[segment]["prospects"] += 1
+                if final <= chunk["budget"][member]:
+                    expected[segment]["buyers"] += 1
+                    expected[segment]["revenue"] += final
+    for segment in SEGMENTS:
+        assert summary[segment]["prospects"] == expected[segment]["prospects"]
+        assert summary[segment]["buyers"] == expected[segment]["buyers"]
+        assert summary[segment]["revenue"] == pytest.approx(expected[segment]["revenue"])
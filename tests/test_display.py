@@ -0,0 +1,12 @@
+import dealership
+from dealership import instant_mode, set_instant_mode
+
+def test_instant_mode_getter_follows_set_instant_mode():
+    before = instant_mode()
+    try:
+        set_instant_mode(not before)
+        assert instant_mode() is (not before)
+        assert dealership.display.INSTANT_MODE is (not before)
+    finally:
+        set_instant_mode(before)
+    assert not hasattr(dealership, "INSTANT_MODE")
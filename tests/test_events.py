@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from dealership import RANDOM_EVENTS, SEGMENT_EVENTS, EventEngine, randint_block, random_block
+from helpers import catalog, make_game
+
+ENGINE = EventEngine(RANDOM_EVENTS + SEGMENT_EVENTS)
+
+def event(name):
+    return next(event for event in ENGINE.events if event["event"] == name)
+
+@pytest.mark.parametrize("low, high", [(0, 0), (1, 6), (5000, 25000), (10000, 50000), (0, 2 ** 32 - 1), (0, 2 ** 40)])
+def test_blocks_match_successive_calls(low, high):
+    random.seed(low + high)
+    expected = [random.randint(low, high) for _ in range(500)] + [random.random() for _ in range(500)]
+    after = random.getstate()
+    random.seed(low + high)
+    drawn = randint_block(low, high, 500).tolist() + random_block(500).tolist()
+    assert drawn == expected and random.getstate() == after
+
+def test_draws_follow_the_weights_and_the_seed():
+    random.seed(3)
+    names = [event["event"] for event in ENGINE.draw(22_000)]
+    random.seed(3)
+    assert [event["event"] for event in ENGINE.draw(22_000)] == names
+    total = sum(event["weight"] for event in ENGINE.events)
+    for compiled in ENGINE.events:
+        assert names.count(compiled["event"]) / len(names) == pytest.approx(compiled["weight"] / total, abs=0.01)
+
+def test_events_apply_like_a_per_car_loop_in_catalog_order():
+    for compiled in (event("recession"), event("economic boom"), event("luxury tax hike"), event("motorsport win")):
+        game = make_game(cars=200, seed=5)
+        cars = catalog(game)
+        before = [car.price for car in cars]
+        random.seed(8)
+        ENGINE.apply(compiled, game)
+        random.seed(8)
+        for car, price in zip(cars, before):
+            if car.segment not in (compiled.get("segments") or (car.segment,)):
+                assert car.price == price
+            elif compiled["effect"] == "add":
+                assert car.price == max(0, price + compiled["sign"] * random.randint(compiled["low"], compiled["high"]))
+            else:
+                percent = compiled["low"] + (compiled["high"] - compiled["low"]) * random.random()
+                assert car.price == max(0, round(price * (1 + compiled["sign"] * percent / 100), 2))
+
+def test_segment_events_touch_only_their_segment():
+    game = make_game(cars=200, seed=2)
+    before = {id(car): car.price for car in catalog(game)}
+    ENGINE.apply(event("luxury tax hike"), game)
+    for car in catalog(game):
+        if car.segment == "Luxury":
+            assert before[id(car)] * 0.85 - 0.01 <= car.price <= before[id(car)] * 0.95 + 0.01
+        else:
+            assert car.price == before[id(car)]
+
+def test_unknown_effects_are_rejected():
+    with pytest.raises(ValueError):
+        EventEngine([{"event": "meteor", "description": "", "effect": "pow", "low": 1, "high": 2}])
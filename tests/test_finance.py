@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from dealership import DealershipGame, Ledger, TransactionLedger, headless
+
+def entry(year, kind, amount):
+    return {"type": kind, "amount": amount, "car": "Car", "year": year}
+
+def recounted(ledger):
+    fresh = Ledger(list(ledger))
+    return fresh.totals, fresh.by_type
+
+def test_ledger_totals_follow_every_list_change():
+    ledger = Ledger([entry(2024, "sale", 100), entry(2024, "purchase", 40), entry(2025, "sale", 7)])
+    ledger += [entry(2025, "sale", 3)]
+    ledger.insert(0, entry(2023, "sale", 1))
+    assert ledger.total(2024) == 140 and ledger.total(2025) == 10
+    ledger.pop()
+    ledger.remove(ledger[1])
+    ledger[0] = entry(2023, "maintenance", 5)
+    ledger[1:2] = [entry(2024, "sale", 1), entry(2024, "sale", 2)]
+    del ledger[-1]
+    ledger *= 2
+    assert ledger.total(2024) == 6 and ledger.category_total(2024, "sale") == 6 and ledger.total(2025) == 0
+    assert (ledger.totals, ledger.by_type) == recounted(ledger)
+    ledger.clear()
+    assert ledger.totals == {} and ledger.total(2024) == 0
+
+def test_loans_is_a_read_only_view_of_the_loan_book():
+    game = DealershipGame()
+    with headless():
+        game.take_loan(10_000, 5.0, 2)
+        game.take_loan(20_000, 4.0, 3)
+    loans = game.financial_manager.loans
+    assert len(loans) == 2 and [loan["amount"] for loan in loans] == [10_000, 20_000]
+    with pytest.raises(AttributeError):
+        loans.append({"amount": 1})
+    assert game.financial_manager.loan_book.count == 2
+
+def random_rows(count, seed=0):
+    rng = random.Random(seed)
+    return [(f"2024-01-{i % 28 + 1:02d}", rng.randint(2020, 2025), rng.choice(("income", "expense", "tax")),
+             float(rng.randint(1, 50_000)), f"Row {i}") for i in range(count)]
+
+def test_transaction_ledger_queries_by_period_and_type(tmp_path):
+    rows = random_rows(1000)
+    ledger = TransactionLedger(str(tmp_path / "ledger.db"), buffer_size=64)
+    ledger.record_many(rows[:500])
+    for row in rows[500:]:
+        ledger.record(*row)
+    assert ledger.buffer  # Some rows are still waiting; queries must flush them first
+    expected = {}
+    for _, period, kind, amount, _ in rows:
+        if 2021 <= period <= 2023:
+            expected.setdefault(period, {}).setdefault(kind, 0)
+            expected[period][kind] += amount
+    assert ledger.profit_loss(2021, 2023) == expected
+    assert ledger.total("tax", start=2024) == sum(row[3] for row in rows if row[2] == "tax" and row[1] >= 2024)
+    assert list(ledger.entries(end=2022, transaction_type="income", batch_size=7)) == \
+        [row for row in rows if row[1] <= 2022 and row[2] == "income"]
+    ledger.close()
+    reopened = TransactionLedger(str(tmp_path / "ledger.db"))
+    assert len(reopened) == 1000 and reopened.profit_loss(2021, 2023) == expected
+    reopened.close()
+
+def test_financial_manager_records_into_the_ledger(tmp_path):
+    manager = DealershipGame().financial_manager
+    ledger = manager.use_ledger(str(tmp_path / "ledger.db"))
+    with headless():
+        manager.record_transaction("income", 5_000, "Sale")
+        manager.record_transactions([("expense", 1_200, "Repair"), ("income", 300, "Fee")])
+    assert manager.profit_loss_statement == [] and manager.cash_flow == 4_100
+    assert ledger.profit_loss() == {manager.game.current_year: {"income": 5_300, "expense": 1_200}}
+    ledger.close()
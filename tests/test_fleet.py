@@ -0,0 +1,34 @@
+import pytest
+from dealership import RANDOM_EVENTS, SEGMENT_EVENTS, EventEngine, SportsCar, headless
+from helpers import catalog, make_game
+
+REGIONS = ["North", "South", "East"]
+
+def event_heavy_game(fleet, regions=None):
+    game = make_game(fleet, regions=regions)
+    game.event_engine = EventEngine(RANDOM_EVENTS + SEGMENT_EVENTS)
+    game.events_per_year = 3
+    return game
+
+def outcome(game, years):
+    results = game.run_years(years)
+    cars = [(car.name, car.region, float(car.price), car.age, car.sold) for car in catalog(game)]
+    owned = sorted((name, car.name) for competitor in game.ai_competitors for name, car in competitor.owned_cars.items())
+    return results, cars, owned, game.money, game.price_history.to_dict()
+
+@pytest.mark.parametrize("regions", [None, REGIONS])
+def test_fleet_matches_per_car_path(regions):
+    assert outcome(event_heavy_game(False, regions), 15) == outcome(event_heavy_game(True, regions), 15)
+
+def test_fleet_keeps_catalog_order_when_a_car_is_replaced():
+    results = []
+    for fleet in (False, True):
+        game = make_game(fleet, cars=30)
+        with headless():
+            game.add_own_car("Toyota Corolla", 30_000, 10, "Used", 3)  # Replaces the stock Corolla in place
+            first = next(iter(game.sports_cars))
+            game.register_car(game.sports_cars, SportsCar(first, 99_000, 5, "New", 0))
+        if fleet:
+            assert game.fleet.ordered_names() == [car.name for car in catalog(game)]
+        results.append(outcome(game, 10))
+    assert results[0] == results[1]
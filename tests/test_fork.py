@@ -0,0 +1,37 @@
+import random
+import pytest
+from dealership import headless
+from helpers import game_state, make_game
+
+def play_a_little(fleet):
+    game = make_game(fleet, cars=50, seed=4)
+    with headless():
+        game.purchase(game.economy_cars["Toyota Corolla"])
+        game.purchase(game.sports_cars["Porsche 911"])
+        game.take_loan(50_000, 5.0, 3)
+        game.run_years(3)
+    return game
+
+@pytest.mark.parametrize("fleet", [False, True])
+def test_fork_plays_out_like_the_parent(fleet):
+    game = play_a_little(fleet)
+    branch = game.fork()
+    assert game_state(branch) == game_state(game)
+    random_state = random.getstate()
+    expected = game.run_years(5)
+    random.setstate(random_state)
+    assert branch.run_years(5) == expected
+    assert game_state(branch) == game_state(game)
+
+@pytest.mark.parametrize("fleet", [False, True])
+def test_fork_is_independent(fleet):
+    game = play_a_little(fleet)
+    before = game_state(game)
+    branch = game.fork()
+    with headless():
+        branch.sell(next(iter(branch.owned)))
+        branch.upgrade(next(iter(branch.owned)), "luxury")
+        branch.take_loan(10_000, 5.0, 2)
+        branch.run_years(3)
+    assert game_state(game) == before
+    assert game_state(branch) != before
@@ -0,0 +1,41 @@
+import builtins
+import io
+import os
+import random
+import time
+
+from rich.console import Console
+
+from dealership import DealershipGame, console, headless
+from dealership.ui import CarDealershipSimulator
+from helpers import game_state
+
+def forbid(*args, **kwargs):
+    raise AssertionError("run_years touched the terminal")
+
+def test_run_years_is_headless(monkeypatch):
+    for module, name in ((time, "sleep"), (os, "system"), (builtins, "input"), (builtins, "print")):
+        monkeypatch.setattr(module, name, forbid)
+    target = Console(file=io.StringIO())
+    monkeypatch.setattr(console, "target", target)
+    random.seed(2)
+    results = DealershipGame().run_years(50)
+    assert [result["year"] for result in results] == list(range(2024, 2074))
+    assert all(set(result) >= {"event", "money", "net_profit", "taxes_due", "market_trends"} for result in results)
+    assert console.target is target and target.file.getvalue() == ""
+
+def test_simulate_shows_the_year_it_advances(monkeypatch):
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "")
+    monkeypatch.setattr(console, "target", Console(file=io.StringIO(), width=200))
+    monkeypatch.setattr("dealership.display.INSTANT_MODE", True)
+    random.seed(5)
+    game = CarDealershipSimulator()
+    game.simulate()
+    output = console.target.file.getvalue()
+    random.seed(5)
+    plain = DealershipGame()
+    with headless():
+        plain.advance_year()
+    assert game_state(game) == game_state(plain)
+    assert "Yearly Summary" in output and "Rolls Royce Phantom" in output
+    assert output.count("Net Profit for the year") == 1
@@ -0,0 +1,29 @@
+import random
+import pytest
+from dealership import DealershipGame, PriceHistory, headless
+from helpers import catalog
+
+@pytest.mark.parametrize("fleet", [False, True])
+def test_advance_year_with_duplicate_car_names(fleet):
+    random.seed(1)
+    game = DealershipGame()
+    with headless():
+        game.add_own_car("Toyota Corolla", 150_000, 10, "Used", 2)  # A Sports car named like the Economy one
+        game.add_own_car("Zed", 250_000, 5, "New", 0)
+        game.add_own_car("Zed", 50_000, 5, "Used", 4)
+        if fleet:
+            game.use_fleet()
+        game.run_years(2)
+    history = game.price_history
+    cars = catalog(game)
+    assert len(history.names) == len(cars) == 12
+    assert history.names.count("Zed") == 2 and history.names.count("Toyota Corolla") == 2
+    assert sorted(history.year_prices(game.current_year).tolist()) == sorted(car.price for car in cars)
+
+def test_column_indices_reordered_duplicates():
+    history = PriceHistory()
+    history.append_year(2024, ["A", "B", "A"], [1.0, 2.0, 3.0])
+    history.append_year(2025, ["B", "A", "A", "C"], [20.0, 10.0, 30.0, 40.0])
+    assert history.names == ["A", "B", "A", "C"]
+    assert history.year_prices(2025).tolist() == [10.0, 20.0, 30.0, 40.0]
+    assert history.prices("A").tolist() == [1.0, 10.0]
@@ -0,0 +1,26 @@
+import random
+import pytest
+from dealership import DealershipGame, headless
+from helpers import catalog
+
+@pytest.mark.parametrize("fleet", [False, True])
+def test_price_bands_follow_the_yearly_update(fleet):
+    random.seed(6)
+    game = DealershipGame()
+    with headless():
+        for i in range(40):
+            game.add_own_car(f"Car {i}", 5_000 * (i + 1), 10, "Used", 2)
+        if fleet:
+            game.use_fleet()
+        cars = catalog(game)
+        for car in cars:
+            game.inventory.add_car("Showroom", car)
+        game.purchase(game.luxury_cars["Car 39"])
+        game.upgrade("Car 39", "performance")
+        game.run_years(3)
+    inventory = game.inventory
+    for band in inventory.bands:
+        assert all(inventory._band(car.price) == band for car in inventory.by_price_band[band].values())
+    for low, high in [(0, 50_000), (40_000, 120_000), (100_000, 1_000_000)]:
+        expected = {id(car) for car in cars if low <= car.price <= high}
+        assert {id(car) for car in inventory.cars_in_price_range(low, high)} == expected
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from dealership import Market, headless
+from helpers import game_state, make_game
+
+def test_market_trends_write_back():
+    market = Market()
+    market.market_trends["Luxury"] *= 1.5
+    market.market_trends = {"Sports": 0.8}
+    assert market.market_trends["Luxury"] == pytest.approx(1.5)
+    assert market.trends[0].tolist() == pytest.approx([1.5, 0.8, 1.0])
+    with pytest.raises(KeyError):
+        market.market_trends["Hover"] = 2.0
+    with pytest.raises(TypeError):
+        del market.market_trends["Luxury"]
+
+def test_same_seed_gives_the_same_walk():
+    paths = [Market(regions=("North", "South"), seed=9).simulate(20) for _ in range(2)]
+    assert (paths[0] == paths[1]).all()
+    stepped = Market(regions=("North", "South"), seed=9)
+    for _ in range(3):
+        stepped.update_market()
+    assert stepped.trends == pytest.approx(paths[0][2])
+
+def test_steps_follow_the_covariance():
+    market = Market(regions=("North", "South", "West"), volatility=0.05, region_correlation=0.6,
+                    segment_correlation=0.2, seed=1)
+    steps = market.steps(50_000).reshape(50_000, -1)
+    assert np.cov(steps, rowvar=False) == pytest.approx(market.covariance(), abs=2e-4)
+
+def test_regions_move_cars_by_their_own_factor():
+    market = Market(regions=("North", "South"), seed=3)
+    market.simulate(5)
+    codes = np.array([0, 1, 2, -1])
+    for region in range(2):
+        factors = market.trend_factors(codes, np.full(4, region))
+        assert factors.tolist() == market.trends[region].tolist() + [1.0]
+
+def test_multi_region_games_replay_from_their_seed():
+    states = []
+    for _ in range(2):
+        game = make_game(cars=100, regions=["North", "South", "East"], seed=6)
+        with headless():
+            for _ in range(4):
+                game.advance_year()
+        states.append(game_state(game))
+    assert states[0] == states[1]
+    assert len(set(map(tuple, states[0]["market"]))) == 3
@@ -0,0 +1,20 @@
+from dealership import MONTE_CARLO_METRICS, Policy, run_monte_carlo
+from dealership.lazy import np
+
+def add_cash(game):
+    # A setup hook; module level so it pickles into the workers
+    game.money += 250_000
+
+def test_bands_vary_across_seeds():
+    report = run_monte_carlo(24, years=8, workers=1, batch_size=6)
+    money = report["bands"]["money"]
+    assert (money["p95"] > money["p5"]).all()
+    assert report["results"][:, :, MONTE_CARLO_METRICS.index("fleet_value")].std() > 0
+
+def test_same_results_for_one_or_many_workers():
+    options = dict(trajectories=20, years=6, seed=3, batch_size=3, setup=add_cash,
+                   policy=Policy(buy_segments=("Economy",), max_owned=5, loan=100_000))
+    one = run_monte_carlo(workers=1, **options)
+    many = run_monte_carlo(workers=3, **options)
+    assert np.array_equal(one["results"], many["results"])
+    assert (one["results"][:, 0, MONTE_CARLO_METRICS.index("money")] > 1_000_000).all()
@@ -0,0 +1,33 @@
+import random
+
+from dealership import POLICY_SPACE, Policy, evaluate_policies, optimize_policies, sample_policies
+
+def test_sample_policies_are_distinct_and_in_the_space():
+    policies = sample_policies(200, random.Random(3))
+    assert len({tuple(params.items()) for params in policies}) == 200
+    assert all(params[name] in values for params in policies for name, values in POLICY_SPACE.items())
+    assert policies == sample_policies(200, random.Random(3))
+    for params in policies[:10]:
+        Policy(**params)
+
+def test_evaluate_policies_is_deterministic():
+    candidates = sample_policies(3, random.Random(1))
+    scores = evaluate_policies(candidates, 5, 0, 2, 2)
+    assert scores.shape == (3, 2)
+    assert (scores == evaluate_policies(candidates, 5, 0, 2, 2)).all()
+    # Columns are games, so a later window starts at the same game
+    assert (scores[:, 1] == evaluate_policies(candidates, 5, 1, 2, 2)[:, 0]).all()
+
+def test_optimize_policies_reports_every_dropped_candidate():
+    rounds = []
+    best = optimize_policies(candidates=12, years=2, seed=2, min_games=2, max_games=6, eta=3, top=2,
+                             workers=1, batch_size=4, on_round=lambda *args: rounds.append(args))
+    assert len(best) == 2
+    assert best[0]["mean"] >= best[1]["mean"]
+    assert all(result["low"] <= result["mean"] <= result["high"] for result in best)
+    field = 12
+    for games, alive, dropped in rounds:
+        assert alive + dropped == field
+        assert 2 <= alive <= max(2, field // 3)
+        field = alive
+    assert rounds and best[0]["games"] == 6
@@ -0,0 +1,49 @@
+import json
+import random
+
+import pytest
+
+from dealership import DealershipGame, profiler
+from dealership.profiling import NULL_PHASE
+
+YEAR_PHASES = {"random_event", "update_market", "maintenance", "depreciation", "ai_turn", "calculate_profit"}
+
+@pytest.fixture
+def clean_profiler():
+    profiler.reset()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+    profiler.export_path, profiler.year = None, None
+
+def test_disabled_profiler_records_nothing(clean_profiler):
+    assert clean_profiler.phase("anything") is NULL_PHASE
+    random.seed(1)
+    DealershipGame().run_years(3)
+    assert clean_profiler.snapshot() == {"year": None, "phases": {}, "counts": {}}
+
+def test_every_year_phase_is_timed_and_exported_as_json(clean_profiler, tmp_path):
+    path = tmp_path / "profile.json"
+    clean_profiler.enable(str(path))
+    random.seed(1)
+    game = DealershipGame()
+    game.run_years(3)
+    exported = json.loads(path.read_text())
+    assert exported == json.loads(json.dumps(clean_profiler.snapshot()))
+    assert exported["year"] == game.current_year
+    assert set(exported["phases"]) >= YEAR_PHASES
+    assert all(exported["phases"][name]["calls"] == 3 for name in YEAR_PHASES - {"ai_turn"})
+    assert all(stats["seconds"] >= 0 for stats in exported["phases"].values())
+    assert exported["counts"]["console.print"] > 0 and exported["counts"]["format_price"] > 0
+
+def test_prometheus_export(clean_profiler, tmp_path):
+    path = tmp_path / "profile.prom"
+    clean_profiler.enable(str(path), "prometheus")
+    random.seed(1)
+    DealershipGame().run_years(2)
+    samples = dict(line.rsplit(" ", 1) for line in path.read_text().splitlines() if not line.startswith("#"))
+    assert samples['dealership_phase_calls_total{phase="update_market"}'] == "2"
+    assert float(samples['dealership_phase_seconds_total{phase="depreciation"}']) >= 0
+    assert samples["dealership_year"] == "2025"
+    with pytest.raises(ValueError):
+        clean_profiler.enable(str(path), "csv")
@@ -0,0 +1,47 @@
+import random
+from dealership import DealershipGame, Replay, headless, read_action_log, replay
+from helpers import game_state
+
+def record_session(path):
+    # Every kind of action, with years in between
+    game = DealershipGame()
+    with headless():
+        game.start_recording(path, seed=42)
+        game.purchase(game.economy_cars["Toyota Corolla"])
+        game.add_own_car("Zed", 120_000, 10, "Used", 3)
+        game.purchase(game.sports_cars["Zed"])
+        game.upgrade("Zed", "performance")
+        game.take_loan(100_000, 5.0, 3)
+        game.advance_year()
+        game.invest("stock", "ACME", 10_000)
+        game.train_employee(0, 1)
+        game.launch_campaign(0)
+        game.service_car(1, "Toyota Corolla")
+        game.auction("Toyota Corolla", ["pass", "30000"])
+        game.advance_year()
+        game.pay_taxes()
+        game.sell("Zed")
+        game.advance_year()
+        game.stop_recording()
+    return game
+
+def test_replay_reproduces_the_session(tmp_path):
+    path = tmp_path / "session.dlog"
+    game = record_session(path)
+    seed, actions = read_action_log(path)
+    assert seed == 42 and len(actions) == 15
+    random.seed(0)  # The caller's random state doesn't matter
+    assert game_state(replay(path)) == game_state(game)
+
+def test_replay_steps_and_rewinds(tmp_path):
+    path = tmp_path / "session.dlog"
+    game = record_session(path)
+    session = Replay(path)
+    session.run(6)
+    assert session.next_action() == ("invest", ("stock", "ACME", 10_000))
+    year = session.game.current_year
+    session.step(6)
+    assert session.game.current_year == year + 1
+    assert game_state(session.run()) == game_state(game)
+    session.run(3)  # Earlier than where it is, so it starts over
+    assert session.position == 3 and session.game.current_year == 2023
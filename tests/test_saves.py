@@ -0,0 +1,57 @@
+import random
+import pytest
+from dealership import DealershipGame, SaveJournal, headless
+from helpers import SAVED_STATE, game_state
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    journal = SaveJournal.open("car_dealership_save_1.db", compact_every=3)
+    yield journal
+    journal.close()
+
+def play(game, years, saved):
+    # Buys, sells and upgrades a little every year, saving after each one
+    for _ in range(years):
+        unsold = [car for car in game.economy_cars.values() if not car.sold]
+        if unsold:
+            game.purchase(unsold[0])
+        if len(game.owned) > 1:
+            game.sell(next(iter(game.owned)))
+        for name in game.owned:
+            game.upgrade(name, "efficiency")
+        game.advance_year()
+        game.save_to_slot(1)
+        saved[game.current_year] = game_state(game, SAVED_STATE)
+
+def test_journal_round_trip(journal):
+    random.seed(3)
+    game, saved = DealershipGame(), {}
+    with headless():
+        play(game, 8, saved)  # Checkpoints and deltas, with a checkpoint every 3 saves
+        loaded = DealershipGame()
+        assert loaded.load_from_slot(1)
+    assert game_state(loaded, SAVED_STATE) == game_state(game, SAVED_STATE)
+
+def test_load_by_year(journal):
+    random.seed(4)
+    game, saved = DealershipGame(), {}
+    with headless():
+        play(game, 6, saved)
+        assert [snapshot["year"] for snapshot in game.slot_snapshots(1)] == sorted(saved, reverse=True)
+        for year in saved:
+            loaded = DealershipGame()
+            assert loaded.load_from_slot(1, year)
+            assert game_state(loaded, SAVED_STATE) == saved[year]
+
+def test_save_after_loading_an_older_year(journal):
+    random.seed(5)
+    game, saved = DealershipGame(), {}
+    with headless():
+        play(game, 4, saved)
+        branch = DealershipGame()
+        branch.load_from_slot(1, 2025)
+        play(branch, 2, saved)
+        loaded = DealershipGame()
+        assert loaded.load_from_slot(1)
+    assert game_state(loaded, SAVED_STATE) == game_state(branch, SAVED_STATE)